@@ -1,14 +1,31 @@
 """Main FastAPI application."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, Request
 
 from app.api.routes import auth, candles, current, health, mobile, orderbook, signals, statistics, trading, webhooks
-from app.core.cache import get_redis_client, close_redis_client
-from app.core.http_client import get_http_client, close_http_client
+from app.api.routes.candles import close_exchanges
+from app.api.routes.current import stop_asset_broadcasters, warm_contracts_cache
+from app.api.routes.health import start_health_refresher, stop_health_refresher
+from app.core.cache import (
+    close_redis_client,
+    init_redis,
+    start_invalidation_listener,
+    start_memory_cache_sweeper,
+    start_redis_keepalive,
+    stop_invalidation_listener,
+    stop_memory_cache_sweeper,
+    stop_redis_keepalive,
+)
+from app.core.clock import start_clock, stop_clock
+from app.core.compute import start_compute_pool, stop_compute_pool
+from app.core.http_client import UpstreamUnavailableError, get_http_client, close_http_client
+from app.core.logging_config import start_logging, stop_logging
+from app.core.middleware import ErrorResponseMiddleware, FastCORSMiddleware, SelectiveGZipMiddleware
+from app.core.responses import ORJSONResponse
 from app.core.config import settings
 from app.data.kalshi_ws import get_ws_manager
 from app.db.database import init_db
@@ -18,16 +35,34 @@ from app.db.database import init_db
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan events."""
     # Startup
+    start_logging()
+    start_clock()
+    start_compute_pool()
     await init_db()
-    await get_redis_client()
+    start_memory_cache_sweeper()
+    if await init_redis() is not None:
+        start_redis_keepalive()
+        start_invalidation_listener()
     await get_http_client()
     ws_manager = get_ws_manager()
     await ws_manager.start()
+    start_health_refresher()
+    warmup = asyncio.create_task(warm_contracts_cache())
     yield
     # Shutdown
+    warmup.cancel()
+    await stop_health_refresher()
+    await stop_asset_broadcasters()
     await ws_manager.stop()
+    await close_exchanges()
     await close_http_client()
+    await stop_invalidation_listener()
+    await stop_redis_keepalive()
     await close_redis_client()
+    await stop_memory_cache_sweeper()
+    await stop_clock()
+    stop_compute_pool()
+    stop_logging()
 
 
 app = FastAPI(
@@ -37,13 +72,29 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Configure CORS
+# Routes let unexpected errors propagate instead of re-wrapping them in a
+# try/except per handler; the bodies keep the {"detail": ...} shape of HTTPException
+@app.exception_handler(UpstreamUnavailableError)
+async def upstream_unavailable_handler(request: Request, exc: UpstreamUnavailableError) -> ORJSONResponse:
+    return ORJSONResponse({"detail": str(exc)}, status_code=503)
+
+
+# Anything else becomes a 500 with the same body shape. This is middleware,
+# not an Exception handler, so it runs inside CORS and the 500 keeps its headers
+app.add_middleware(ErrorResponseMiddleware)
+
+# Configure CORS (pure ASGI, headers precomputed once at startup)
+# X-Next-Cursor carries the trade history page cursor
+app.add_middleware(
+    FastCORSMiddleware, origins=settings.cors_origins, expose_headers=("X-Next-Cursor",)
+)
+
+# Compress JSON payloads (candles are highly compressible); never buffer SSE streams
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    SelectiveGZipMiddleware,
+    minimum_size=1024,
+    compresslevel=5,
+    exclude_prefixes=(f"{settings.api_v1_prefix}/stream/",),
 )
 
 # Include routers
@@ -1,12 +1,16 @@
 """Candles API routes - Multi-exchange proxy with fallback."""
 
 import asyncio
-import httpx
-import ccxt
-from fastapi import APIRouter, HTTPException, Query
+import logging
+import ccxt.async_support as ccxt_async
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
 from typing import List, Any
 
 from app.core.cache import cached
+from app.core.http_client import UpstreamUnavailableError, get_http_client
+from app.core.responses import ORJSONResponse
 from app.services.candle_cache import (
     store_last_known,
     get_last_known_payload,
@@ -14,6 +18,7 @@ from app.services.candle_cache import (
 )
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Timeout (seconds) for each exchange request
 EXCHANGE_REQUEST_TIMEOUT = 8.0
@@ -28,6 +33,64 @@ INTERVAL_MAP = {
     "1d": {"ccxt": "1d", "minutes": 1440},
 }
 
+VALID_INTERVALS = frozenset(INTERVAL_MAP)
+INTERVAL_TO_CCXT = {name: config["ccxt"] for name, config in INTERVAL_MAP.items()}
+INVALID_INTERVAL_DETAIL = f"Invalid interval. Must be one of: {', '.join(INTERVAL_MAP)}"
+
+# Exchanges to try per asset as (ccxt exchange id, market symbol)
+ASSET_EXCHANGES: dict[str, tuple[tuple[str, str], ...]] = {
+    "BTC": (
+        ("kraken", "BTC/USD"),
+        ("coinbase", "BTC/USD"),
+        ("bitfinex", "BTC/USD"),
+        ("bybit", "BTC/USDT"),
+    ),
+    "ETH": (
+        ("kraken", "ETH/USD"),
+        ("coinbase", "ETH/USD"),
+        ("bitfinex", "ETH/USD"),
+        ("bybit", "ETH/USDT"),
+    ),
+    "XRP": (
+        ("kraken", "XRP/USD"),
+        ("bitfinex", "XRP/USD"),
+        ("bybit", "XRP/USDT"),
+    ),
+    "SOL": (
+        ("kraken", "SOL/USD"),
+        ("coinbase", "SOL/USD"),
+        ("bitfinex", "SOL/USD"),
+        ("bybit", "SOL/USDT"),
+    ),
+    "DOGE": (
+        ("kraken", "DOGE/USD"),
+        ("coinbase", "DOGE/USD"),
+        ("bybit", "DOGE/USDT"),
+    ),
+    "HYPE": (
+        ("bybit", "HYPE/USDT"),
+    ),
+    "BNB": (
+        ("bybit", "BNB/USDT"),
+        ("bitfinex", "BNB/USD"),
+    ),
+}
+
+# URL pair slug -> asset symbol
+ASSET_PAIRS = {
+    "btcusd": "BTC",
+    "ethusd": "ETH",
+    "xrpusd": "XRP",
+    "solusd": "SOL",
+    "dogeusd": "DOGE",
+    "hypeusd": "HYPE",
+    "bnbusd": "BNB",
+}
+
+# One CCXT exchange instance per exchange id (constructing one parses large
+# market/url tables and resets rate-limit state, so reuse across requests)
+_EXCHANGE_CACHE: dict[str, ccxt_async.Exchange] = {}
+
 
 async def fetch_from_coingecko(limit: int = 500) -> List[Any]:
     """
@@ -43,128 +106,114 @@ async def fetch_from_coingecko(limit: int = 500) -> List[Any]:
             "days": min(limit // 24, 90),  # Max 90 days
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, timeout=15.0)
-            response.raise_for_status()
-            data = response.json()
+        client = await get_http_client()
+        response = await client.get(url, params=params, timeout=15.0)
+        response.raise_for_status()
+        data = response.json()
 
-            # CoinGecko format: [[timestamp_ms, open, high, low, close], ...]
-            # Add volume as 0 since it's not provided
-            candles = [
-                [candle[0], candle[1], candle[2], candle[3], candle[4], 0.0]
-                for candle in data
-            ]
+        # CoinGecko format: [[timestamp_ms, open, high, low, close], ...]
+        # Add volume as 0 since it's not provided
+        candles = [
+            [candle[0], candle[1], candle[2], candle[3], candle[4], 0.0]
+            for candle in data
+        ]
 
-            return candles[-limit:] if len(candles) > limit else candles
+        return candles[-limit:] if len(candles) > limit else candles
 
     except Exception as e:
-        raise Exception(f"CoinGecko error: {str(e)}")
+        raise Exception(f"CoinGecko error: {str(e)}") from e
 
 
-def _sync_fetch_ohlcv(exchange_id: str, symbol: str, interval: str, limit: int) -> List[Any]:
-    """
-    Synchronous CCXT fetch - runs in thread pool to avoid blocking event loop.
-    """
-    exchange_class = getattr(ccxt, exchange_id)
-    exchange = exchange_class({"enableRateLimit": True})
-    return exchange.fetch_ohlcv(symbol, interval, limit=limit)
+def get_async_exchange(exchange_id: str) -> ccxt_async.Exchange:
+    """Get or create the shared async CCXT exchange instance for an exchange id."""
+    exchange = _EXCHANGE_CACHE.get(exchange_id)
+    if exchange is None:
+        exchange = getattr(ccxt_async, exchange_id)({"enableRateLimit": True})
+        _EXCHANGE_CACHE[exchange_id] = exchange
+    return exchange
+
+
+async def close_exchanges() -> None:
+    """Close all cached CCXT exchange sessions on shutdown."""
+    exchanges = list(_EXCHANGE_CACHE.values())
+    _EXCHANGE_CACHE.clear()
+    for exchange in exchanges:
+        try:
+            await exchange.close()
+        except Exception:
+            pass
+
+
+async def _fetch_ohlcv_async(exchange_id: str, symbol: str, interval: str, limit: int) -> list[Any]:
+    """Fetch OHLCV from a single exchange directly on the event loop."""
+    exchange = get_async_exchange(exchange_id)
+    return await asyncio.wait_for(
+        exchange.fetch_ohlcv(symbol, interval, limit=limit),
+        timeout=EXCHANGE_REQUEST_TIMEOUT,
+    )
 
 
 async def fetch_from_ccxt(asset: str, interval: str, limit: int) -> List[Any]:
     """
     Fetch using CCXT library with multiple exchange fallback.
-    Tries exchanges in order until one succeeds.
-    Uses asyncio.to_thread() to avoid blocking the event loop.
+    Queries all exchanges for the asset concurrently and returns the first
+    successful response, cancelling the rest.
 
     Args:
         asset: Asset to fetch (BTC, ETH, XRP)
         interval: Candle interval
         limit: Number of candles
     """
-    # Exchange configs per asset
-    ASSET_EXCHANGES = {
-        "BTC": [
-            {"id": "kraken", "symbol": "BTC/USD"},
-            {"id": "coinbase", "symbol": "BTC/USD"},
-            {"id": "bitfinex", "symbol": "BTC/USD"},
-            {"id": "bybit", "symbol": "BTC/USDT"},
-        ],
-        "ETH": [
-            {"id": "kraken", "symbol": "ETH/USD"},
-            {"id": "coinbase", "symbol": "ETH/USD"},
-            {"id": "bitfinex", "symbol": "ETH/USD"},
-            {"id": "bybit", "symbol": "ETH/USDT"},
-        ],
-        "XRP": [
-            {"id": "kraken", "symbol": "XRP/USD"},
-            {"id": "bitfinex", "symbol": "XRP/USD"},
-            {"id": "bybit", "symbol": "XRP/USDT"},
-        ],
-        "SOL": [
-            {"id": "kraken", "symbol": "SOL/USD"},
-            {"id": "coinbase", "symbol": "SOL/USD"},
-            {"id": "bitfinex", "symbol": "SOL/USD"},
-            {"id": "bybit", "symbol": "SOL/USDT"},
-        ],
-        "DOGE": [
-            {"id": "kraken", "symbol": "DOGE/USD"},
-            {"id": "coinbase", "symbol": "DOGE/USD"},
-            {"id": "bybit", "symbol": "DOGE/USDT"},
-        ],
-        "HYPE": [
-            {"id": "bybit", "symbol": "HYPE/USDT"},
-        ],
-        "BNB": [
-            {"id": "bybit", "symbol": "BNB/USDT"},
-            {"id": "bitfinex", "symbol": "BNB/USD"},
-        ],
-    }
-
     exchanges_to_try = ASSET_EXCHANGES.get(asset.upper(), ASSET_EXCHANGES["BTC"])
-    ccxt_interval = INTERVAL_MAP.get(interval, {}).get("ccxt", "1m")
+    ccxt_interval = INTERVAL_TO_CCXT.get(interval, "1m")
     errors = []
 
-    for exchange_config in exchanges_to_try:
-        try:
-            # Run synchronous CCXT call in thread pool to avoid blocking
-            ohlcv = await asyncio.wait_for(
-                asyncio.to_thread(
-                    _sync_fetch_ohlcv,
-                    exchange_config["id"],
-                    exchange_config["symbol"],
-                    ccxt_interval,
-                    limit,
-                ),
-                timeout=EXCHANGE_REQUEST_TIMEOUT,
-            )
-
-            # CCXT format: [[timestamp, open, high, low, close, volume], ...]
-            print(f"[Candles] Fetched {asset} from {exchange_config['id']}")
-            return ohlcv
-
-        except asyncio.TimeoutError:
-            errors.append(f"{exchange_config['id']}: timed out after {EXCHANGE_REQUEST_TIMEOUT}s")
-            continue
-        except Exception as e:
-            errors.append(f"{exchange_config['id']}: {str(e)}")
-            continue
+    # Query all candidate exchanges concurrently; first successful response wins
+    tasks = {
+        asyncio.create_task(
+            _fetch_ohlcv_async(exchange_id, symbol, ccxt_interval, limit)
+        ): exchange_id
+        for exchange_id, symbol in exchanges_to_try
+    }
+    pending = set(tasks)
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                exchange_id = tasks[task]
+                try:
+                    ohlcv = task.result()
+                except asyncio.TimeoutError:
+                    errors.append(f"{exchange_id}: timed out after {EXCHANGE_REQUEST_TIMEOUT}s")
+                    continue
+                except Exception as e:
+                    errors.append(f"{exchange_id}: {str(e)}")
+                    continue
+
+                # CCXT format: [[timestamp, open, high, low, close, volume], ...]
+                logger.debug("Fetched %s candles from %s", asset, exchange_id)
+                return ohlcv
+    finally:
+        for task in pending:
+            task.cancel()
 
     # If all exchanges failed, raise error
     raise Exception(f"All exchanges failed for {asset}. Errors: {'; '.join(errors)}")
 
 
-@cached(ttl=30, key_prefix="candles")
+@cached(ttl=30, key_prefix="candles", single_flight=True, jitter=5)
 async def _get_candles_cached(asset: str, interval: str, limit: int) -> List[Any]:
     """
     Cached candle fetching with multi-exchange fallback.
-    TTL is 30 seconds to balance freshness with rate limiting.
+    TTL is 30-35 seconds (jittered) to balance freshness with rate limiting.
     """
     # Try CCXT exchanges first (supports intraday data)
     try:
         candles = await fetch_from_ccxt(asset, interval, limit)
         return candles
     except Exception as ccxt_error:
-        print(f"[Candles API] CCXT failed for {asset}: {ccxt_error}")
+        logger.warning("CCXT failed for %s: %s", asset, ccxt_error)
 
         # Fallback to CoinGecko (only for BTC daily data)
         if interval == "1d" and asset == "BTC":
@@ -172,7 +221,7 @@ async def _get_candles_cached(asset: str, interval: str, limit: int) -> List[Any
                 candles = await fetch_from_coingecko(limit)
                 return candles
             except Exception as cg_error:
-                print(f"[Candles API] CoinGecko failed: {cg_error}")
+                logger.warning("CoinGecko failed: %s", cg_error)
 
         # If everything failed, raise the original CCXT error
         raise ccxt_error
@@ -180,14 +229,11 @@ async def _get_candles_cached(asset: str, interval: str, limit: int) -> List[Any
 
 async def _get_candles(asset: str, interval: str, limit: int) -> List[Any]:
     """Common candle fetching logic for all assets."""
-    try:
-        # Validate interval
-        if interval not in INTERVAL_MAP:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid interval. Must be one of: {', '.join(INTERVAL_MAP.keys())}"
-            )
+    # Validate before the try so client errors skip the stale-data fallback
+    if interval not in VALID_INTERVALS:
+        raise HTTPException(status_code=400, detail=INVALID_INTERVAL_DETAIL)
 
+    try:
         candles = await _get_candles_cached(asset, interval, limit)
         await store_last_known(asset, interval, limit, candles)
         return candles
@@ -198,103 +244,60 @@ async def _get_candles(asset: str, interval: str, limit: int) -> List[Any]:
             payload = await get_last_known_payload(asset, interval, limit)
             if payload and payload.get("candles"):
                 await record_stale_event(asset, interval, limit, f"HTTP {exc.status_code}: {exc.detail}")
-                print(f"[Candles API] Serving stale {asset} data after upstream error (HTTP {exc.status_code})")
+                logger.warning(
+                    "Serving stale %s data after upstream error (HTTP %s)", asset, exc.status_code
+                )
                 return payload["candles"]
         raise
     except Exception as e:
         payload = await get_last_known_payload(asset, interval, limit)
         if payload and payload.get("candles"):
             await record_stale_event(asset, interval, limit, str(e))
-            print(f"[Candles API] Serving stale {asset} data after unexpected error: {e}")
+            logger.warning("Serving stale %s data after unexpected error: %s", asset, e)
             return payload["candles"]
-        raise HTTPException(
-            status_code=503,
-            detail=f"Failed to fetch {asset} candles from any exchange: {str(e)}"
-        )
+        raise UpstreamUnavailableError(
+            f"Failed to fetch {asset} candles from any exchange: {str(e)}"
+        ) from e
 
 
-@router.get("/candles/btcusd")
-async def get_btc_candles(
-    interval: str = Query(default="1m", description="Candle interval (1m, 5m, 15m, 1h, 4h, 1d)"),
-    limit: int = Query(default=500, ge=1, le=1500, description="Number of candles to return"),
-) -> List[Any]:
-    """
-    Fetch BTC/USD candlestick data with multi-exchange fallback.
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
-    Tries multiple data sources in order:
-    1. CCXT exchanges (Kraken, Coinbase, Bitfinex, Bybit)
-    2. CoinGecko (fallback for daily data)
-
-    Returns:
-        List of candles in format: [timestamp, open, high, low, close, volume]
-    """
-    return await _get_candles("BTC", interval, limit)
-
-
-@router.get("/candles/ethusd")
-async def get_eth_candles(
-    interval: str = Query(default="1m", description="Candle interval (1m, 5m, 15m, 1h, 4h, 1d)"),
-    limit: int = Query(default=500, ge=1, le=1500, description="Number of candles to return"),
-) -> List[Any]:
-    """
-    Fetch ETH/USD candlestick data with multi-exchange fallback.
 
-    Returns:
-        List of candles in format: [timestamp, open, high, low, close, volume]
-    """
-    return await _get_candles("ETH", interval, limit)
+def _ndjson_body(candles: list[Any]) -> bytes:
+    """Serialize candles one per line into a single body."""
+    if not candles:
+        return b""
+    return b"\n".join(map(orjson.dumps, candles)) + b"\n"
 
 
-@router.get("/candles/xrpusd")
-async def get_xrp_candles(
+@router.get("/candles/{pair}", response_class=ORJSONResponse, response_model=None)
+async def get_candles(
+    request: Request,
+    pair: str,
     interval: str = Query(default="1m", description="Candle interval (1m, 5m, 15m, 1h, 4h, 1d)"),
     limit: int = Query(default=500, ge=1, le=1500, description="Number of candles to return"),
-) -> List[Any]:
+) -> Response:
     """
-    Fetch XRP/USD candlestick data with multi-exchange fallback.
+    Fetch candlestick data for a USD pair with multi-exchange fallback.
 
-    Returns:
-        List of candles in format: [timestamp, open, high, low, close, volume]
-    """
-    return await _get_candles("XRP", interval, limit)
+    Supported pairs: btcusd, ethusd, xrpusd, solusd, dogeusd, hypeusd, bnbusd.
 
+    Tries multiple data sources in order:
+    1. CCXT exchanges (Kraken, Coinbase, Bitfinex, Bybit)
+    2. CoinGecko (fallback for BTC daily data)
 
-@router.get("/candles/solusd")
-async def get_sol_candles(
-    interval: str = Query(default="1m", description="Candle interval (1m, 5m, 15m, 1h, 4h, 1d)"),
-    limit: int = Query(default=500, ge=1, le=1500, description="Number of candles to return"),
-) -> List[Any]:
-    """
-    Fetch SOL/USD candlestick data with multi-exchange fallback.
+    Clients sending `Accept: application/x-ndjson` receive one candle per line
+    instead of a single JSON array.
 
     Returns:
         List of candles in format: [timestamp, open, high, low, close, volume]
     """
-    return await _get_candles("SOL", interval, limit)
-
-
-@router.get("/candles/dogeusd")
-async def get_doge_candles(
-    interval: str = Query(default="1m", description="Candle interval"),
-    limit: int = Query(default=500, ge=1, le=1500, description="Number of candles"),
-) -> List[Any]:
-    """Fetch DOGE/USD candlestick data."""
-    return await _get_candles("DOGE", interval, limit)
-
-
-@router.get("/candles/hypeusd")
-async def get_hype_candles(
-    interval: str = Query(default="1m", description="Candle interval"),
-    limit: int = Query(default=500, ge=1, le=1500, description="Number of candles"),
-) -> List[Any]:
-    """Fetch HYPE/USD candlestick data."""
-    return await _get_candles("HYPE", interval, limit)
-
-
-@router.get("/candles/bnbusd")
-async def get_bnb_candles(
-    interval: str = Query(default="1m", description="Candle interval"),
-    limit: int = Query(default=500, ge=1, le=1500, description="Number of candles"),
-) -> List[Any]:
-    """Fetch BNB/USD candlestick data."""
-    return await _get_candles("BNB", interval, limit)
+    asset = ASSET_PAIRS.get(pair.lower())
+    if asset is None:
+        raise HTTPException(status_code=404, detail=f"Unknown pair: {pair}")
+
+    candles = await _get_candles(asset, interval, limit)
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        # The candles are already in memory, so one send beats a chunk per row
+        return Response(_ndjson_body(candles), media_type=NDJSON_MEDIA_TYPE)
+    return ORJSONResponse(candles)
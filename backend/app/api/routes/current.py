@@ -1,16 +1,23 @@
 """Multi-asset signals endpoint - returns hourly contract data for BTC, ETH, and XRP."""
 
 import asyncio
-import json
-import traceback
-from datetime import UTC, datetime
-from typing import AsyncGenerator
+import hashlib
+import logging
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from functools import partial
+
+import httpx
+import orjson
 
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
-from sse_starlette.sse import EventSourceResponse
 
 from app.api.routes.signals import SignalResponse
+from app.core.clock import utc_now_iso
+from app.core.http_client import UpstreamUnavailableError
+from app.core.responses import ORJSON_OPTIONS, ORJSONResponse
+from app.core.sse import SSEResponse, encode_event
 from app.data.bitcoin_client import BitcoinPriceClient
 from app.data.ethereum_client import EthereumPriceClient
 from app.data.generic_price_client import GenericPriceClient
@@ -18,9 +25,68 @@ from app.data.ripple_client import RipplePriceClient
 from app.data.solana_client import SolanaPriceClient
 from app.data.kalshi_ws import get_ws_manager
 from app.data.ws_data_bus import get_data_bus
-from app.services.market_service import MarketService
+from app.services.market_service import MarketService, get_market_service
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+SUPPORTED_ASSETS = ("BTC", "ETH", "XRP", "SOL", "DOGE", "HYPE", "BNB")
+
+# Short-lived per-asset spot price memo shared by polling endpoints and SSE streams,
+# so N concurrent pollers collapse into one upstream fetch per asset
+PRICE_TTL = 1.5  # seconds
+_price_cache: dict[str, tuple[float, float]] = {}  # asset -> (monotonic timestamp, price)
+_price_locks: dict[str, asyncio.Lock] = {}
+
+# One price client per asset; all share the pooled HTTP client underneath
+_price_clients: dict[str, object] = {}
+_PRICE_CLIENT_FACTORIES: dict[str, Callable[[], object]] = {
+    "BTC": BitcoinPriceClient,
+    "ETH": EthereumPriceClient,
+    "XRP": RipplePriceClient,
+    "SOL": SolanaPriceClient,
+    "DOGE": partial(GenericPriceClient, "DOGE"),
+    "HYPE": partial(GenericPriceClient, "HYPE"),
+    "BNB": partial(GenericPriceClient, "BNB"),
+}
+
+# Assets with dedicated hourly contract methods; the rest use the generic one
+_HOURLY_CONTRACT_METHODS: dict[str, Callable[[MarketService], Awaitable[dict]]] = {
+    "BTC": MarketService.get_bitcoin_hourly_contracts,
+    "ETH": MarketService.get_ethereum_hourly_contracts,
+    "XRP": MarketService.get_ripple_hourly_contracts,
+    "SOL": MarketService.get_solana_hourly_contracts,
+}
+
+# /stream/{asset} fan-out: one set of producers per (asset, timeframe) feeds every subscriber
+STREAM_PRICE_INTERVAL = 3.0  # seconds
+STREAM_QUEUE_SIZE = 64  # events buffered per subscriber before dropping the oldest
+_broadcasters: dict[tuple[str, str], "AssetBroadcaster"] = {}
+
+
+def _sse_data(payload: dict) -> bytes:
+    """Encode an SSE event payload with orjson (volatility payloads may hold numpy floats)."""
+    return orjson.dumps(payload, option=ORJSON_OPTIONS)
+
+
+# SignalResponse field names and defaults, resolved once at import
+_SIGNAL_FIELDS = tuple(
+    (name, None if field.is_required() else field.default)
+    for name, field in SignalResponse.model_fields.items()
+)
+
+
+def _signal_dicts(contracts: list[dict]) -> list[dict]:
+    """
+    Shape trusted MarketService contracts like SignalResponse.model_dump().
+
+    Skips per-contract Pydantic validation; missing optional fields get their
+    declared defaults and keys outside the schema are dropped.
+    """
+    return [
+        {name: contract.get(name, default) for name, default in _SIGNAL_FIELDS}
+        for contract in contracts
+    ]
 
 
 class AssetPriceResponse(BaseModel):
@@ -32,21 +98,47 @@ class AssetPriceResponse(BaseModel):
 
 
 def get_price_client(asset: str):
-    """Get the appropriate price client for the asset."""
+    """Get the shared price client for the asset (created on first use)."""
     asset_upper = asset.upper()
-    if asset_upper == "BTC":
-        return BitcoinPriceClient()
-    elif asset_upper == "ETH":
-        return EthereumPriceClient()
-    elif asset_upper == "XRP":
-        return RipplePriceClient()
-    elif asset_upper == "SOL":
-        return SolanaPriceClient()
-    elif asset_upper in ("DOGE", "HYPE", "BNB"):
-        return GenericPriceClient(asset_upper)
-    else:
+    client = _price_clients.get(asset_upper)
+    if client is not None:
+        return client
+
+    factory = _PRICE_CLIENT_FACTORIES.get(asset_upper)
+    if factory is None:
         raise HTTPException(status_code=400, detail=f"Unsupported asset: {asset}")
 
+    client = _price_clients[asset_upper] = factory()
+    return client
+
+
+async def get_cached_price(asset: str) -> float:
+    """
+    Get spot price for an asset, reusing a result younger than PRICE_TTL.
+
+    Misses are serialized on a per-asset lock and re-checked after acquiring
+    it, so a burst of polls results in a single upstream fetch.
+    """
+    asset_upper = asset.upper()
+    cached = _price_cache.get(asset_upper)
+    if cached is not None and time.monotonic() - cached[0] < PRICE_TTL:
+        return cached[1]
+
+    # Rejects unsupported assets (400) before a lock is created for them
+    client = get_price_client(asset_upper)
+    lock = _price_locks.setdefault(asset_upper, asyncio.Lock())
+    async with lock:
+        cached = _price_cache.get(asset_upper)
+        if cached is not None and time.monotonic() - cached[0] < PRICE_TTL:
+            return cached[1]
+        try:
+            price = await client.get_spot_price()
+        except (httpx.HTTPError, KeyError, ValueError) as e:
+            # Unreachable upstream or a response without a usable price
+            raise UpstreamUnavailableError(f"Unable to fetch {asset_upper} price: {e}") from e
+        _price_cache[asset_upper] = (time.monotonic(), price)
+        return price
+
 
 def get_default_price(asset: str) -> float:
     """Get fallback price for asset."""
@@ -63,8 +155,42 @@ def get_default_price(asset: str) -> float:
         return 0.0
 
 
+async def _fetch_asset_contracts(asset_upper: str) -> ORJSONResponse:
+    """Fetch hourly contracts for an already-validated, upper-cased asset."""
+    logger.debug("Fetching %s contracts", asset_upper)
+    result = await get_cached_contracts(asset_upper, "hourly")
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Fetched %d %s contracts", len(result.get("contracts", [])), asset_upper)
+
+    # Trusted MarketService output: project onto the SignalResponse schema and
+    # encode once with orjson instead of validating and re-dumping each model
+    return ORJSONResponse({
+        "asset": asset_upper,
+        "contracts": _signal_dicts(result.get("contracts", [])),
+        "volatility": result.get("volatility", {})
+    })
+
+
+async def _fetch_asset_price(asset_upper: str) -> AssetPriceResponse:
+    """Build a price response for an already-validated, upper-cased asset."""
+    price = await get_cached_price(asset_upper)
+    return AssetPriceResponse(asset=asset_upper, price=price, timestamp=utc_now_iso())
+
+
+def _validate_asset(asset: str) -> str:
+    """Upper-case an asset path parameter, rejecting unsupported symbols."""
+    asset_upper = asset.upper()
+    if asset_upper not in SUPPORTED_ASSETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported asset: {asset}. Supported: {', '.join(SUPPORTED_ASSETS)}",
+        )
+    return asset_upper
+
+
 @router.get("/contracts/{asset}")
-async def get_asset_contracts(asset: str) -> dict:
+async def get_asset_contracts(asset: str) -> ORJSONResponse:
     """
     Get hourly contract signals for specified asset (BTC, ETH, XRP, or SOL).
 
@@ -74,50 +200,11 @@ async def get_asset_contracts(asset: str) -> dict:
     Args:
         asset: Asset symbol (btc, eth, xrp, or sol) - case insensitive
     """
-    asset_upper = asset.upper()
-
-    supported = ["BTC", "ETH", "XRP", "SOL", "DOGE", "HYPE", "BNB"]
-    if asset_upper not in supported:
-        raise HTTPException(status_code=400, detail=f"Unsupported asset: {asset}. Supported: {', '.join(supported)}")
-
-    try:
-        print(f"🔍 Creating MarketService for {asset_upper}...")
-        market_service = MarketService()
-        print("✓ MarketService created successfully")
-
-        # Fetch and process contracts based on asset
-        print(f"🔍 Fetching {asset_upper} contracts...")
-        if asset_upper == "BTC":
-            result = await market_service.get_bitcoin_hourly_contracts()
-        elif asset_upper == "ETH":
-            result = await market_service.get_ethereum_hourly_contracts()
-        elif asset_upper == "XRP":
-            result = await market_service.get_ripple_hourly_contracts()
-        elif asset_upper == "SOL":
-            result = await market_service.get_solana_hourly_contracts()
-        else:
-            result = await market_service.get_generic_hourly_contracts(asset_upper)
-
-        print(f"✓ Fetched {len(result.get('contracts', []))} {asset_upper} contracts")
-
-        # Convert contracts to SignalResponse format
-        signals = [
-            SignalResponse(**contract) for contract in result.get("contracts", [])
-        ]
-
-        return {
-            "asset": asset_upper,
-            "contracts": signals,
-            "volatility": result.get("volatility", {})
-        }
-    except Exception as e:
-        print(f"✗ ERROR in get_asset_contracts for {asset_upper}: {type(e).__name__}: {e}")
-        print(f"Traceback:\n{traceback.format_exc()}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _fetch_asset_contracts(_validate_asset(asset))
 
 
 @router.get("/current")
-async def get_current_signals() -> dict:
+async def get_current_signals() -> ORJSONResponse:
     """
     Get current Bitcoin hourly contract signals (backward compatibility).
 
@@ -126,8 +213,7 @@ async def get_current_signals() -> dict:
     Fetches real data from Kalshi API (demo or production based on config).
     Includes volatility regime analysis.
     """
-    # Redirect to BTC endpoint for backward compatibility
-    return await get_asset_contracts("btc")
+    return await _fetch_asset_contracts("BTC")
 
 
 @router.get("/price/{asset}", response_model=AssetPriceResponse)
@@ -141,21 +227,7 @@ async def get_asset_price(asset: str) -> AssetPriceResponse:
     Args:
         asset: Asset symbol (btc, eth, xrp, or sol) - case insensitive
     """
-    asset_upper = asset.upper()
-
-    supported = ["BTC", "ETH", "XRP", "SOL", "DOGE", "HYPE", "BNB"]
-    if asset_upper not in supported:
-        raise HTTPException(status_code=400, detail=f"Unsupported asset: {asset}. Supported: {', '.join(supported)}")
-
-    try:
-        price_client = get_price_client(asset_upper)
-        price = await price_client.get_spot_price()
-        timestamp = datetime.now(UTC).isoformat()
-
-        return AssetPriceResponse(asset=asset_upper, price=price, timestamp=timestamp)
-    except Exception as e:
-        print(f"✗ ERROR in get_asset_price for {asset_upper}: {type(e).__name__}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _fetch_asset_price(_validate_asset(asset))
 
 
 @router.get("/btc-price", response_model=AssetPriceResponse)
@@ -168,182 +240,275 @@ async def get_btc_price() -> AssetPriceResponse:
     This endpoint is optimized for frequent polling (every 3-5 seconds)
     to update prices in real-time without hitting Kalshi rate limits.
     """
-    # Redirect to BTC price endpoint for backward compatibility
-    return await get_asset_price("btc")
+    return await _fetch_asset_price("BTC")
+
+
+def _offer(queue: asyncio.Queue, event: bytes) -> None:
+    """Put an event on a subscriber queue, dropping its oldest event if full."""
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        # Drop oldest event for slow consumers (backpressure)
+        try:
+            queue.get_nowait()
+            queue.put_nowait(event)
+        except asyncio.QueueEmpty:
+            pass
+
+
+def _contracts_fetcher(asset_upper: str, timeframe: str) -> Callable[[], Awaitable[dict]]:
+    """Get the contract fetching method for an asset and timeframe."""
+    if asset_upper not in SUPPORTED_ASSETS:
+        raise ValueError(f"Unsupported asset: {asset_upper}")
+
+    market_service = get_market_service()
+    # Dedicated hourly methods for the original assets; 15m and newer assets
+    # go through the generic method
+    method = _HOURLY_CONTRACT_METHODS.get(asset_upper) if timeframe == "hourly" else None
+    if method is not None:
+        return partial(method, market_service)
+    return partial(market_service.get_generic_hourly_contracts, asset_upper, timeframe=timeframe)
+
+
+async def get_cached_contracts(asset_upper: str, timeframe: str) -> dict:
+    """
+    Get contracts for an asset and timeframe.
+
+    The MarketService methods are @cached: /contracts polls and every
+    stream's contracts producer share their memory tier and in-flight fetch.
+    """
+    return await _contracts_fetcher(asset_upper, timeframe)()
+
+
+async def warm_contracts_cache() -> None:
+    """Fetch hourly contracts for every supported asset so first requests are hot."""
+    results = await asyncio.gather(
+        *(get_cached_contracts(asset, "hourly") for asset in SUPPORTED_ASSETS),
+        return_exceptions=True,
+    )
+    for asset, result in zip(SUPPORTED_ASSETS, results, strict=False):
+        if isinstance(result, Exception):
+            logger.warning("Contracts warm-up failed for %s: %s", asset, result)
+
+
+class AssetBroadcaster:
+    """
+    One set of upstream producers per (asset, timeframe), fanned out to every
+    SSE subscriber through per-subscriber queues.
+
+    Producers start with the first subscriber and stop when the last one
+    leaves. The latest price and contracts events are replayed to new
+    subscribers so they don't wait a full polling cycle.
+    """
+
+    def __init__(self, asset_upper: str, timeframe: str) -> None:
+        self.asset = asset_upper
+        self.timeframe = timeframe
+        self.subscribers: set[asyncio.Queue] = set()
+        self.latest: dict[str, bytes] = {}  # event name -> last framed event
+        self._tasks: list[asyncio.Task] = []
+        self._bus_queues: list[tuple[str, asyncio.Queue]] = []
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber queue, starting the producers if needed."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        async with self._lock:
+            if not self._tasks:
+                await self._start()
+            # No await between replay and registration, so no event is missed
+            for event in self.latest.values():
+                queue.put_nowait(event)
+            self.subscribers.add(queue)
+        return queue
+
+    async def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a subscriber queue, stopping the producers after the last one."""
+        async with self._lock:
+            self.subscribers.discard(queue)
+            if not self.subscribers:
+                await self._stop()
+
+    async def close(self) -> None:
+        """Drop all subscribers and stop the producers."""
+        async with self._lock:
+            self.subscribers.clear()
+            await self._stop()
+
+    def broadcast(self, event: dict, retain: bool = True) -> None:
+        """Frame an event once and push it to every subscriber (non-blocking)."""
+        frame = encode_event(event)
+        if retain:
+            self.latest[event["event"]] = frame
+        for queue in self.subscribers:
+            _offer(queue, frame)
+
+    async def _start(self) -> None:
+        # WebSocket integration
+        data_bus = get_data_bus()
+        ticker_queue = await data_bus.subscribe(f"ticker:{self.asset}")
+        ob_queue = await data_bus.subscribe(f"orderbook:{self.asset}")
+        self._bus_queues = [(f"ticker:{self.asset}", ticker_queue), (f"orderbook:{self.asset}", ob_queue)]
+
+        self._tasks = [
+            asyncio.create_task(self._price_producer()),
+            asyncio.create_task(self._contracts_producer()),
+            asyncio.create_task(self._forwarder(ticker_queue, "ticker_update")),
+            asyncio.create_task(self._forwarder(ob_queue, "orderbook_update")),
+        ]
+        logger.debug("Started %s/%s stream producers", self.asset, self.timeframe)
+
+    async def _stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Clean up data bus subscriptions
+        data_bus = get_data_bus()
+        for channel, queue in self._bus_queues:
+            await data_bus.unsubscribe(channel, queue)
+        self._bus_queues = []
+        self.latest.clear()
+        logger.debug("Stopped %s/%s stream producers", self.asset, self.timeframe)
+
+    async def _price_producer(self) -> None:
+        """Poll spot price every STREAM_PRICE_INTERVAL and broadcast changes."""
+        last_price = 0.0
+        while True:
+            try:
+                price = await get_cached_price(self.asset)
+                if abs(price - last_price) > 0.01:
+                    self.broadcast({
+                        "event": f"{self.asset.lower()}_price",
+                        "data": _sse_data({
+                            "asset": self.asset,
+                            "price": price,
+                            "timestamp": utc_now_iso()
+                        })
+                    })
+                    last_price = price
+            except Exception as e:
+                logger.warning("Error fetching %s price in stream: %s", self.asset, e)
+            await asyncio.sleep(STREAM_PRICE_INTERVAL)
+
+    async def _contracts_producer(self) -> None:
+        """Poll contracts (60s with WS, 20s without) and broadcast snapshots that changed."""
+        ws_manager = get_ws_manager()
+        ws_subscribed = False
+        last_digest = b""
+        while True:
+            try:
+                result = await get_cached_contracts(self.asset, self.timeframe)
+                contracts = result.get("contracts", [])
+                signals = _signal_dicts(contracts)
+                volatility = result.get("volatility", {})
+                # Like the price path, only push when the snapshot actually changed;
+                # new subscribers still get the last one replayed from self.latest
+                digest = hashlib.blake2b(
+                    _sse_data({"contracts": signals, "volatility": volatility}), digest_size=8
+                ).digest()
+                if digest != last_digest:
+                    self.broadcast({
+                        "event": "contracts_update",
+                        "data": _sse_data({
+                            "asset": self.asset,
+                            "contracts": signals,
+                            "volatility": volatility,
+                            "timestamp": utc_now_iso()
+                        })
+                    })
+                    last_digest = digest
+
+                # Subscribe contract tickers to WS for real-time updates
+                if not ws_subscribed and ws_manager.is_connected and contracts:
+                    tickers = [c.get("ticker", "") for c in contracts if c.get("ticker")]
+                    if tickers:
+                        ws_manager.ensure_subscribed(
+                            ["ticker", "orderbook_delta"], tickers
+                        )
+                        ws_subscribed = True
+                        logger.info("Kalshi WS: Subscribed %d %s tickers", len(tickers), self.asset)
+            except Exception as e:
+                logger.warning("Error fetching %s contracts in stream: %s", self.asset, e)
+            await asyncio.sleep(60.0 if ws_manager.is_connected else 20.0)
+
+    async def _forwarder(self, source: asyncio.Queue, event: str) -> None:
+        """Relay WebSocket data bus updates to subscribers as SSE events."""
+        while True:
+            update = await source.get()
+            self.broadcast({
+                "event": event,
+                "data": _sse_data({
+                    "asset": self.asset,
+                    **update,
+                    "timestamp": utc_now_iso()
+                })
+            }, retain=False)
+
+
+def get_asset_broadcaster(asset_upper: str, timeframe: str) -> AssetBroadcaster:
+    """Get or create the shared broadcaster for an asset and timeframe."""
+    key = (asset_upper, timeframe)
+    broadcaster = _broadcasters.get(key)
+    if broadcaster is None:
+        broadcaster = AssetBroadcaster(asset_upper, timeframe)
+        _broadcasters[key] = broadcaster
+    return broadcaster
+
+
+async def stop_asset_broadcasters() -> None:
+    """Stop all stream producers on shutdown."""
+    for broadcaster in list(_broadcasters.values()):
+        await broadcaster.close()
+    _broadcasters.clear()
 
 
 async def asset_trading_stream(request: Request, asset: str, timeframe: str = "hourly") -> AsyncGenerator:
     """
     SSE stream generator for real-time asset trading data.
 
+    Subscribes to the shared AssetBroadcaster, so every client of an asset
+    is served by one set of upstream fetches.
+
     Streams:
     - Asset price updates every 3 seconds
-    - Contract data updates every 20 seconds (hourly) or 10 seconds (15m)
+    - Contract data updates every 60 seconds (WS active) or 20 seconds
+    - Kalshi WebSocket ticker/orderbook updates as they arrive
 
     Args:
         asset: Asset symbol (BTC, ETH, XRP, SOL, DOGE, HYPE, BNB)
         timeframe: "hourly" or "15m"
     """
     asset_upper = asset.upper()
-    price_client = get_price_client(asset_upper)
-    market_service = MarketService()
-
-    last_price_update = 0.0
-    last_contract_update = 0.0
-    last_price = 0.0
-
-    # Get the appropriate contract fetching method based on asset and timeframe
-    if timeframe == "15m":
-        # 15-minute contracts — all assets use the generic method
-        async def _get_15m():
-            return await market_service.get_generic_hourly_contracts(asset_upper, timeframe="15m")
-        get_contracts = _get_15m
-    else:
-        # Hourly contracts — use dedicated methods for original assets, generic for new ones
-        asset_method_map = {
-            "BTC": market_service.get_bitcoin_hourly_contracts,
-            "ETH": market_service.get_ethereum_hourly_contracts,
-            "XRP": market_service.get_ripple_hourly_contracts,
-            "SOL": market_service.get_solana_hourly_contracts,
-        }
-
-        if asset_upper in asset_method_map:
-            get_contracts = asset_method_map[asset_upper]
-        elif asset_upper in ("DOGE", "HYPE", "BNB"):
-            async def _get_generic():
-                return await market_service.get_generic_hourly_contracts(asset_upper)
-            get_contracts = _get_generic
-        else:
-            raise ValueError(f"Unsupported asset: {asset}")
+    broadcaster = get_asset_broadcaster(asset_upper, timeframe)
+    queue = None
 
     try:
-        # WebSocket integration
-        ws_manager = get_ws_manager()
-        data_bus = get_data_bus()
-        ticker_queue = await data_bus.subscribe(f"ticker:{asset_upper}")
-        ob_queue = await data_bus.subscribe(f"orderbook:{asset_upper}")
-        ws_subscribed = False
-
-        # Contract poll interval — 60s when WS is active, 20s as fallback
-        contract_interval = 60.0 if ws_manager.is_connected else 20.0
+        queue = await broadcaster.subscribe()
 
         # Send initial connection event
         yield {
             "event": "connected",
-            "data": json.dumps({
+            "data": _sse_data({
                 "asset": asset_upper,
                 "status": "connected",
-                "ws_active": ws_manager.is_connected,
-                "timestamp": datetime.now(UTC).isoformat()
+                "ws_active": get_ws_manager().is_connected,
+                "timestamp": utc_now_iso()
             })
         }
 
-        try:
-            while True:
-                # Check if client disconnected
-                if await request.is_disconnected():
-                    print(f"SSE client disconnected from {asset_upper} stream")
-                    break
-
-                current_time = asyncio.get_event_loop().time()
-
-                # Drain WebSocket ticker updates (non-blocking)
-                while True:
-                    try:
-                        ticker_update = ticker_queue.get_nowait()
-                        # Push contract price update via SSE
-                        yield {
-                            "event": "ticker_update",
-                            "data": json.dumps({
-                                "asset": asset_upper,
-                                **ticker_update,
-                                "timestamp": datetime.now(UTC).isoformat()
-                            })
-                        }
-                    except asyncio.QueueEmpty:
-                        break
-
-                # Drain WebSocket orderbook updates (non-blocking)
-                while True:
-                    try:
-                        ob_update = ob_queue.get_nowait()
-                        yield {
-                            "event": "orderbook_update",
-                            "data": json.dumps({
-                                "asset": asset_upper,
-                                **ob_update,
-                                "timestamp": datetime.now(UTC).isoformat()
-                            })
-                        }
-                    except asyncio.QueueEmpty:
-                        break
-
-                # Stream spot price every 3 seconds (from exchange, not Kalshi)
-                if current_time - last_price_update >= 3.0:
-                    try:
-                        price = await price_client.get_spot_price()
-                        if abs(price - last_price) > 0.01:
-                            yield {
-                                "event": f"{asset.lower()}_price",
-                                "data": json.dumps({
-                                    "asset": asset_upper,
-                                    "price": price,
-                                    "timestamp": datetime.now(UTC).isoformat()
-                                })
-                            }
-                            last_price = price
-                        last_price_update = current_time
-                    except Exception as e:
-                        print(f"Error fetching {asset_upper} price in stream: {e}")
-
-                # Stream contract updates (60s with WS, 20s without)
-                contract_interval = 60.0 if ws_manager.is_connected else 20.0
-                if current_time - last_contract_update >= contract_interval:
-                    try:
-                        result = await get_contracts()
-                        contracts = result.get("contracts", [])
-                        signals = [
-                            SignalResponse(**contract)
-                            for contract in contracts
-                        ]
-
-                        yield {
-                            "event": "contracts_update",
-                            "data": json.dumps({
-                                "asset": asset_upper,
-                                "contracts": [s.model_dump() for s in signals],
-                                "volatility": result.get("volatility", {}),
-                                "timestamp": datetime.now(UTC).isoformat()
-                            })
-                        }
-                        last_contract_update = current_time
-
-                        # Subscribe contract tickers to WS for real-time updates
-                        if not ws_subscribed and ws_manager.is_connected and contracts:
-                            tickers = [c.get("ticker", "") for c in contracts if c.get("ticker")]
-                            if tickers:
-                                ws_manager.ensure_subscribed(
-                                    ["ticker", "orderbook_delta"], tickers
-                                )
-                                ws_subscribed = True
-                                print(f"Kalshi WS: Subscribed {len(tickers)} {asset_upper} tickers")
-
-                    except Exception as e:
-                        print(f"Error fetching {asset_upper} contracts in stream: {e}")
-
-                # Small sleep to avoid tight loop
-                await asyncio.sleep(0.5)
-
-        finally:
-            # Clean up data bus subscriptions
-            await data_bus.unsubscribe(f"ticker:{asset_upper}", ticker_queue)
-            await data_bus.unsubscribe(f"orderbook:{asset_upper}", ob_queue)
+        # Disconnects cancel this generator (see SSEResponse)
+        while True:
+            yield await queue.get()
 
     except asyncio.CancelledError:
-        print(f"{asset_upper} SSE stream cancelled")
+        logger.debug("%s SSE stream cancelled", asset_upper)
     except Exception as e:
-        print(f"{asset_upper} SSE stream error: {e}")
-        traceback.print_exc()
+        logger.exception("%s SSE stream error: %s", asset_upper, e)
+    finally:
+        if queue is not None:
+            await broadcaster.unsubscribe(queue)
 
 
 async def trading_data_stream(request: Request) -> AsyncGenerator:
@@ -352,12 +517,45 @@ async def trading_data_stream(request: Request) -> AsyncGenerator:
 
     DEPRECATED: Use /stream/{asset} instead.
 
+    Served by the shared BTC hourly AssetBroadcaster.
+
     Streams:
     - BTC price updates every 3 seconds
-    - Contract data updates every 20 seconds
+    - Contract data updates every 60 seconds (WS active) or 20 seconds
+    """
+    broadcaster = get_asset_broadcaster("BTC", "hourly")
+    queue = None
+
+    try:
+        queue = await broadcaster.subscribe()
+        yield {
+            "event": "connected",
+            "data": _sse_data({
+                "asset": "BTC",
+                "status": "connected",
+                "timestamp": utc_now_iso()
+            })
+        }
+        while True:
+            yield await queue.get()
+    except asyncio.CancelledError:
+        logger.debug("BTC SSE stream cancelled")
+    finally:
+        if queue is not None:
+            await broadcaster.unsubscribe(queue)
+
+
+@router.get("/stream/trading")
+async def stream_trading_data(request: Request):
     """
-    async for event in asset_trading_stream(request, "BTC"):
-        yield event
+    Server-Sent Events endpoint for real-time BTC trading data (backward compatibility).
+
+    DEPRECATED: Use /stream/btc instead.
+
+    Streams BTC price updates and contract data to connected clients.
+    Auto-reconnects on disconnect with Last-Event-ID support.
+    """
+    return SSEResponse(trading_data_stream(request), ping=15)
 
 
 @router.get("/stream/{asset}")
@@ -372,41 +570,10 @@ async def stream_asset_data(request: Request, asset: str, timeframe: str = "hour
         asset: Asset symbol (btc, eth, xrp, sol, doge, hype, bnb) - case insensitive
         timeframe: Contract timeframe - "hourly" (default) or "15m"
     """
-    asset_upper = asset.upper()
+    asset_upper = _validate_asset(asset)
     timeframe_lower = timeframe.lower()
 
-    supported = ["BTC", "ETH", "XRP", "SOL", "DOGE", "HYPE", "BNB"]
-    if asset_upper not in supported:
-        raise HTTPException(status_code=400, detail=f"Unsupported asset: {asset}. Supported: {', '.join(supported)}")
-
     if timeframe_lower not in ("hourly", "15m"):
         raise HTTPException(status_code=400, detail=f"Unsupported timeframe: {timeframe}. Supported: hourly, 15m")
 
-    return EventSourceResponse(
-        asset_trading_stream(request, asset_upper, timeframe_lower),
-        headers={
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-            "Cache-Control": "no-cache",
-        },
-        ping=15,  # Send ping every 15 seconds to keep connection alive
-    )
-
-
-@router.get("/stream/trading")
-async def stream_trading_data(request: Request):
-    """
-    Server-Sent Events endpoint for real-time BTC trading data (backward compatibility).
-
-    DEPRECATED: Use /stream/btc instead.
-
-    Streams BTC price updates and contract data to connected clients.
-    Auto-reconnects on disconnect with Last-Event-ID support.
-    """
-    return EventSourceResponse(
-        trading_data_stream(request),
-        headers={
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-            "Cache-Control": "no-cache",
-        },
-        ping=15,  # Send ping every 15 seconds to keep connection alive
-    )
+    return SSEResponse(asset_trading_stream(request, asset_upper, timeframe_lower), ping=15)
@@ -1,5 +1,10 @@
 """Health check endpoints."""
 
+import asyncio
+import logging
+import time
+from typing import Any
+
 from fastapi import APIRouter
 
 from app.core.circuit_breakers import get_breaker_status
@@ -7,11 +12,55 @@ from app.core.encryption import is_encryption_configured
 from app.services.candle_cache import get_candle_cache_health
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 MONITORED_ASSETS = ["BTC", "ETH", "XRP", "SOL"]
 MONITORED_INTERVALS = ["1m"]
 MONITORED_LIMIT = 500
 
+# Candle cache telemetry is refreshed in the background so probes don't pay for it
+HEALTH_REFRESH_INTERVAL = 5.0  # seconds
+HEALTH_SNAPSHOT_MAX_AGE = 30.0  # seconds before a probe recomputes inline
+_health_snapshot: tuple[float, list[dict[str, Any]]] | None = None  # (monotonic ts, candle_cache)
+_refresh_task: asyncio.Task | None = None
+
+
+async def _refresh_candle_cache_health() -> list[dict[str, Any]]:
+    """Recompute candle cache telemetry and store it as the current snapshot."""
+    global _health_snapshot
+    candle_cache = await get_candle_cache_health(
+        MONITORED_ASSETS,
+        MONITORED_INTERVALS,
+        MONITORED_LIMIT,
+    )
+    _health_snapshot = (time.monotonic(), candle_cache)
+    return candle_cache
+
+
+async def _refresh_loop() -> None:
+    while True:
+        try:
+            await _refresh_candle_cache_health()
+        except Exception as e:
+            logger.warning("Health snapshot refresh failed: %s", e)
+        await asyncio.sleep(HEALTH_REFRESH_INTERVAL)
+
+
+def start_health_refresher() -> None:
+    """Start the background health snapshot refresher."""
+    global _refresh_task
+    if _refresh_task is None:
+        _refresh_task = asyncio.create_task(_refresh_loop())
+
+
+async def stop_health_refresher() -> None:
+    """Stop the background health snapshot refresher on shutdown."""
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        await asyncio.gather(_refresh_task, return_exceptions=True)
+        _refresh_task = None
+
 
 @router.get("/health")
 async def health_check() -> dict:
@@ -19,12 +68,13 @@ async def health_check() -> dict:
     Health check endpoint.
 
     Returns service status including circuit breaker states and candle cache telemetry.
+    Candle cache telemetry comes from a snapshot refreshed every few seconds.
     """
-    candle_cache = await get_candle_cache_health(
-        MONITORED_ASSETS,
-        MONITORED_INTERVALS,
-        MONITORED_LIMIT,
-    )
+    if _health_snapshot is not None and time.monotonic() - _health_snapshot[0] < HEALTH_SNAPSHOT_MAX_AGE:
+        candle_cache = _health_snapshot[1]
+    else:
+        # Refresher not running or stuck: fall back to computing inline
+        candle_cache = await _refresh_candle_cache_health()
 
     stale_alerts = [entry for entry in candle_cache if entry["stale_active"]]
 
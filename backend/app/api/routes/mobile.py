@@ -1,6 +1,9 @@
 """Mobile API routes for push notifications and lightweight endpoints."""
 
-from typing import Optional
+import re
+import time
+from functools import lru_cache
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
@@ -8,7 +11,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
-from app.db.models import UserPreferences
+from app.db.models import TradeSignal, UserPreferences
 
 router = APIRouter(prefix="/mobile", tags=["mobile"])
 
@@ -17,7 +20,7 @@ class RegisterPushRequest(BaseModel):
     """Request to register a push notification token."""
 
     device_token: str = Field(..., description="APNs device token")
-    platform: str = Field(default="ios", pattern="^(ios|android)$")
+    platform: Literal["ios", "android"] = "ios"
 
 
 class UpdatePreferencesRequest(BaseModel):
@@ -60,8 +63,39 @@ class LightweightSignal(BaseModel):
     time_to_expiry_minutes: int
 
 
+# Single-user preferences: the row id is resolved once, and the GET payload is
+# memoized per process (refreshed on PATCH, dropped on push token changes)
+PREFERENCES_CACHE_TTL = 60.0  # seconds
+_prefs_id: int | None = None
+_prefs_response: tuple[float, PreferencesResponse] | None = None  # (monotonic ts, payload)
+
+# Ticker parsing, e.g. "KXETHD-25DEC1517-B3500" -> ("ETH", 3500.0)
+_ASSET_RE = re.compile(r"KX(ETH|XRP)")
+_STRIKE_RE = re.compile(r"(?:^|-)[AB](\d+(?:\.\d+)?)(?=-|$)")
+
+
+@lru_cache(maxsize=4096)
+def _parse_ticker(ticker: str) -> tuple[str, float]:
+    """Extract (asset, strike) from a Kalshi ticker; tickers recur across polls."""
+    asset_match = _ASSET_RE.search(ticker)
+    asset = asset_match.group(1) if asset_match else "BTC"
+
+    strikes = _STRIKE_RE.findall(ticker)
+    strike = float(strikes[-1]) if strikes else 0.0
+
+    return asset, strike
+
+
 async def get_or_create_preferences(db: AsyncSession) -> UserPreferences:
     """Get or create user preferences (single user for now)."""
+    global _prefs_id
+
+    # The single row's id never changes once known: fetch by primary key
+    if _prefs_id is not None:
+        prefs = await db.get(UserPreferences, _prefs_id)
+        if prefs is not None:
+            return prefs
+
     result = await db.execute(select(UserPreferences).limit(1))
     prefs = result.scalar_one_or_none()
 
@@ -71,9 +105,36 @@ async def get_or_create_preferences(db: AsyncSession) -> UserPreferences:
         await db.commit()
         await db.refresh(prefs)
 
+    _prefs_id = prefs.id
     return prefs
 
 
+def _preferences_response(prefs: UserPreferences) -> PreferencesResponse:
+    """Build the preferences payload and remember it for GET requests."""
+    global _prefs_response
+
+    decoded = prefs.alert_assets_list
+    alert_assets = list(decoded) if decoded is not None else ["BTC", "ETH", "XRP"]
+
+    response = PreferencesResponse(
+        telegram_chat_id=prefs.telegram_chat_id,
+        apns_device_token=prefs.apns_device_token,
+        min_ev_threshold=prefs.min_ev_threshold,
+        alert_assets=alert_assets,
+        alerts_enabled=prefs.alerts_enabled,
+        quiet_hours_start=prefs.quiet_hours_start,
+        quiet_hours_end=prefs.quiet_hours_end,
+    )
+    _prefs_response = (time.monotonic(), response)
+    return response
+
+
+def _invalidate_preferences_response() -> None:
+    """Drop the memoized GET payload after preferences change."""
+    global _prefs_response
+    _prefs_response = None
+
+
 @router.post("/register-push")
 async def register_push_token(
     request: RegisterPushRequest,
@@ -87,6 +148,7 @@ async def register_push_token(
     prefs = await get_or_create_preferences(db)
     prefs.apns_device_token = request.device_token
     await db.commit()
+    _invalidate_preferences_response()
 
     return {"success": True, "message": "Push token registered"}
 
@@ -101,6 +163,7 @@ async def unregister_push_token(
     prefs = await get_or_create_preferences(db)
     prefs.apns_device_token = None
     await db.commit()
+    _invalidate_preferences_response()
 
     return {"success": True, "message": "Push token removed"}
 
@@ -111,25 +174,15 @@ async def get_preferences(
 ) -> PreferencesResponse:
     """
     Get current user preferences.
+
+    Served from memory for up to PREFERENCES_CACHE_TTL seconds; updates made
+    through this API refresh or invalidate the cached copy.
     """
-    import json
+    if _prefs_response is not None and time.monotonic() - _prefs_response[0] < PREFERENCES_CACHE_TTL:
+        return _prefs_response[1]
 
     prefs = await get_or_create_preferences(db)
-
-    try:
-        alert_assets = json.loads(prefs.alert_assets)
-    except (json.JSONDecodeError, TypeError):
-        alert_assets = ["BTC", "ETH", "XRP"]
-
-    return PreferencesResponse(
-        telegram_chat_id=prefs.telegram_chat_id,
-        apns_device_token=prefs.apns_device_token,
-        min_ev_threshold=prefs.min_ev_threshold,
-        alert_assets=alert_assets,
-        alerts_enabled=prefs.alerts_enabled,
-        quiet_hours_start=prefs.quiet_hours_start,
-        quiet_hours_end=prefs.quiet_hours_end,
-    )
+    return _preferences_response(prefs)
 
 
 @router.patch("/preferences", response_model=PreferencesResponse)
@@ -164,20 +217,7 @@ async def update_preferences(
 
     await db.commit()
 
-    try:
-        alert_assets = json.loads(prefs.alert_assets)
-    except (json.JSONDecodeError, TypeError):
-        alert_assets = ["BTC", "ETH", "XRP"]
-
-    return PreferencesResponse(
-        telegram_chat_id=prefs.telegram_chat_id,
-        apns_device_token=prefs.apns_device_token,
-        min_ev_threshold=prefs.min_ev_threshold,
-        alert_assets=alert_assets,
-        alerts_enabled=prefs.alerts_enabled,
-        quiet_hours_start=prefs.quiet_hours_start,
-        quiet_hours_end=prefs.quiet_hours_end,
-    )
+    return _preferences_response(prefs)
 
 
 @router.get("/signals", response_model=list[LightweightSignal])
@@ -190,40 +230,33 @@ async def get_mobile_signals(
 
     Returns minimal data to reduce bandwidth and parsing time.
     """
-    from app.db.models import TradeSignal
-
-    result = await db.execute(
-        select(TradeSignal)
+    # Stream rows in batches instead of materializing the full result first
+    result = await db.stream(
+        select(
+            TradeSignal.id,
+            TradeSignal.ticker,
+            TradeSignal.signal_type,
+            TradeSignal.expected_value,
+            TradeSignal.confidence_score,
+            TradeSignal.time_to_expiry_hours,
+        )
         .where(TradeSignal.is_active == True)  # noqa: E712
         .order_by(TradeSignal.expected_value.desc())
         .limit(limit)
+        .execution_options(yield_per=100)
     )
-    signals = result.scalars().all()
 
+    # Values come straight from typed DB columns: skip per-row validation
+    construct = LightweightSignal.model_construct
     lightweight = []
-    for s in signals:
-        # Extract asset from ticker
-        asset = "BTC"
-        if "KXETH" in s.ticker:
-            asset = "ETH"
-        elif "KXXRP" in s.ticker:
-            asset = "XRP"
-
-        # Extract strike from ticker
-        strike = 0.0
-        try:
-            parts = s.ticker.split("-")
-            for part in parts:
-                if part.startswith("B") or part.startswith("A"):
-                    strike = float(part[1:])
-        except (ValueError, IndexError):
-            pass
+    async for s in result:
+        asset, strike = _parse_ticker(s.ticker)
 
         # Convert hours to minutes
         minutes = int((s.time_to_expiry_hours or 0) * 60)
 
         lightweight.append(
-            LightweightSignal(
+            construct(
                 id=s.id,
                 ticker=s.ticker,
                 asset=asset,
@@ -8,13 +8,15 @@ Data source priority:
 
 import logging
 import time
+from itertools import accumulate
+from operator import itemgetter
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from app.data.dflow_client import get_dflow_client
-from app.data.kalshi_client import KalshiClient
+from app.data.kalshi_client import get_kalshi_client
 from app.data.kalshi_ws import get_ws_manager
 
 logger = logging.getLogger(__name__)
@@ -22,6 +24,8 @@ logger = logging.getLogger(__name__)
 _orderbook_cache: dict[str, tuple[float, Any]] = {}
 _CACHE_TTL = 10
 
+_PRICE = itemgetter(0)  # sort key for [price_cents, quantity] levels
+
 router = APIRouter()
 
 
@@ -116,7 +120,7 @@ async def _fetch_dflow_orderbook(ticker: str) -> OrderBookResponse | None:
 
 async def _fetch_kalshi_orderbook(ticker: str) -> OrderBookResponse | None:
     """Fetch orderbook from Kalshi REST API."""
-    kalshi = KalshiClient()
+    kalshi = get_kalshi_client()
     data = await kalshi.get_market_orderbook(ticker)
     if not data:
         return None
@@ -150,28 +154,25 @@ def _build_response_from_raw(
     )
 
 
+def _levels_from_sorted(sorted_levels: list) -> list[OrderBookLevel]:
+    """Build levels with running totals; inputs are integer cents from our own sources."""
+    construct = OrderBookLevel.model_construct
+    totals = accumulate(quantity for _, quantity in sorted_levels)
+    return [
+        construct(price=price_cents / 100.0, quantity=quantity, total=total)
+        for (price_cents, quantity), total in zip(sorted_levels, totals, strict=False)
+    ]
+
+
 def _process_bid_levels(bid_levels: list) -> list[OrderBookLevel]:
     if not bid_levels:
         return []
-    sorted_bids = sorted(bid_levels, key=lambda x: x[0], reverse=True)
-    levels = []
-    cumulative = 0
-    for price_cents, quantity in sorted_bids:
-        price = price_cents / 100.0
-        cumulative += quantity
-        levels.append(OrderBookLevel(price=price, quantity=quantity, total=cumulative))
-    return levels
+    return _levels_from_sorted(sorted(bid_levels, key=_PRICE, reverse=True))
 
 
 def _process_ask_levels_from_opposite_bids(opposite_bid_levels: list) -> list[OrderBookLevel]:
     if not opposite_bid_levels:
         return []
-    inverted = [[100 - p, q] for p, q in opposite_bid_levels]
-    sorted_asks = sorted(inverted, key=lambda x: x[0])
-    levels = []
-    cumulative = 0
-    for price_cents, quantity in sorted_asks:
-        price = price_cents / 100.0
-        cumulative += quantity
-        levels.append(OrderBookLevel(price=price, quantity=quantity, total=cumulative))
-    return levels
+    # Ascending asks are the opposite bids in descending price order, inverted
+    sorted_bids = sorted(opposite_bid_levels, key=_PRICE, reverse=True)
+    return _levels_from_sorted([(100 - p, q) for p, q in sorted_bids])
@@ -51,13 +51,15 @@ async def get_current_signals(
     db: AsyncSession = Depends(get_db), limit: int = 10
 ) -> list[TradeSignal]:
     """Get current active trade signals."""
-    result = await db.execute(
+    # Stream rows in batches instead of materializing the full result first
+    result = await db.stream_scalars(
         select(TradeSignal)
         .where(TradeSignal.is_active == True)  # noqa: E712
         .order_by(TradeSignal.expected_value.desc())
         .limit(limit)
+        .execution_options(yield_per=100)
     )
-    return list(result.scalars().all())
+    return [signal async for signal in result]
 
 
 @router.get("/signals/{signal_id}", response_model=SignalResponse)
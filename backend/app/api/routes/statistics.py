@@ -1,42 +1,122 @@
 """Statistics API routes for hourly movements and volatility analysis."""
 
+import asyncio
+import time
+from collections.abc import Awaitable
+from functools import partial
+
 from fastapi import APIRouter, HTTPException, Query
 from typing import Any
 
-from app.services.price_statistics import HourlyPriceStatistics
+from app.api.routes.current import (
+    SUPPORTED_ASSETS,
+    get_cached_contracts,
+    get_cached_price,
+    get_price_client,
+)
+from app.core.compute import run_cpu
+from app.core.http_client import UpstreamUnavailableError
+from app.core.responses import ORJSONResponse
+from app.services.price_statistics import HourlyPriceStatistics, candle_arrays
 from app.services.volatility_skew import VolatilitySkew
-from app.services.market_service import MarketService
-from app.data.bitcoin_client import BitcoinPriceClient
-from app.data.ethereum_client import EthereumPriceClient
-from app.data.generic_price_client import GenericPriceClient
-from app.data.ripple_client import RipplePriceClient
-from app.data.solana_client import SolanaPriceClient
 
+# Handlers return ORJSONResponse directly so the float-heavy stats payloads are
+# encoded once by orjson, skipping FastAPI's response_model/jsonable_encoder pass.
+# Failures propagate to the app-wide handlers in main.py (503 for upstream, 500 otherwise)
 router = APIRouter()
 
+# Stateless calculators shared across requests; price clients and contracts
+# come from the shared registries in current.py
+_stats_service = HourlyPriceStatistics()
+_skew_service = VolatilitySkew()
+
+# 30-day hourly candle sets change at most once an hour, so back-to-back
+# statistics requests share one upstream fetch per (asset, hours)
+CANDLES_TTL = 120  # seconds
+_candles_cache: dict[tuple[str, int], tuple[float, list[dict[str, Any]]]] = {}  # key -> (monotonic ts, candles)
+_candles_locks: dict[tuple[str, int], asyncio.Lock] = {}
+
+# Hourly stats keyed by (asset, lookback, candle count, last candle timestamp):
+# summary, hourly-movements and probability requests reuse one computation.
+# The task is stored before it runs, so concurrent requests await the same one
+STATS_CACHE_MAX_ENTRIES = 32
+_hourly_stats_cache: dict[tuple[Any, ...], asyncio.Task[dict[str, Any]]] = {}
+
+
+def _drop_failed_stats(key: tuple[Any, ...], task: asyncio.Task[dict[str, Any]]) -> None:
+    """Forget a failed computation so the next request retries it."""
+    if (task.cancelled() or task.exception() is not None) and _hourly_stats_cache.get(key) is task:
+        del _hourly_stats_cache[key]
+
+
+async def get_cached_candles(asset: str, hours: int) -> list[dict[str, Any]]:
+    """Get historical candles, reusing a non-empty result younger than CANDLES_TTL."""
+    key = (asset.upper(), hours)
+    cached = _candles_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < CANDLES_TTL:
+        return cached[1]
+
+    # Rejects unsupported assets (400) before a lock is created for the key
+    client = get_price_client(asset)
+    lock = _candles_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        cached = _candles_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < CANDLES_TTL:
+            return cached[1]
+        candles = await client.get_historical_candles(hours=hours)
+        if candles:
+            _candles_cache[key] = (time.monotonic(), candles)
+        return candles
+
+
+async def get_hourly_stats(asset: str, candles: list[Any], lookback_hours: int) -> dict[str, Any]:
+    """Compute (or reuse) calculate_hourly_stats for a candle set, off the event loop."""
+    if not candles:
+        return _stats_service.calculate_hourly_stats(candles, lookback_hours=lookback_hours)
+
+    last = candles[-1]
+    last_ts = last.get("timestamp") if isinstance(last, dict) else last[0]
+    key = (asset.upper(), lookback_hours, len(candles), last_ts)
+    task = _hourly_stats_cache.get(key)
+    if task is None:
+        # Only the compact arrays cross to the worker process
+        times, ohlc = candle_arrays(candles[:lookback_hours])
+        task = asyncio.create_task(
+            run_cpu(_stats_service.hourly_stats_from_arrays, times, ohlc)
+        )
+        if len(_hourly_stats_cache) >= STATS_CACHE_MAX_ENTRIES:
+            del _hourly_stats_cache[next(iter(_hourly_stats_cache))]
+        _hourly_stats_cache[key] = task
+        task.add_done_callback(partial(_drop_failed_stats, key))
+    # shield: a client that disconnects doesn't cancel the shared computation
+    return await asyncio.shield(task)
 
-def get_price_client(asset: str):
-    """Get the appropriate price client for the asset."""
-    asset_upper = asset.upper()
-    if asset_upper == "BTC":
-        return BitcoinPriceClient()
-    elif asset_upper == "ETH":
-        return EthereumPriceClient()
-    elif asset_upper == "XRP":
-        return RipplePriceClient()
-    elif asset_upper == "SOL":
-        return SolanaPriceClient()
-    elif asset_upper in ("DOGE", "HYPE", "BNB"):
-        return GenericPriceClient(asset_upper)
-    else:
-        raise HTTPException(status_code=400, detail=f"Unsupported asset: {asset}")
+
+async def _gather_upstream(*aws: Awaitable[Any]) -> list[Any]:
+    """
+    Run independent upstream fetches concurrently; any failure becomes a 503.
+
+    A TaskGroup cancels the remaining fetches as soon as one fails, instead of
+    letting them run to completion for a response that is already an error.
+    """
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(aw) for aw in aws]
+    except ExceptionGroup as eg:
+        exc = eg.exceptions[0]
+        if isinstance(exc, HTTPException):
+            raise exc from None
+        raise UpstreamUnavailableError(
+            f"Unable to fetch upstream data: {exc}"
+        ) from exc
+    return [task.result() for task in tasks]
 
 
 @router.get("/statistics/hourly-movements")
 async def get_hourly_movement_stats(
     hours: int = Query(default=720, ge=24, le=2160, description="Hours of history to analyze (default 720 = 30 days)"),
     asset: str = Query(default="btc", description="Asset to analyze (btc, eth, or xrp)")
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """
     Return hourly price movement statistics.
     Critical for understanding Kalshi contract probabilities.
@@ -48,30 +128,15 @@ async def get_hourly_movement_stats(
     Returns:
         Statistical analysis of hourly price movements for the specified asset
     """
-    try:
-        # Get price client for selected asset
-        price_client = get_price_client(asset)
-        candles = await price_client.get_historical_candles(hours=hours)
+    candles = await get_cached_candles(asset, hours)
 
-        if not candles:
-            raise HTTPException(
-                status_code=503,
-                detail="Unable to fetch historical candle data"
-            )
+    if not candles:
+        raise UpstreamUnavailableError("Unable to fetch historical candle data")
 
-        # Calculate statistics
-        stats_service = HourlyPriceStatistics()
-        stats = stats_service.calculate_hourly_stats(candles, lookback_hours=hours)
+    # Calculate statistics
+    stats = await get_hourly_stats(asset, candles, hours)
 
-        return stats
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error calculating hourly statistics: {str(e)}"
-        )
+    return ORJSONResponse(stats)
 
 
 @router.get("/probability/next-hour/{strike}")
@@ -79,7 +144,7 @@ async def get_next_hour_probability(
     strike: float,
     lookback_hours: int = Query(default=720, ge=24, le=2160),
     asset: str = Query(default="btc", description="Asset to analyze (btc, eth, or xrp)")
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """
     Probability that next hourly close will be above strike.
 
@@ -93,46 +158,31 @@ async def get_next_hour_probability(
     Returns:
         Probability analysis and move requirements
     """
-    try:
-        # Get price client for selected asset
-        price_client = get_price_client(asset)
-        current_price = await price_client.get_spot_price()
-
-        # Get historical candles
-        candles = await price_client.get_historical_candles(hours=lookback_hours)
-
-        if not candles:
-            raise HTTPException(
-                status_code=503,
-                detail="Unable to fetch historical data"
-            )
-
-        # Calculate statistics
-        stats_service = HourlyPriceStatistics()
-        stats = stats_service.calculate_hourly_stats(candles, lookback_hours=lookback_hours)
-
-        # Get probability of move
-        prob_data = stats_service.get_probability_of_move(
-            current_price=current_price,
-            target_price=strike,
-            hourly_stats=stats
-        )
+    current_price, candles = await _gather_upstream(
+        get_cached_price(asset),
+        get_cached_candles(asset, lookback_hours),
+    )
 
-        return prob_data
+    if not candles:
+        raise UpstreamUnavailableError("Unable to fetch historical data")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error calculating probability: {str(e)}"
-        )
+    # Calculate statistics
+    stats = await get_hourly_stats(asset, candles, lookback_hours)
+
+    # Get probability of move
+    prob_data = _stats_service.get_probability_of_move(
+        current_price=current_price,
+        target_price=strike,
+        hourly_stats=stats
+    )
+
+    return ORJSONResponse(prob_data)
 
 
 @router.get("/volatility/skew")
 async def get_volatility_skew(
     asset: str = Query(default="btc", description="Asset to analyze (btc, eth, or xrp)")
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """
     Calculate volatility skew from current contract prices.
 
@@ -145,60 +195,35 @@ async def get_volatility_skew(
     Returns:
         Volatility skew analysis with IV curve data
     """
-    try:
-        # Get current contracts and price for selected asset
-        market_service = MarketService()
-        price_client = get_price_client(asset)
-        asset_upper = asset.upper()
-
-        # Fetch market data based on asset
-        if asset_upper == "BTC":
-            market_data = await market_service.get_bitcoin_hourly_contracts()
-        elif asset_upper == "ETH":
-            market_data = await market_service.get_ethereum_hourly_contracts()
-        elif asset_upper == "XRP":
-            market_data = await market_service.get_ripple_hourly_contracts()
-        elif asset_upper == "SOL":
-            market_data = await market_service.get_solana_hourly_contracts()
-        elif asset_upper in ("DOGE", "HYPE", "BNB"):
-            market_data = await market_service.get_generic_hourly_contracts(asset_upper)
-        else:
-            raise HTTPException(status_code=400, detail=f"Unsupported asset: {asset}")
-
-        # Extract contracts and current price
-        if isinstance(market_data, dict):
-            contracts = market_data.get("contracts", [])
-        else:
-            contracts = market_data
-
-        if not contracts:
-            raise HTTPException(
-                status_code=404,
-                detail="No active contracts available for skew calculation"
-            )
-
-        current_price = await price_client.get_spot_price()
-
-        # Calculate skew
-        skew_service = VolatilitySkew()
-        skew_data = skew_service.calculate_skew(contracts, current_price)
-
-        return skew_data
-
-    except HTTPException:
-        raise
-    except Exception as e:
+    # Get current contracts and price for selected asset
+    asset_upper = asset.upper()
+    if asset_upper not in SUPPORTED_ASSETS:
+        raise HTTPException(status_code=400, detail=f"Unsupported asset: {asset}")
+
+    market_data, current_price = await _gather_upstream(
+        get_cached_contracts(asset_upper, "hourly"), get_cached_price(asset_upper)
+    )
+
+    # Extract contracts
+    contracts = market_data["contracts"]
+
+    if not contracts:
         raise HTTPException(
-            status_code=500,
-            detail=f"Error calculating volatility skew: {str(e)}"
+            status_code=404,
+            detail="No active contracts available for skew calculation"
         )
 
+    # Calculate skew
+    skew_data = _skew_service.calculate_skew(contracts, current_price)
+
+    return ORJSONResponse(skew_data)
+
 
 @router.get("/statistics/extreme-moves")
 async def get_extreme_move_probabilities(
     hours: int = Query(default=720, ge=24, le=2160, description="Hours of history to analyze"),
     asset: str = Query(default="btc", description="Asset to analyze (btc, eth, or xrp)")
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """
     Calculate probability of EXTREME hourly price moves.
     Critical for high-volatility "lottery ticket" strategies.
@@ -213,38 +238,24 @@ async def get_extreme_move_probabilities(
     Returns:
         Extreme move probabilities and volatility regime analysis
     """
-    try:
-        # Get price client for selected asset
-        price_client = get_price_client(asset)
-        candles = await price_client.get_historical_candles(hours=hours)
-
-        if not candles:
-            raise HTTPException(
-                status_code=503,
-                detail="Unable to fetch historical candle data"
-            )
-
-        # Calculate extreme move probabilities
-        stats_service = HourlyPriceStatistics()
-        extreme_data = stats_service.calculate_extreme_move_probabilities(
-            candles, lookback_hours=hours
-        )
+    candles = await get_cached_candles(asset, hours)
 
-        return extreme_data
+    if not candles:
+        raise UpstreamUnavailableError("Unable to fetch historical candle data")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error calculating extreme move probabilities: {str(e)}"
-        )
+    # Calculate extreme move probabilities
+    _, ohlc = candle_arrays(candles[:hours])
+    extreme_data = await run_cpu(
+        _stats_service.extreme_move_probabilities_from_closes, ohlc[:, 3]
+    )
+
+    return ORJSONResponse(extreme_data)
 
 
 @router.get("/statistics/summary")
 async def get_statistics_summary(
     asset: str = Query(default="btc", description="Asset to analyze (btc, eth, or xrp)")
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """
     Get a comprehensive summary of statistics including:
     - Hourly movement statistics
@@ -257,70 +268,44 @@ async def get_statistics_summary(
     Returns:
         Comprehensive statistics summary
     """
-    try:
-        price_client = get_price_client(asset)
-        market_service = MarketService()
-        stats_service = HourlyPriceStatistics()
-        skew_service = VolatilitySkew()
-        asset_upper = asset.upper()
-
-        # Fetch all data
-        current_price = await price_client.get_spot_price()
-        candles = await price_client.get_historical_candles(hours=720)
-
-        # Fetch market data based on asset
-        if asset_upper == "BTC":
-            market_data = await market_service.get_bitcoin_hourly_contracts()
-        elif asset_upper == "ETH":
-            market_data = await market_service.get_ethereum_hourly_contracts()
-        elif asset_upper == "XRP":
-            market_data = await market_service.get_ripple_hourly_contracts()
-        elif asset_upper == "SOL":
-            market_data = await market_service.get_solana_hourly_contracts()
-        elif asset_upper in ("DOGE", "HYPE", "BNB"):
-            market_data = await market_service.get_generic_hourly_contracts(asset_upper)
-        else:
-            raise HTTPException(status_code=400, detail=f"Unsupported asset: {asset}")
-
-        # Calculate statistics
-        hourly_stats = stats_service.calculate_hourly_stats(candles, lookback_hours=720)
-
-        # Extract contracts
-        if isinstance(market_data, dict):
-            contracts = market_data.get("contracts", [])
-        else:
-            contracts = market_data
-
-        skew_data = skew_service.calculate_skew(contracts, current_price) if contracts else {}
-
-        return {
-            "asset": asset_upper,
-            "current_price": current_price,
-            "hourly_statistics": {
-                "mean_return": hourly_stats.get("mean_return"),
-                "std_return": hourly_stats.get("std_return"),
-                "max_hourly_move": hourly_stats.get("max_hourly_move"),
-                "percentiles": {
-                    "p5": hourly_stats.get("percentile_5"),
-                    "p25": hourly_stats.get("percentile_25"),
-                    "p50": hourly_stats.get("percentile_50"),
-                    "p75": hourly_stats.get("percentile_75"),
-                    "p95": hourly_stats.get("percentile_95"),
-                },
-                "total_samples": hourly_stats.get("total_samples"),
-            },
-            "volatility_skew": {
-                "atm_iv": skew_data.get("atm_iv"),
-                "skew": skew_data.get("skew"),
-                "interpretation": skew_data.get("skew_interpretation"),
-                "contracts_analyzed": skew_data.get("contracts_analyzed"),
-            },
-        }
+    asset_upper = asset.upper()
+    if asset_upper not in SUPPORTED_ASSETS:
+        raise HTTPException(status_code=400, detail=f"Unsupported asset: {asset}")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error generating statistics summary: {str(e)}"
-        )
+    current_price, candles, market_data = await _gather_upstream(
+        get_cached_price(asset_upper),
+        get_cached_candles(asset_upper, 720),
+        get_cached_contracts(asset_upper, "hourly"),
+    )
+
+    # Calculate statistics
+    hourly_stats = await get_hourly_stats(asset_upper, candles, 720)
+
+    # Extract contracts
+    contracts = market_data["contracts"]
+
+    skew_data = _skew_service.calculate_skew(contracts, current_price) if contracts else {}
+
+    return ORJSONResponse({
+        "asset": asset_upper,
+        "current_price": current_price,
+        "hourly_statistics": {
+            "mean_return": hourly_stats.get("mean_return"),
+            "std_return": hourly_stats.get("std_return"),
+            "max_hourly_move": hourly_stats.get("max_hourly_move"),
+            "percentiles": {
+                "p5": hourly_stats.get("percentile_5"),
+                "p25": hourly_stats.get("percentile_25"),
+                "p50": hourly_stats.get("percentile_50"),
+                "p75": hourly_stats.get("percentile_75"),
+                "p95": hourly_stats.get("percentile_95"),
+            },
+            "total_samples": hourly_stats.get("total_samples"),
+        },
+        "volatility_skew": {
+            "atm_iv": skew_data.get("atm_iv"),
+            "skew": skew_data.get("skew"),
+            "interpretation": skew_data.get("skew_interpretation"),
+            "contracts_analyzed": skew_data.get("contracts_analyzed"),
+        },
+    })
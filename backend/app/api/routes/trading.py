@@ -6,33 +6,39 @@ This module supports both:
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached
 from app.core.config import settings
 from app.core.privy_auth import get_current_user, get_current_user_optional
+from app.core.responses import ORJSONResponse
 from app.data.dflow_client import get_dflow_client
 from app.data.dflow_types import OrderRequest
 from app.db.database import get_db
-from app.db.models import Trade, User
+from app.db.models import User
 from app.services.trade_executor import TradeExecutor, TradeRequest
 
 router = APIRouter(prefix="/trade", tags=["trading"])
 
 
+def get_executor(db: AsyncSession = Depends(get_db)) -> TradeExecutor:
+    """Trade executor bound to the request's DB session."""
+    return TradeExecutor(db)
+
+
 class ExecuteTradeRequest(BaseModel):
     """Request to execute a trade."""
 
     ticker: str = Field(..., description="Market ticker symbol")
-    asset: str = Field(..., pattern="^(BTC|ETH|XRP|SOL|DOGE|HYPE|BNB)$", description="Asset type")
-    direction: str = Field(..., pattern="^(YES|NO)$", description="Trade direction")
+    asset: Literal["BTC", "ETH", "XRP", "SOL", "DOGE", "HYPE", "BNB"] = Field(..., description="Asset type")
+    direction: Literal["YES", "NO"] = Field(..., description="Trade direction")
     strike: float = Field(..., description="Strike price")
     contracts: int = Field(..., ge=1, le=1000, description="Number of contracts")
-    order_type: str = Field(default="market", pattern="^(market|limit)$")
+    order_type: Literal["market", "limit"] = "market"
     limit_price: Optional[int] = Field(
         default=None, ge=1, le=99, description="Limit price in cents (1-99)"
     )
@@ -107,18 +113,27 @@ class PnLSummaryModel(BaseModel):
     win_rate: float
 
 
+# List endpoints read trusted DB/executor rows straight into dicts (None fields
+# kept as null, the same shape as /positions/{trade_id}) and encode them once
+# with orjson, instead of building models that FastAPI would validate and dump again
+_POSITION_FIELDS = tuple(PositionModel.model_fields)
+_HISTORY_FIELDS = tuple(TradeHistoryModel.model_fields)
+
+
+def _rows(items: list[Any], fields: tuple[str, ...]) -> list[dict[str, Any]]:
+    return [{name: getattr(item, name) for name in fields} for item in items]
+
+
 @router.post("", response_model=TradeResponseModel)
 async def execute_trade(
     request: ExecuteTradeRequest,
-    db: AsyncSession = Depends(get_db),
+    executor: TradeExecutor = Depends(get_executor),
 ) -> TradeResponseModel:
     """
     Execute a trade on Kalshi.
 
     Places an order with the configured Builder Code for revenue sharing.
     """
-    executor = TradeExecutor(db)
-
     trade_request = TradeRequest(
         ticker=request.ticker,
         asset=request.asset,
@@ -147,14 +162,13 @@ async def execute_trade(
 @router.post("/signal", response_model=TradeResponseModel)
 async def execute_from_signal(
     request: ExecuteFromSignalRequest,
-    db: AsyncSession = Depends(get_db),
+    executor: TradeExecutor = Depends(get_executor),
 ) -> TradeResponseModel:
     """
     Execute a trade from an existing signal.
 
     Looks up the signal and places an order based on its parameters.
     """
-    executor = TradeExecutor(db)
     result = await executor.execute_from_signal(
         signal_id=request.signal_id,
         contracts=request.contracts,
@@ -174,100 +188,56 @@ async def execute_from_signal(
 
 @router.get("/positions", response_model=list[PositionModel])
 async def get_positions(
-    db: AsyncSession = Depends(get_db),
-) -> list[PositionModel]:
+    executor: TradeExecutor = Depends(get_executor),
+) -> ORJSONResponse:
     """
     Get all open positions with live P&L.
 
     Returns current market prices and unrealized profit/loss for each position.
     """
-    executor = TradeExecutor(db)
     positions = await executor.get_open_positions()
-
-    return [
-        PositionModel(
-            trade_id=p.trade_id,
-            ticker=p.ticker,
-            asset=p.asset,
-            direction=p.direction,
-            strike=p.strike,
-            contracts=p.contracts,
-            entry_price=p.entry_price,
-            current_price=p.current_price,
-            unrealized_pnl=p.unrealized_pnl,
-            status=p.status,
-            expiry_at=p.expiry_at,
-            opened_at=p.opened_at,
-        )
-        for p in positions
-    ]
+    return ORJSONResponse(_rows(positions, _POSITION_FIELDS))
 
 
 @router.get("/positions/{trade_id}", response_model=PositionModel)
 async def get_position(
     trade_id: int,
-    db: AsyncSession = Depends(get_db),
+    executor: TradeExecutor = Depends(get_executor),
 ) -> PositionModel:
     """
     Get details of a specific position.
     """
-    result = await db.execute(
-        select(Trade).where(Trade.id == trade_id)
-    )
-    trade = result.scalar_one_or_none()
+    position = await executor.get_position(trade_id)
 
-    if not trade:
+    if not position:
         raise HTTPException(status_code=404, detail="Position not found")
 
-    # Get live price
-    executor = TradeExecutor(db)
-    positions = await executor.get_open_positions()
-    position = next((p for p in positions if p.trade_id == trade_id), None)
-
-    if position:
-        return PositionModel(
-            trade_id=position.trade_id,
-            ticker=position.ticker,
-            asset=position.asset,
-            direction=position.direction,
-            strike=position.strike,
-            contracts=position.contracts,
-            entry_price=position.entry_price,
-            current_price=position.current_price,
-            unrealized_pnl=position.unrealized_pnl,
-            status=position.status,
-            expiry_at=position.expiry_at,
-            opened_at=position.opened_at,
-        )
-
-    # Return without live data if not in open positions
     return PositionModel(
-        trade_id=trade.id,
-        ticker=trade.ticker,
-        asset=trade.asset,
-        direction=trade.direction,
-        strike=trade.strike,
-        contracts=trade.contracts,
-        entry_price=trade.entry_price,
-        current_price=None,
-        unrealized_pnl=None,
-        status=trade.status,
-        expiry_at=trade.expiry_at,
-        opened_at=trade.opened_at,
+        trade_id=position.trade_id,
+        ticker=position.ticker,
+        asset=position.asset,
+        direction=position.direction,
+        strike=position.strike,
+        contracts=position.contracts,
+        entry_price=position.entry_price,
+        current_price=position.current_price,
+        unrealized_pnl=position.unrealized_pnl,
+        status=position.status,
+        expiry_at=position.expiry_at,
+        opened_at=position.opened_at,
     )
 
 
 @router.delete("/positions/{trade_id}", response_model=TradeResponseModel)
 async def close_position(
     trade_id: int,
-    db: AsyncSession = Depends(get_db),
+    executor: TradeExecutor = Depends(get_executor),
 ) -> TradeResponseModel:
     """
     Close an open position.
 
     Places a market sell order to close the position.
     """
-    executor = TradeExecutor(db)
     result = await executor.close_position(trade_id)
 
     return TradeResponseModel(
@@ -281,57 +251,56 @@ async def close_position(
     )
 
 
+def _encode_history_cursor(trade: Any) -> str:
+    return f"{trade.opened_at.isoformat()}_{trade.id}"
+
+
+def _decode_history_cursor(cursor: str | None) -> tuple[datetime, int] | None:
+    if not cursor:
+        return None
+    try:
+        opened_at, trade_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(opened_at), int(trade_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
 @router.get("/history", response_model=list[TradeHistoryModel])
 async def get_trade_history(
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=500),
     offset: int = 0,
-    db: AsyncSession = Depends(get_db),
-) -> list[TradeHistoryModel]:
+    cursor: str | None = None,
+    executor: TradeExecutor = Depends(get_executor),
+) -> ORJSONResponse:
     """
     Get trade history.
 
-    Returns completed trades with P&L information.
+    Returns completed trades with P&L information. Pass the X-Next-Cursor
+    header of a page as ``cursor`` to fetch the next one; ``offset`` is still
+    accepted but gets slower the deeper it goes.
     """
-    executor = TradeExecutor(db)
-    trades = await executor.get_trade_history(limit=limit, offset=offset)
-
-    return [
-        TradeHistoryModel(
-            id=t.id,
-            ticker=t.ticker,
-            asset=t.asset,
-            direction=t.direction,
-            strike=t.strike,
-            contracts=t.contracts,
-            entry_price=t.entry_price,
-            exit_price=t.exit_price,
-            fees=t.fees,
-            pnl=t.pnl,
-            status=t.status,
-            opened_at=t.opened_at,
-            closed_at=t.closed_at,
-        )
-        for t in trades
-    ]
+    trades = await executor.get_trade_history(
+        limit=limit,
+        offset=offset,
+        before=_decode_history_cursor(cursor),
+        columns=_HISTORY_FIELDS,
+    )
+    response = ORJSONResponse(_rows(trades, _HISTORY_FIELDS))
+    if trades and len(trades) == limit:
+        response.headers["X-Next-Cursor"] = _encode_history_cursor(trades[-1])
+    return response
 
 
 @router.get("/pnl/{period}", response_model=PnLSummaryModel)
 async def get_pnl_summary(
-    period: str = "today",
-    db: AsyncSession = Depends(get_db),
+    period: Literal["today", "week", "all"] = "today",
+    executor: TradeExecutor = Depends(get_executor),
 ) -> PnLSummaryModel:
     """
     Get P&L summary for a period.
 
-    Period can be: "today", "week", or "all"
+    Period can be: "today", "week", or "all" (validated by FastAPI, 422 otherwise)
     """
-    if period not in ("today", "week", "all"):
-        raise HTTPException(
-            status_code=400,
-            detail="Period must be 'today', 'week', or 'all'",
-        )
-
-    executor = TradeExecutor(db)
     summary = await executor.get_pnl_summary(period=period)
 
     return PnLSummaryModel(**summary)
@@ -339,17 +308,13 @@ async def get_pnl_summary(
 
 @router.get("/balance")
 async def get_balance(
-    db: AsyncSession = Depends(get_db),
+    executor: TradeExecutor = Depends(get_executor),
 ) -> dict:
     """
     Get Kalshi account balance.
     """
-    executor = TradeExecutor(db)
-    try:
-        balance = await executor.kalshi.get_balance()
-        return balance
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    balance = await executor.kalshi.get_balance()
+    return balance
 
 
 # ============================================================
@@ -399,31 +364,29 @@ async def get_dflow_order(
                 detail="Wallet address does not match authenticated user",
             )
 
-    try:
-        order = await client.get_order(
-            OrderRequest(
-                input_mint=request.input_mint,
-                output_mint=request.output_mint,
-                amount=request.amount,
-                user_public_key=request.user_wallet,
-                slippage_bps=request.slippage_bps,
-            )
+    # Fields were validated by DFlowOrderRequest; construct without re-validating
+    order = await client.get_order(
+        OrderRequest.model_construct(
+            input_mint=request.input_mint,
+            output_mint=request.output_mint,
+            amount=request.amount,
+            user_public_key=request.user_wallet,
+            slippage_bps=request.slippage_bps,
         )
+    )
 
-        return {
-            "input_mint": order.input_mint,
-            "in_amount": order.in_amount,
-            "output_mint": order.output_mint,
-            "out_amount": order.out_amount,
-            "other_amount_threshold": order.other_amount_threshold,
-            "slippage_bps": order.slippage_bps,
-            "price_impact_pct": order.price_impact_pct,
-            "execution_mode": order.execution_mode,
-            "transaction": order.transaction,
-            "last_valid_block_height": order.last_valid_block_height,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "input_mint": order.input_mint,
+        "in_amount": order.in_amount,
+        "output_mint": order.output_mint,
+        "out_amount": order.out_amount,
+        "other_amount_threshold": order.other_amount_threshold,
+        "slippage_bps": order.slippage_bps,
+        "price_impact_pct": order.price_impact_pct,
+        "execution_mode": order.execution_mode,
+        "transaction": order.transaction,
+        "last_valid_block_height": order.last_valid_block_height,
+    }
 
 
 @router.get("/order-status")
@@ -442,21 +405,18 @@ async def get_dflow_order_status(
     """
     client = get_dflow_client()
 
-    try:
-        status = await client.get_order_status(
-            signature=signature,
-            last_valid_block_height=last_valid_block_height,
-        )
+    status = await client.get_order_status(
+        signature=signature,
+        last_valid_block_height=last_valid_block_height,
+    )
 
-        return {
-            "status": status.status,
-            "fills": [
-                {"qty_in": f.qty_in, "qty_out": f.qty_out}
-                for f in status.fills
-            ],
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "status": status.status,
+        "fills": [
+            {"qty_in": f.qty_in, "qty_out": f.qty_out}
+            for f in status.fills
+        ],
+    }
 
 
 @router.get("/verify/{address}")
@@ -479,21 +439,25 @@ async def get_market_mints(ticker: str) -> dict:
 
     These mints are needed for creating trade orders.
     """
+    return await _get_market_mints_cached(ticker)
+
+
+@cached(ttl=3600, key_prefix="dflow:mints", adaptive=False)
+async def _get_market_mints_cached(ticker: str) -> dict:
+    """
+    A market's mints never change, so found ones are cached for an hour.
+    Unknown markets raise (and aren't cached) so they can show up later.
+    """
     client = get_dflow_client()
 
-    try:
-        mints = await client.get_market_mints(ticker)
-        if not mints:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Market {ticker} not found on DFlow",
-            )
+    mints = await client.get_market_mints(ticker)
+    if not mints:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Market {ticker} not found on DFlow",
+        )
 
-        return {
-            "yes_mint": mints["yes_mint"],
-            "no_mint": mints["no_mint"],
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "yes_mint": mints["yes_mint"],
+        "no_mint": mints["no_mint"],
+    }
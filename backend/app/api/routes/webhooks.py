@@ -1,14 +1,15 @@
 """Webhook routes for Telegram and other external services."""
 
+import asyncio
 import hashlib
 import hmac
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from telegram import Update
 
 from app.core.config import settings
-from app.db.database import get_db
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 logger = logging.getLogger(__name__)
@@ -16,6 +17,15 @@ logger = logging.getLogger(__name__)
 # Global bot instance (initialized on startup)
 _telegram_bot = None
 
+# Webhook secret encoded once; empty when verification is disabled
+_TELEGRAM_SECRET = (settings.telegram_webhook_secret or "").encode()
+
+# Updates are acknowledged immediately and processed in the background, at most
+# UPDATE_CONCURRENCY at a time; task refs are kept so they aren't GC'd mid-run
+UPDATE_CONCURRENCY = 64
+_update_slots = asyncio.Semaphore(UPDATE_CONCURRENCY)
+_update_tasks: set[asyncio.Task] = set()
+
 
 def set_telegram_bot(bot) -> None:
     """Set the global Telegram bot instance."""
@@ -28,67 +38,73 @@ def get_telegram_bot():
     return _telegram_bot
 
 
-def verify_telegram_signature(request_body: bytes, signature: str) -> bool:
+def verify_telegram_signature(signature: str) -> bool:
     """
     Verify Telegram webhook signature.
 
     Args:
-        request_body: Raw request body
         signature: X-Telegram-Bot-Api-Secret-Token header
 
     Returns:
         True if signature is valid
     """
-    if not settings.telegram_webhook_secret:
+    if not _TELEGRAM_SECRET:
         # No secret configured, skip verification (not recommended for production)
         return True
 
-    return hmac.compare_digest(signature, settings.telegram_webhook_secret)
+    # The secret's length isn't sensitive, so wrong-length tokens are
+    # rejected before the constant-time comparison
+    token = signature.encode()
+    if len(token) != len(_TELEGRAM_SECRET):
+        return False
+    return hmac.compare_digest(token, _TELEGRAM_SECRET)
+
+
+async def _process_update(bot, update: Update) -> None:
+    async with _update_slots:
+        try:
+            await bot.app.process_update(update)
+        except Exception:
+            logger.exception("Error processing Telegram update %s", update.update_id)
 
 
 @router.post("/telegram")
-async def telegram_webhook(
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-) -> dict:
+async def telegram_webhook(request: Request) -> dict:
     """
     Receive Telegram bot updates via webhook.
 
     This endpoint should be registered with Telegram using:
     https://api.telegram.org/bot<token>/setWebhook?url=<your_url>/api/v1/webhooks/telegram
     """
-    # Verify webhook secret if configured
+    # Verify webhook secret if configured, before buffering the body
     signature = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "")
-    body = await request.body()
-
-    if not verify_telegram_signature(body, signature):
+    if not verify_telegram_signature(signature):
         logger.warning("Invalid Telegram webhook signature")
         raise HTTPException(status_code=403, detail="Invalid signature")
 
+    body = await request.body()
+
     bot = get_telegram_bot()
     if not bot or not bot.app:
         logger.warning("Telegram bot not initialized")
         raise HTTPException(status_code=503, detail="Bot not available")
 
     try:
-        # Parse the update
-        import json
-        from telegram import Update
-
-        update_data = json.loads(body)
-        update = Update.de_json(update_data, bot.app.bot)
-
-        if update:
-            # Process the update
-            await bot.app.process_update(update)
-
-        return {"ok": True}
-
+        # Parse the update (orjson reads the raw bytes directly)
+        update = Update.de_json(orjson.loads(body), bot.app.bot)
     except Exception as e:
-        logger.error(f"Error processing Telegram update: {e}")
+        logger.error(f"Error parsing Telegram update: {e}")
         # Return 200 to prevent Telegram from retrying
         return {"ok": False, "error": str(e)}
 
+    if update:
+        # Ack now; Telegram retries webhooks that answer slowly
+        task = asyncio.create_task(_process_update(bot, update))
+        _update_tasks.add(task)
+        task.add_done_callback(_update_tasks.discard)
+
+    return {"ok": True}
+
 
 @router.get("/telegram/info")
 async def telegram_webhook_info() -> dict:
@@ -101,18 +117,15 @@ async def telegram_webhook_info() -> dict:
     if not bot or not bot.app:
         raise HTTPException(status_code=503, detail="Bot not available")
 
-    try:
-        info = await bot.app.bot.get_webhook_info()
-        return {
-            "url": info.url,
-            "has_custom_certificate": info.has_custom_certificate,
-            "pending_update_count": info.pending_update_count,
-            "last_error_date": info.last_error_date,
-            "last_error_message": info.last_error_message,
-            "max_connections": info.max_connections,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    info = await bot.app.bot.get_webhook_info()
+    return {
+        "url": info.url,
+        "has_custom_certificate": info.has_custom_certificate,
+        "pending_update_count": info.pending_update_count,
+        "last_error_date": info.last_error_date,
+        "last_error_message": info.last_error_message,
+        "max_connections": info.max_connections,
+    }
 
 
 @router.post("/telegram/set-webhook")
@@ -127,14 +140,11 @@ async def set_telegram_webhook(webhook_url: str) -> dict:
     if not bot or not bot.app:
         raise HTTPException(status_code=503, detail="Bot not available")
 
-    try:
-        success = await bot.app.bot.set_webhook(
-            url=webhook_url,
-            secret_token=settings.telegram_webhook_secret if settings.telegram_webhook_secret else None,
-        )
-        return {"success": success, "webhook_url": webhook_url}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await bot.app.bot.set_webhook(
+        url=webhook_url,
+        secret_token=settings.telegram_webhook_secret if settings.telegram_webhook_secret else None,
+    )
+    return {"success": success, "webhook_url": webhook_url}
 
 
 @router.post("/telegram/delete-webhook")
@@ -146,8 +156,5 @@ async def delete_telegram_webhook() -> dict:
     if not bot or not bot.app:
         raise HTTPException(status_code=503, detail="Bot not available")
 
-    try:
-        success = await bot.app.bot.delete_webhook()
-        return {"success": success}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await bot.app.bot.delete_webhook()
+    return {"success": success}
@@ -6,12 +6,20 @@ Uses Redis for shared cache across multiple workers/instances.
 Falls back to in-memory cache when Redis is unavailable.
 """
 
-import json
+import asyncio
+import fnmatch
 import functools
+import hashlib
+import inspect
+import os
+import random
+import socket
 import time
 from typing import Any, Callable, Optional
 from datetime import datetime
+import orjson
 import redis.asyncio as redis
+from redis.utils import HIREDIS_AVAILABLE
 import logging
 
 from app.core.config import settings
@@ -22,8 +30,62 @@ logger = logging.getLogger(__name__)
 _redis_client: Optional[redis.Redis] = None
 _redis_available: bool = True  # Assume available until proven otherwise
 
+# Keep Redis connections warm: kernel TCP keepalives plus an app-level PING so
+# idle NAT/LB state isn't dropped between requests (the first request after a
+# quiet spell would otherwise pay for a reconnect)
+REDIS_KEEPALIVE_INTERVAL = 30  # seconds
+_SOCKET_KEEPALIVE_OPTIONS = {
+    option: value
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if (option := getattr(socket, name, None)) is not None  # not all exist on every OS
+}
+_keepalive_task: asyncio.Task | None = None
+
+# Connections opened by init_redis at startup (the pool allows up to 50)
+REDIS_WARM_CONNECTIONS = 10
+
 # In-memory fallback cache (used when Redis is unavailable)
+# Kept in LRU order (least recently used first); a background sweep drops
+# expired entries that are never read again
 _memory_cache: dict[str, tuple[Any, float]] = {}  # key -> (value, expiry_timestamp)
+MEMORY_CACHE_MAX_ENTRIES = 1024  # bound growth across asset x interval x limit keys
+MEMORY_SWEEP_INTERVAL = 60  # seconds
+_sweep_task: asyncio.Task | None = None
+
+# Keys per SCAN page / UNLINK call when invalidating by pattern
+INVALIDATE_BATCH_SIZE = 500
+
+# invalidate_cache publishes its pattern here so every worker evicts the
+# matching entries from its in-memory tier
+INVALIDATION_CHANNEL = "cache:invalidate"
+_invalidation_task: asyncio.Task | None = None
+
+# Cross-worker single-flight: one worker fetches on a miss, the others wait for it
+SINGLE_FLIGHT_LOCK_TTL = 10  # seconds a worker may hold a fetch lock
+SINGLE_FLIGHT_WAIT = 5.0  # seconds a waiting worker blocks before fetching itself
+_WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+# Cached values go through orjson; int-keyed dicts (stats by hour) and numpy
+# scalars are allowed, naive datetimes (the app's utcnow() values) are tagged
+# as UTC, and anything else unknown falls back to str()
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+def _dumps(value: Any) -> bytes:
+    return orjson.dumps(value, default=str, option=_JSON_OPTIONS)
+
+
+# In-process fills by cache key: concurrent misses await one fetch instead of
+# each calling upstream (single_flight extends this across workers)
+_inflight: dict[str, asyncio.Future] = {}
+
+
+def _inflight_done(cache_key: str, pending: asyncio.Future) -> None:
+    if _inflight.get(cache_key) is pending:
+        del _inflight[cache_key]
+    if not pending.cancelled():
+        pending.exception()  # retrieved even if every awaiting caller went away
+
 
 # Adaptive TTL multipliers (increase when rate limited)
 _ttl_multipliers: dict[str, float] = {}  # key_prefix -> multiplier (1.0 = normal, higher = extend TTL)
@@ -56,6 +118,30 @@ def reset_ttl_multiplier(key_prefix: str):
         _ttl_multipliers[key_prefix] = max(1.0, _ttl_multipliers[key_prefix] * 0.9)
 
 
+# Age-based TTL: a value that hasn't changed for a while is likely to stay
+# unchanged, so its TTL grows with the time since it last changed
+# (alpha * age), from the base TTL up to ADAPTIVE_TTL_MAX_FACTOR x base.
+# A changed value drops back to the base TTL.
+ADAPTIVE_TTL_ALPHA = 0.5
+ADAPTIVE_TTL_MAX_FACTOR = 4
+_key_versions: dict[str, tuple[bytes, float]] = {}  # key -> (payload digest, monotonic time it changed)
+
+
+def _age_based_ttl(cache_key: str, payload: bytes, base_ttl: int) -> int:
+    """TTL for a freshly fetched payload, from how long the key's value has been unchanged."""
+    now = time.monotonic()
+    digest = hashlib.blake2b(payload, digest_size=8).digest()
+    previous = _key_versions.pop(cache_key, None)
+    changed_at = previous[1] if previous is not None and previous[0] == digest else now
+    # Same bound (and LRU order) as the memory tier
+    if len(_key_versions) >= MEMORY_CACHE_MAX_ENTRIES:
+        del _key_versions[next(iter(_key_versions))]
+    _key_versions[cache_key] = (digest, changed_at)
+
+    age_ttl = int((now - changed_at) * ADAPTIVE_TTL_ALPHA)
+    return min(max(age_ttl, base_ttl), base_ttl * ADAPTIVE_TTL_MAX_FACTOR)
+
+
 def get_rate_limit_stats() -> dict[str, Any]:
     """Get rate limit statistics for monitoring."""
     return {
@@ -75,13 +161,20 @@ async def get_redis_client() -> Optional[redis.Redis]:
         try:
             _redis_client = redis.from_url(
                 settings.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-                max_connections=50
+                # Values stay bytes: orjson parses them without a str decode pass
+                decode_responses=False,
+                max_connections=50,
+                socket_keepalive=True,
+                socket_keepalive_options=_SOCKET_KEEPALIVE_OPTIONS,
+                health_check_interval=REDIS_KEEPALIVE_INTERVAL,
             )
             # Test connection
             await _redis_client.ping()
-            logger.info("✓ Redis client initialized")
+            # redis-py picks the hiredis C parser automatically when installed
+            logger.info(
+                "✓ Redis client initialized (%s parser)",
+                "hiredis" if HIREDIS_AVAILABLE else "pure-Python",
+            )
         except Exception as e:
             logger.warning(f"⚠️  Redis unavailable, caching disabled: {e}")
             _redis_available = False
@@ -91,6 +184,51 @@ async def get_redis_client() -> Optional[redis.Redis]:
     return _redis_client
 
 
+async def init_redis() -> redis.Redis | None:
+    """
+    Connect to Redis at startup and pre-open part of the connection pool.
+
+    Concurrent PINGs each check out their own connection, so the first
+    requests (and their pipelines) don't pay for TCP setup and AUTH.
+    Returns None if Redis is unavailable.
+    """
+    client = await get_redis_client()
+    if client is None:
+        return None
+    try:
+        await asyncio.gather(*(client.ping() for _ in range(REDIS_WARM_CONNECTIONS)))
+    except Exception as e:
+        logger.warning(f"⚠️  Could not pre-open Redis connections: {e}")
+    return client
+
+
+async def _keepalive_loop() -> None:
+    while True:
+        await asyncio.sleep(REDIS_KEEPALIVE_INTERVAL)
+        if _redis_client is None:
+            continue
+        try:
+            await _redis_client.ping()
+        except Exception as e:
+            logger.debug("Redis keepalive ping failed: %s", e)
+
+
+def start_redis_keepalive() -> None:
+    """Start the background Redis keepalive ping."""
+    global _keepalive_task
+    if _keepalive_task is None:
+        _keepalive_task = asyncio.create_task(_keepalive_loop())
+
+
+async def stop_redis_keepalive() -> None:
+    """Stop the background Redis keepalive ping on shutdown."""
+    global _keepalive_task
+    if _keepalive_task is not None:
+        _keepalive_task.cancel()
+        await asyncio.gather(_keepalive_task, return_exceptions=True)
+        _keepalive_task = None
+
+
 async def close_redis_client():
     """Close Redis connection on shutdown"""
     global _redis_client, _redis_available
@@ -110,28 +248,57 @@ def is_redis_available() -> bool:
 
 def _get_from_memory_cache(key: str) -> Optional[Any]:
     """Get value from in-memory cache if not expired."""
-    if key in _memory_cache:
-        value, expiry = _memory_cache[key]
-        if time.time() < expiry:
-            return value
-        else:
-            # Expired, remove it
-            del _memory_cache[key]
+    entry = _memory_cache.pop(key, None)
+    if entry is None:
+        return None
+    value, expiry = entry
+    if time.time() < expiry:
+        # Re-insert at the most recently used end
+        _memory_cache[key] = entry
+        return value
+    # Expired, leave it removed
     return None
 
 
 def _set_memory_cache(key: str, value: Any, ttl: int):
-    """Store value in in-memory cache."""
+    """Store value in in-memory cache, evicting the least recently used entry when full."""
+    _memory_cache.pop(key, None)
+    if len(_memory_cache) >= MEMORY_CACHE_MAX_ENTRIES:
+        del _memory_cache[next(iter(_memory_cache))]
     _memory_cache[key] = (value, time.time() + ttl)
 
 
+async def _sweep_loop() -> None:
+    while True:
+        await asyncio.sleep(MEMORY_SWEEP_INTERVAL)
+        now = time.time()
+        for key in [key for key, (_, expiry) in _memory_cache.items() if expiry <= now]:
+            del _memory_cache[key]
+
+
+def start_memory_cache_sweeper() -> None:
+    """Start the periodic sweep of expired in-memory cache entries."""
+    global _sweep_task
+    if _sweep_task is None:
+        _sweep_task = asyncio.create_task(_sweep_loop())
+
+
+async def stop_memory_cache_sweeper() -> None:
+    """Stop the in-memory cache sweep on shutdown."""
+    global _sweep_task
+    if _sweep_task is not None:
+        _sweep_task.cancel()
+        await asyncio.gather(_sweep_task, return_exceptions=True)
+        _sweep_task = None
+
+
 async def cache_set_json(key: str, value: Any, ttl: Optional[int] = None):
     """
     Store JSON-serializable value under a cache key.
     Falls back to in-memory cache when Redis unavailable.
     """
     client = await get_redis_client()
-    payload = json.dumps(value, default=str)
+    payload = _dumps(value)
 
     if client is not None:
         try:
@@ -159,24 +326,157 @@ async def cache_get_json(key: str) -> Optional[Any]:
     if client is not None:
         try:
             cached_data = await client.get(key)
-            if cached_data:
-                return json.loads(cached_data)
+            if cached_data is not None:
+                return orjson.loads(cached_data)
         except Exception as e:
             logger.warning(f"⚠️  [Cache] Error reading {key} from Redis: {e}")
 
     return _get_from_memory_cache(key)
 
 
-def cached(ttl: int, key_prefix: str, adaptive: bool = True):
+async def cache_get_many_json(keys: list[str]) -> list[Any | None]:
+    """
+    Retrieve several JSON values with one MGET round trip.
+
+    Returns values in key order; keys missing from Redis fall back to the
+    in-memory cache, and None marks a miss.
+    """
+    if not keys:
+        return []
+
+    values: list[Any | None] = [None] * len(keys)
+    client = await get_redis_client()
+    if client is not None:
+        try:
+            for i, cached_data in enumerate(await client.mget(keys)):
+                if cached_data is not None:
+                    values[i] = orjson.loads(cached_data)
+        except Exception as e:
+            logger.warning(f"⚠️  [Cache] Error reading {len(keys)} keys from Redis: {e}")
+
+    for i, key in enumerate(keys):
+        if values[i] is None:
+            values[i] = _get_from_memory_cache(key)
+    return values
+
+
+async def _wait_for_fill(client: redis.Redis, cache_key: str) -> Any | None:
+    """
+    Wait for another worker holding the single-flight lock to fill cache_key.
+
+    Returns the cached value, or None if it did not appear within SINGLE_FLIGHT_WAIT.
+    """
+    channel = f"{cache_key}:filled"
+    pubsub = client.pubsub()
+    try:
+        await pubsub.subscribe(channel)
+
+        # Re-check after subscribing so a fill published before SUBSCRIBE isn't missed
+        cached_data = await client.get(cache_key)
+        if cached_data is not None:
+            return orjson.loads(cached_data)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SINGLE_FLIGHT_WAIT
+        while (remaining := deadline - loop.time()) > 0:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+            if message is not None:
+                break
+
+        cached_data = await client.get(cache_key)
+        return orjson.loads(cached_data) if cached_data is not None else None
+    finally:
+        try:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+        except Exception:
+            pass
+
+
+def _hash_key(key_prefix: str, raw: str) -> str:
+    """
+    Fixed-size key: the prefix plus a 128-bit blake2b digest of the raw key.
+
+    Argument strings can run to hundreds of bytes; every GET/SET would carry
+    them. The prefix stays readable so "prefix:*" invalidation still matches.
+    With settings.debug the raw key is kept, for inspecting Redis by hand.
+    """
+    if settings.debug:
+        return raw
+    return f"{key_prefix}:{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"
+
+
+def _generic_cache_key(key_prefix: str, *args, **kwargs) -> str:
+    """Key for functions taking *args/**kwargs, which can't get a compiled builder."""
+    # args[0] is 'self' for instance methods, skip it
+    cache_args = args[1:] if args and hasattr(args[0], '__dict__') else args
+    arg_str = ":".join(map(str, cache_args))
+    kwarg_str = ":".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
+    return _hash_key(key_prefix, f"{key_prefix}:{arg_str}:{kwarg_str}".rstrip(":"))
+
+
+def _compile_key_builder(func: Callable, key_prefix: str) -> Callable[..., str]:
+    """
+    Generate a cache key function with the same parameters as func.
+
+    Built once per decorated function: CPython binds positional, keyword and
+    default arguments itself, and the raw key is a single f-string, e.g.
+    get_candles(asset, interval, limit=500) -> "candles:{asset}:{interval}:{limit}",
+    which is then hashed (see _hash_key).
+    Calls spelled differently (positional vs keyword, default omitted) share a key.
+    """
+    params = list(inspect.signature(func).parameters.values())
+    if any(p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in params):
+        return functools.partial(_generic_cache_key, key_prefix)
+
+    namespace: dict[str, Any] = {"_key_prefix": key_prefix, "_hash_key": _hash_key}
+    arg_specs = []
+    for i, param in enumerate(params):
+        if param.kind is param.KEYWORD_ONLY and "*" not in arg_specs:
+            arg_specs.append("*")
+        if param.default is param.empty:
+            arg_specs.append(param.name)
+        else:
+            namespace[f"_default_{i}"] = param.default
+            arg_specs.append(f"{param.name}=_default_{i}")
+        if param.kind is param.POSITIONAL_ONLY and (
+            i + 1 == len(params) or params[i + 1].kind is not param.POSITIONAL_ONLY
+        ):
+            arg_specs.append("/")
+
+    # Skip 'self'/'cls' of methods; every other argument is part of the key
+    key_params = params[1:] if params and params[0].name in ("self", "cls") else params
+    fields = "".join(f":{{{param.name}}}" for param in key_params)
+    source = (
+        f'def _cache_key({", ".join(arg_specs)}):\n'
+        f'    return _hash_key(_key_prefix, f"{{_key_prefix}}{fields}")\n'
+    )
+    exec(source, namespace)
+    return namespace["_cache_key"]
+
+
+def cached(
+    ttl: int,
+    key_prefix: str,
+    adaptive: bool = True,
+    single_flight: bool = False,
+    jitter: int = 0,
+):
     """
     Decorator for caching async function results in Redis.
-    Falls back to in-memory cache when Redis is unavailable.
+    A per-worker in-memory tier is checked first and also serves as the
+    fallback when Redis is unavailable.
     Supports adaptive TTL that increases when rate limits are hit.
 
     Args:
         ttl: Base time-to-live in seconds
         key_prefix: Prefix for cache key (e.g., "contracts", "price")
-        adaptive: If True, extend TTL when rate limits are detected
+        adaptive: If True, extend TTL for values that haven't changed across
+            fetches (up to 4x) and when rate limits are detected
+        single_flight: If True, take a Redis lock on a miss so only one worker
+            fetches; other workers wait for the result to be published
+        jitter: Add 0..jitter random seconds to each stored TTL so keys filled
+            together don't all expire (and refetch upstream) in the same tick
 
     Usage:
         @cached(ttl=60, key_prefix="contracts")
@@ -185,42 +485,29 @@ def cached(ttl: int, key_prefix: str, adaptive: bool = True):
             return data
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs) -> Any:
-            # Generate cache key from function args (skip 'self' for instance methods)
-            # args[0] is 'self' for instance methods, skip it
-            cache_args = args[1:] if args and hasattr(args[0], '__dict__') else args
-            arg_str = ":".join(str(arg) for arg in cache_args if arg)
-            kwarg_str = ":".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
-            cache_key = f"{key_prefix}:{arg_str}:{kwarg_str}".rstrip(":")
-
-            # Calculate effective TTL (may be extended if rate limited)
-            effective_ttl = get_adaptive_ttl(key_prefix, ttl) if adaptive else ttl
-
-            # Get Redis client (None if unavailable)
-            client = await get_redis_client()
-
-            # Try Redis cache first
-            if client is not None:
+        # Every argument (even falsy ones) keeps its slot in the key, so
+        # ("BTC", "1m", 500) and ("ETH", "1m", 500) can't collide
+        build_key = _compile_key_builder(func, key_prefix)
+
+        async def fill(cache_key: str, effective_ttl: int, client: redis.Redis | None, args, kwargs) -> Any:
+            """Fetch on a miss and store the result in Redis and memory."""
+            # With single-flight, only the lock holder fetches
+            lock_key = f"{cache_key}:lock"
+            holds_lock = False
+            if single_flight and client is not None:
                 try:
-                    cached_data = await client.get(cache_key)
-                    if cached_data:
-                        # Reset TTL multiplier on successful cache hit
-                        reset_ttl_multiplier(key_prefix)
-                        print(f"✅ [Cache HIT] {cache_key} (Redis)")
-                        return json.loads(cached_data)
+                    holds_lock = bool(await client.set(
+                        lock_key, _WORKER_ID, nx=True, ex=SINGLE_FLIGHT_LOCK_TTL
+                    ))
+                    if not holds_lock:
+                        filled = await _wait_for_fill(client, cache_key)
+                        if filled is not None:
+                            _set_memory_cache(cache_key, filled, effective_ttl)
+                            return filled
                 except Exception as e:
-                    print(f"⚠️  [Cache] Error reading from Redis: {e}")
-
-            # Try in-memory cache as fallback
-            memory_result = _get_from_memory_cache(cache_key)
-            if memory_result is not None:
-                reset_ttl_multiplier(key_prefix)
-                print(f"✅ [Cache HIT] {cache_key} (memory)")
-                return memory_result
+                    logger.warning(f"⚠️  [Cache] Single-flight error for {cache_key}: {e}")
 
-            # Cache miss - fetch fresh data
-            print(f"❌ [Cache MISS] {cache_key}, fetching fresh data...")
+            logger.debug("[Cache MISS] %s, fetching fresh data...", cache_key)
             try:
                 result = await func(*args, **kwargs)
                 # Reset multiplier on successful fetch
@@ -230,25 +517,140 @@ def cached(ttl: int, key_prefix: str, adaptive: bool = True):
                 error_str = str(e).lower()
                 if "429" in error_str or "rate limit" in error_str:
                     record_rate_limit_event(key_prefix)
+                if holds_lock:
+                    try:
+                        await client.delete(lock_key)
+                    except Exception:
+                        pass
                 raise
 
-            # Store in Redis cache with effective TTL
+            payload = _dumps(result) if client is not None or adaptive else b""
+            if adaptive:
+                # Stable values earn a longer TTL; the rate-limit multiplier
+                # still applies on top
+                effective_ttl = get_adaptive_ttl(key_prefix, _age_based_ttl(cache_key, payload, ttl))
+
+            # Spread expiries of keys filled in the same burst
+            if jitter:
+                effective_ttl += random.randint(0, jitter)
+
+            # Store in Redis cache with effective TTL; the single-flight
+            # notify/unlock ride the same pipeline, so it's one round trip
             if client is not None:
                 try:
-                    await client.setex(
-                        cache_key,
-                        effective_ttl,
-                        json.dumps(result, default=str)  # default=str handles datetime serialization
-                    )
-                    print(f"💾 [Cache] Stored {cache_key} in Redis (TTL: {effective_ttl}s)")
+                    pipe = client.pipeline(transaction=False)
+                    pipe.setex(cache_key, effective_ttl, payload)
+                    if holds_lock:
+                        pipe.publish(f"{cache_key}:filled", "ok")
+                        pipe.delete(lock_key)
+                    await pipe.execute()
+                    logger.debug("[Cache] Stored %s in Redis (TTL: %ss)", cache_key, effective_ttl)
                 except Exception as e:
-                    print(f"⚠️  [Cache] Error writing to Redis: {e}")
+                    logger.warning(f"⚠️  [Cache] Error writing to Redis: {e}")
 
             # Always store in memory cache as backup
             _set_memory_cache(cache_key, result, effective_ttl)
 
             return result
 
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            cache_key = build_key(*args, **kwargs)
+
+            # Calculate effective TTL (may be extended if rate limited)
+            effective_ttl = get_adaptive_ttl(key_prefix, ttl) if adaptive else ttl
+
+            # Try this worker's in-memory tier first: every fill stores the
+            # value there with the same TTL, and a dict lookup skips the
+            # Redis round trip for hot keys
+            memory_result = _get_from_memory_cache(cache_key)
+            if memory_result is not None:
+                reset_ttl_multiplier(key_prefix)
+                logger.debug("[Cache HIT] %s (memory)", cache_key)
+                return memory_result
+
+            # Get Redis client (None if unavailable)
+            client = await get_redis_client()
+
+            # Then Redis, shared with the other workers
+            if client is not None:
+                try:
+                    cached_data = await client.get(cache_key)
+                    if cached_data is not None:
+                        # Reset TTL multiplier on successful cache hit
+                        reset_ttl_multiplier(key_prefix)
+                        logger.debug("[Cache HIT] %s (Redis)", cache_key)
+                        return orjson.loads(cached_data)
+                except Exception as e:
+                    logger.warning(f"⚠️  [Cache] Error reading from Redis: {e}")
+
+            # Cache miss - concurrent callers in this process share one fill per key
+            pending = _inflight.get(cache_key)
+            if pending is None:
+                pending = asyncio.ensure_future(fill(cache_key, effective_ttl, client, args, kwargs))
+                _inflight[cache_key] = pending
+                pending.add_done_callback(functools.partial(_inflight_done, cache_key))
+            # shield: a caller that goes away doesn't cancel the fill others await
+            return await asyncio.shield(pending)
+
+        return wrapper
+    return decorator
+
+
+def cached_batch(ttl: int, key_prefix: str, key_fn: Callable[[Any], Any]):
+    """
+    Decorator for caching async functions that fetch a list of items at once.
+
+    The wrapped function takes the list of items as its first argument (after
+    self/cls) and returns one result per item, in order. Cached items are
+    read with a single MGET; only the misses are passed to the function, and
+    their results are written back in one pipeline.
+
+    Args:
+        ttl: Time-to-live in seconds
+        key_prefix: Prefix for cache keys (e.g., "price")
+        key_fn: Maps an item to its key part; other arguments are not part
+            of the key, so key_fn must cover anything the result depends on
+
+    Usage:
+        @cached_batch(ttl=10, key_prefix="price", key_fn=lambda ticker: ticker)
+        async def get_prices(tickers: list[str]) -> list[float]:
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        params = list(inspect.signature(func).parameters)
+        items_index = 1 if params and params[0] in ("self", "cls") else 0
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> list[Any]:
+            items = list(args[items_index])
+            keys = [_hash_key(key_prefix, f"{key_prefix}:{key_fn(item)}") for item in items]
+            results = await cache_get_many_json(keys)
+
+            missing = [i for i, value in enumerate(results) if value is None]
+            if not missing:
+                logger.debug("[Cache HIT] %s x%d", key_prefix, len(items))
+                return results
+
+            logger.debug("[Cache MISS] %s: %d of %d items", key_prefix, len(missing), len(items))
+            miss_args = (*args[:items_index], [items[i] for i in missing], *args[items_index + 1:])
+            fetched = await func(*miss_args, **kwargs)
+
+            client = await get_redis_client()
+            pipe = client.pipeline(transaction=False) if client is not None else None
+            for i, value in zip(missing, fetched, strict=False):
+                results[i] = value
+                _set_memory_cache(keys[i], value, ttl)
+                if pipe is not None:
+                    pipe.setex(keys[i], ttl, _dumps(value))
+            if pipe is not None:
+                try:
+                    await pipe.execute()
+                except Exception as e:
+                    logger.warning(f"⚠️  [Cache] Error writing {len(missing)} keys to Redis: {e}")
+
+            return results
+
         return wrapper
     return decorator
 
@@ -257,27 +659,101 @@ async def invalidate_cache(pattern: str):
     """
     Manually invalidate cache keys matching a pattern
 
+    Arguments are hashed into keys, so patterns select by key prefix.
+
     Args:
-        pattern: Redis key pattern (e.g., "contracts:BTC:*")
+        pattern: Redis key pattern (e.g., "contracts:btc:*")
 
     Usage:
-        await invalidate_cache("contracts:BTC:*")
+        await invalidate_cache("contracts:btc:*")
     """
+    # cached() reads this worker's in-memory tier first; other workers drop
+    # theirs when the pattern is published below
+    _evict_memory_cache(pattern)
+
     client = await get_redis_client()
     if client is None:
         return
 
     try:
-        keys = await client.keys(pattern)
-        if keys:
-            await client.delete(*keys)
-            logger.info(f"[Cache] Invalidated {len(keys)} keys matching {pattern}")
+        # SCAN walks the keyspace incrementally (KEYS blocks the server for
+        # the whole pass); UNLINK frees the values off the main thread. The
+        # UNLINKs are queued on a pipeline and sent in one round trip at the end
+        pipe = client.pipeline(transaction=False)
+        batch = []
+        async for key in client.scan_iter(match=pattern, count=INVALIDATE_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= INVALIDATE_BATCH_SIZE:
+                pipe.unlink(*batch)
+                batch = []
+        if batch:
+            pipe.unlink(*batch)
+        removed = sum(await pipe.execute())
+        if removed:
+            logger.info(f"[Cache] Invalidated {removed} keys matching {pattern}")
+        await client.publish(INVALIDATION_CHANNEL, pattern)
     except Exception as e:
         logger.warning(f"[Cache] Error invalidating keys: {e}")
 
 
+def _evict_memory_cache(pattern: str) -> None:
+    for key in fnmatch.filter(list(_memory_cache), pattern):
+        del _memory_cache[key]
+    # Invalidated values count as changed: back to the base TTL
+    for key in fnmatch.filter(list(_key_versions), pattern):
+        del _key_versions[key]
+
+
+async def _invalidation_loop() -> None:
+    while True:
+        client = await get_redis_client()
+        if client is None:
+            return
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    _evict_memory_cache(message["data"].decode())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("[Cache] Invalidation listener error, resubscribing: %s", e)
+            await asyncio.sleep(1)
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+
+def start_invalidation_listener() -> None:
+    """Start evicting this worker's in-memory entries on published invalidations."""
+    global _invalidation_task
+    if _invalidation_task is None:
+        _invalidation_task = asyncio.create_task(_invalidation_loop())
+
+
+async def stop_invalidation_listener() -> None:
+    """Stop the invalidation listener on shutdown."""
+    global _invalidation_task
+    if _invalidation_task is not None:
+        _invalidation_task.cancel()
+        await asyncio.gather(_invalidation_task, return_exceptions=True)
+        _invalidation_task = None
+
+
+# INFO is comparatively expensive on the server; monitoring polls share a snapshot
+CACHE_STATS_TTL = 5  # seconds
+_cache_stats: tuple[dict[str, Any], float] | None = None  # (stats, monotonic expiry)
+
+
 async def get_cache_stats() -> dict[str, Any]:
     """Get cache statistics for monitoring"""
+    global _cache_stats
+    if _cache_stats is not None and time.monotonic() < _cache_stats[1]:
+        return _cache_stats[0]
+
     client = await get_redis_client()
     if client is None:
         return {
@@ -290,18 +766,25 @@ async def get_cache_stats() -> dict[str, Any]:
         }
 
     try:
-        info = await client.info("stats")
-        return {
+        # One round trip; used_memory is reported in the memory section
+        pipe = client.pipeline(transaction=False)
+        pipe.info("stats")
+        pipe.info("memory")
+        pipe.dbsize()
+        info, memory, total_keys = await pipe.execute()
+        stats = {
             "available": True,
-            "total_keys": await client.dbsize(),
+            "total_keys": total_keys,
             "hits": info.get("keyspace_hits", 0),
             "misses": info.get("keyspace_misses", 0),
             "hit_rate": (
                 info.get("keyspace_hits", 0) /
                 max(info.get("keyspace_hits", 0) + info.get("keyspace_misses", 0), 1)
             ) * 100,
-            "memory_used_mb": info.get("used_memory", 0) / 1024 / 1024,
+            "memory_used_mb": memory.get("used_memory", 0) / 1024 / 1024,
         }
+        _cache_stats = (stats, time.monotonic() + CACHE_STATS_TTL)
+        return stats
     except Exception as e:
         logger.warning(f"[Cache] Error getting stats: {e}")
         return {
@@ -0,0 +1,49 @@
+"""
+Shared wall-clock timestamp for hot paths.
+
+Formatting ``datetime.now(UTC).isoformat()`` for every price poll and SSE
+event adds up when broadcast to many clients. A background task refreshes
+a module-level ISO string every TICK_INTERVAL seconds and hot paths read it.
+"""
+
+import asyncio
+from datetime import UTC, datetime
+
+TICK_INTERVAL = 0.1  # seconds; timestamps may lag wall clock by at most this much
+
+_now_iso: str | None = None
+_tick_task: asyncio.Task | None = None
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (refreshed every TICK_INTERVAL)."""
+    if _now_iso is None:
+        # Ticker not running (scripts, tests): format on demand
+        return datetime.now(UTC).isoformat()
+    return _now_iso
+
+
+async def _tick() -> None:
+    global _now_iso
+    try:
+        while True:
+            _now_iso = datetime.now(UTC).isoformat()
+            await asyncio.sleep(TICK_INTERVAL)
+    finally:
+        _now_iso = None
+
+
+def start_clock() -> None:
+    """Start the background timestamp ticker."""
+    global _tick_task
+    if _tick_task is None:
+        _tick_task = asyncio.create_task(_tick())
+
+
+async def stop_clock() -> None:
+    """Stop the background timestamp ticker on shutdown."""
+    global _tick_task
+    if _tick_task is not None:
+        _tick_task.cancel()
+        await asyncio.gather(_tick_task, return_exceptions=True)
+        _tick_task = None
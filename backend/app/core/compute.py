@@ -0,0 +1,45 @@
+"""
+Process pool for CPU-bound work.
+
+Statistics over weeks of hourly candles hold the GIL long enough to stall
+every other request on the event loop, and a thread pool wouldn't help for
+the same reason. ``run_cpu`` hands such work to a small process pool started
+in the app lifespan, and runs it inline when the pool isn't running
+(scripts, tests).
+"""
+
+import asyncio
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+COMPUTE_WORKERS = 2
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def start_compute_pool() -> None:
+    """Start the compute process pool."""
+    global _pool
+    if _pool is None:
+        # forkserver: workers don't inherit the server's threads and sockets
+        _pool = ProcessPoolExecutor(
+            max_workers=COMPUTE_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+
+
+def stop_compute_pool() -> None:
+    """Stop the compute process pool on shutdown."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def run_cpu(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a picklable function in the compute pool (inline if it isn't running)."""
+    if _pool is None:
+        return func(*args)
+    return await asyncio.get_running_loop().run_in_executor(_pool, func, *args)
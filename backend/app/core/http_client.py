@@ -195,8 +195,11 @@ async def get_http_client() -> httpx.AsyncClient:
     global _http_client
 
     if _http_client is None:
-        # Create client with connection pooling and optimized settings
+        # Create client with connection pooling and optimized settings.
+        # HTTP/2 (negotiated via ALPN, HTTP/1.1 otherwise) lets concurrent
+        # requests to one API share a single connection
         _http_client = httpx.AsyncClient(
+            http2=True,
             limits=httpx.Limits(
                 max_connections=100,  # Total connection pool size
                 max_keepalive_connections=20,  # Connections to keep alive
@@ -296,6 +299,10 @@ class ServiceUnavailableError(Exception):
         super().__init__(f"{message}: {service_name}")
 
 
+class UpstreamUnavailableError(Exception):
+    """Raised when upstream market data can't be fetched; the app maps it to a 503."""
+
+
 async def resilient_request(
     breaker: CircuitBreaker,
     method: str,
@@ -0,0 +1,48 @@
+"""
+Non-blocking application logging.
+
+Handlers that write to a terminal or pipe can block the event loop when the
+reader falls behind. The root logger therefore only gets a QueueHandler;
+a QueueListener thread drains the queue into a stream handler.
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core.config import settings
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+def start_logging() -> None:
+    """Route app logs through a queue to stderr (DEBUG level with settings.debug)."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(logging.DEBUG if settings.debug else logging.INFO)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread on shutdown."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
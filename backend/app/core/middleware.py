@@ -0,0 +1,198 @@
+"""
+Pure ASGI middleware for the Basilisk API.
+
+These run on every request, so they avoid Starlette's Request/Response
+objects and precompute all static header values once at startup.
+"""
+
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+import orjson
+from starlette.middleware.gzip import GZipMiddleware
+
+logger = logging.getLogger(__name__)
+
+Scope = dict[str, Any]
+Message = dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# Methods advertised when all methods are allowed. Browsers ignore a literal
+# "*" on credentialed requests, so the explicit list is sent instead.
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+PREFLIGHT_MAX_AGE = 600
+
+_DISALLOWED_BODY = b"Disallowed CORS origin"
+
+
+class FastCORSMiddleware:
+    """
+    Minimal CORS middleware with precomputed header tuples.
+
+    Behaves like Starlette's CORSMiddleware configured with
+    allow_credentials=True, allow_methods=["*"], allow_headers=["*"] and the
+    given expose_headers: allowed origins are echoed back, preflight requests
+    are answered directly, and requests without an Origin header pass through
+    untouched.
+    """
+
+    def __init__(
+        self, app: ASGIApp, origins: Iterable[str], expose_headers: Iterable[str] = ()
+    ) -> None:
+        self.app = app
+        self.allow_all_origins = "*" in origins
+        self.allowed = frozenset(origin.encode("latin-1") for origin in origins)
+
+        self._simple_headers = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        # Response headers browsers may read cross-origin (e.g. pagination cursors)
+        exposed = ", ".join(expose_headers)
+        if exposed:
+            self._simple_headers.append(
+                (b"access-control-expose-headers", exposed.encode("latin-1"))
+            )
+        self._preflight_headers = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"access-control-allow-methods", ", ".join(ALL_METHODS).encode("latin-1")),
+            (b"access-control-max-age", str(PREFLIGHT_MAX_AGE).encode("latin-1")),
+            (b"vary", b"Origin"),
+            (b"content-length", b"0"),
+        ]
+
+    def _is_allowed(self, origin: bytes) -> bool:
+        return self.allow_all_origins or origin in self.allowed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            await self._preflight(origin, request_headers, send)
+            return
+
+        if not self._is_allowed(origin):
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [(b"access-control-allow-origin", origin), *self._simple_headers]
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(
+        self, origin: bytes, request_headers: bytes | None, send: Send
+    ) -> None:
+        if not self._is_allowed(origin):
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(_DISALLOWED_BODY)).encode("latin-1")),
+                ],
+            })
+            await send({"type": "http.response.body", "body": _DISALLOWED_BODY})
+            return
+
+        headers = [(b"access-control-allow-origin", origin), *self._preflight_headers]
+        if request_headers:
+            # allow_headers=["*"]: mirror whatever the browser asked for
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+
+class ErrorResponseMiddleware:
+    """
+    Turn unhandled route exceptions into a 500 {"detail": ...} JSON response.
+
+    Starlette runs app-level Exception handlers in ServerErrorMiddleware,
+    outside every user middleware, so those 500s would leave without CORS
+    headers and browsers would only see an opaque CORS failure. Added
+    before FastCORSMiddleware, this sits inside it instead.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking)
+        except Exception as exc:
+            if response_started:
+                raise
+            logger.exception("Unhandled error on %s %s", scope["method"], scope["path"])
+            body = orjson.dumps({"detail": str(exc)})
+            await send({
+                "type": "http.response.start",
+                "status": 500,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+
+
+class SelectiveGZipMiddleware:
+    """
+    Gzip responses except for excluded path prefixes (e.g. SSE streams).
+
+    Starlette's GZipMiddleware is already pure ASGI; this only adds a cheap
+    prefix check so long-lived event streams are never buffered for compression.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        compresslevel: int = 5,
+        exclude_prefixes: Iterable[str] = (),
+    ) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.exclude_prefixes = tuple(exclude_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not scope["path"].startswith(self.exclude_prefixes):
+            await self.gzip(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
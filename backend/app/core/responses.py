@@ -0,0 +1,24 @@
+"""
+orjson response class for routes that return raw payloads.
+
+Routes with a response model are left to FastAPI, which serializes them
+through Pydantic. Handlers that build large dict/list payloads themselves
+(candles, statistics, contracts) return ORJSONResponse to encode them once
+with orjson. FastAPI's own ORJSONResponse is deprecated in current
+releases, so this one is defined here.
+"""
+
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+# int-keyed dicts (stats by hour) and numpy scalars/arrays are allowed
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
@@ -0,0 +1,115 @@
+"""
+Minimal Server-Sent Events response.
+
+Writes SSE framing straight to the ASGI ``send`` callable instead of going
+through sse-starlette, so each event costs one bytes format and one send.
+Generators yield ``{"event": name, "data": str | bytes}`` dicts (data already
+JSON-encoded), or frames pre-built with ``encode_event`` so an event fanned
+out to many subscribers is framed once rather than once per connection.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Mapping
+from typing import Any
+
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+PING_FRAME = b": ping\n\n"
+
+# Headers every stream needs: no proxy buffering, no caching
+_STREAM_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # Disable nginx buffering
+}
+
+
+def encode_event(event: Mapping[str, Any]) -> bytes:
+    """Frame a single ``{"event", "data"}`` dict as SSE bytes."""
+    name = event.get("event")
+    data = event["data"].encode() if isinstance(event["data"], str) else event["data"]
+    if name:
+        return b"event: %s\ndata: %s\n\n" % (name.encode(), data)
+    return b"data: %s\n\n" % data
+
+
+class SSEResponse(Response):
+    """
+    Stream events from an async generator as ``text/event-stream``.
+
+    A comment ping is written whenever no event has been sent for ``ping``
+    seconds, and the generator is closed as soon as the client disconnects.
+    """
+
+    media_type = "text/event-stream"
+
+    def __init__(
+        self,
+        events: AsyncIterator[Mapping[str, Any] | bytes],
+        ping: float = 15.0,
+        headers: Mapping[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        self.events = events
+        self.ping = ping
+        self.status_code = 200
+        self.background = background
+        self.init_headers({**_STREAM_HEADERS, **(headers or {})})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+
+        writer = asyncio.create_task(self._write(send))
+        watcher = asyncio.create_task(self._wait_for_disconnect(receive))
+        try:
+            await asyncio.wait((writer, watcher), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            writer.cancel()
+            watcher.cancel()
+            await asyncio.gather(writer, watcher, return_exceptions=True)
+            aclose = getattr(self.events, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        if writer.done() and not writer.cancelled() and writer.exception() is not None:
+            raise writer.exception()
+
+        if self.background is not None:
+            await self.background()
+
+    async def _write(self, send: Send) -> None:
+        iterator = aiter(self.events)
+        next_event: asyncio.Task | None = None
+        try:
+            while True:
+                next_event = asyncio.ensure_future(anext(iterator))
+                # Keep waiting on the same pending anext() so a ping never
+                # interrupts the generator mid-await
+                while not next_event.done():
+                    done, _ = await asyncio.wait((next_event,), timeout=self.ping)
+                    if not done:
+                        await send({"type": "http.response.body", "body": PING_FRAME, "more_body": True})
+                try:
+                    event = next_event.result()
+                except StopAsyncIteration:
+                    break
+                frame = event if isinstance(event, bytes) else encode_event(event)
+                await send({"type": "http.response.body", "body": frame, "more_body": True})
+        finally:
+            if next_event is not None and not next_event.done():
+                next_event.cancel()
+                await asyncio.gather(next_event, return_exceptions=True)
+
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    @staticmethod
+    async def _wait_for_disconnect(receive: Receive) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
@@ -15,7 +15,7 @@ import httpx
 from pybreaker import CircuitBreaker
 
 from app.core.config import settings
-from app.core.http_client import resilient_request
+from app.core.http_client import get_http_client, resilient_request
 from app.data.dflow_types import (
     DFlowEvent,
     DFlowFill,
@@ -75,10 +75,10 @@ class DFlowClient:
         url = f"{self.trade_api_url}{path}"
         headers = self._get_headers()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method, url, headers=headers, params=params, json=json, timeout=15.0,
-            )
+        client = await get_http_client()
+        response = await client.request(
+            method, url, headers=headers, params=params, json=json, timeout=15.0,
+        )
 
         response.raise_for_status()
         return response.json()
@@ -94,10 +94,10 @@ class DFlowClient:
         url = f"{self.metadata_api_url}/api/v1{path}"
         headers = self._get_headers()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method, url, headers=headers, params=params, json=json, timeout=15.0,
-            )
+        client = await get_http_client()
+        response = await client.request(
+            method, url, headers=headers, params=params, json=json, timeout=15.0,
+        )
 
         response.raise_for_status()
         return response.json()
@@ -457,3 +457,15 @@ class KalshiClientWithCredentials(KalshiClient):
             backend=default_backend(),
         )
         return private_key
+
+
+# Singleton instance (loads and parses the private key once)
+_kalshi_client: KalshiClient | None = None
+
+
+def get_kalshi_client() -> KalshiClient:
+    """Get or create the settings-configured Kalshi client singleton."""
+    global _kalshi_client
+    if _kalshi_client is None:
+        _kalshi_client = KalshiClient()
+    return _kalshi_client
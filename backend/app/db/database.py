@@ -2,7 +2,9 @@
 
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import Connection
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
@@ -10,11 +12,20 @@ from app.core.config import settings
 # Convert SQLite URL to async version
 DATABASE_URL = settings.database_url.replace("sqlite:///", "sqlite+aiosqlite:///")
 
+# Connection pool sizing: requests hold a connection only while doing ORM work
+# (TradeExecutor releases it before awaiting Kalshi), so a small pool goes far
+DB_POOL_SIZE = 10
+DB_MAX_OVERFLOW = 20
+
 # Create async engine
 engine = create_async_engine(
     DATABASE_URL,
     echo=settings.debug,
     future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
 )
 
 # Create async session factory
@@ -44,7 +55,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def _create_missing_indexes(sync_conn: Connection) -> None:
+    """
+    CREATE INDEX IF NOT EXISTS for every model index.
+
+    create_all skips tables that already exist, including their indexes, so
+    indexes added to a model later would never reach existing databases.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
 async def init_db() -> None:
-    """Initialize database tables."""
+    """Initialize database tables and indexes."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
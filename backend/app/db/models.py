@@ -1,9 +1,11 @@
 """Database models for Basilisk."""
 
+import json
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
-from sqlalchemy import Boolean, Float, Integer, String, Text
+from sqlalchemy import Boolean, Float, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.database import Base
@@ -143,6 +145,12 @@ class Trade(Base):
     """Trade history with P&L tracking."""
 
     __tablename__ = "trades"
+    # Keyset pagination of trade history (newest first), and P&L summaries
+    # over closed trades by close time
+    __table_args__ = (
+        Index("ix_trades_opened_at_id", "opened_at", "id"),
+        Index("ix_trades_status_closed_at", "status", "closed_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     signal_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
@@ -178,6 +186,15 @@ class Trade(Base):
     expiry_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
 
 
+@lru_cache(maxsize=64)
+def decode_alert_assets(raw: str | None) -> tuple[str, ...] | None:
+    """Decode a stored alert_assets JSON list, memoized per distinct value (None if malformed)."""
+    try:
+        return tuple(json.loads(raw))
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
 class UserPreferences(Base):
     """User preferences and notification settings (single user for now)."""
 
@@ -206,6 +223,11 @@ class UserPreferences(Base):
         default=datetime.utcnow, onupdate=datetime.utcnow
     )
 
+    @property
+    def alert_assets_list(self) -> tuple[str, ...] | None:
+        """Decoded alert_assets; the JSON is parsed once per distinct stored value."""
+        return decode_alert_assets(self.alert_assets)
+
 
 class PushLog(Base):
     """Push notification log for debugging."""
@@ -3,10 +3,11 @@
 from datetime import datetime
 from typing import Any
 
-import httpx
 import numpy as np
 from scipy.stats import norm
 
+from app.core.http_client import get_http_client
+
 
 class VolatilityRegime:
     """
@@ -45,52 +46,52 @@ class VolatilityRegime:
             url = f"{self.deribit_api}/public/get_index"
             params = {"currency": currency}
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, timeout=10.0)
-                response.raise_for_status()
-                data = response.json()
-
-                # Extract the DVOL value from the indices
-                # The response contains various indices, we want the DVOL one
-                if "result" in data:
-                    # DVOL is typically labeled as {currency}_DVOL
-                    dvol_key = f"{currency}_DVOL"
-
-                    # Try to find DVOL in the result
-                    # Different API responses may structure this differently
-                    result = data["result"]
-
-                    # If result is a dict with the DVOL key
-                    if isinstance(result, dict) and dvol_key in result:
-                        dvol_value = float(result[dvol_key])
-                        # DVOL is typically expressed as percentage, convert to decimal
-                        return dvol_value / 100.0 if dvol_value > 2 else dvol_value
-
-                    # Alternative: fetch from volatility index data endpoint
-                    # This endpoint gives us historical DVOL values
-                    vol_url = f"{self.deribit_api}/public/get_volatility_index_data"
-                    vol_params = {
-                        "currency": currency,
-                        "resolution": "60",  # 1 hour resolution
-                        "start_timestamp": int(datetime.now().timestamp() * 1000) - 3600000,  # 1 hour ago
-                        "end_timestamp": int(datetime.now().timestamp() * 1000),
-                    }
-
-                    vol_response = await client.get(vol_url, params=vol_params, timeout=10.0)
-                    vol_response.raise_for_status()
-                    vol_data = vol_response.json()
-
-                    if "result" in vol_data and "data" in vol_data["result"]:
-                        # Get the most recent DVOL value
-                        dvol_points = vol_data["result"]["data"]
-                        if dvol_points:
-                            # Last data point: [timestamp, dvol_value]
-                            latest_dvol = dvol_points[-1][1]
-                            # DVOL is expressed as percentage
-                            return float(latest_dvol) / 100.0
-
-                print(f"⚠️  Deribit response doesn't contain expected DVOL data")
-                return None
+            client = await get_http_client()
+            response = await client.get(url, params=params, timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
+
+            # Extract the DVOL value from the indices
+            # The response contains various indices, we want the DVOL one
+            if "result" in data:
+                # DVOL is typically labeled as {currency}_DVOL
+                dvol_key = f"{currency}_DVOL"
+
+                # Try to find DVOL in the result
+                # Different API responses may structure this differently
+                result = data["result"]
+
+                # If result is a dict with the DVOL key
+                if isinstance(result, dict) and dvol_key in result:
+                    dvol_value = float(result[dvol_key])
+                    # DVOL is typically expressed as percentage, convert to decimal
+                    return dvol_value / 100.0 if dvol_value > 2 else dvol_value
+
+                # Alternative: fetch from volatility index data endpoint
+                # This endpoint gives us historical DVOL values
+                vol_url = f"{self.deribit_api}/public/get_volatility_index_data"
+                vol_params = {
+                    "currency": currency,
+                    "resolution": "60",  # 1 hour resolution
+                    "start_timestamp": int(datetime.now().timestamp() * 1000) - 3600000,  # 1 hour ago
+                    "end_timestamp": int(datetime.now().timestamp() * 1000),
+                }
+
+                vol_response = await client.get(vol_url, params=vol_params, timeout=10.0)
+                vol_response.raise_for_status()
+                vol_data = vol_response.json()
+
+                if "result" in vol_data and "data" in vol_data["result"]:
+                    # Get the most recent DVOL value
+                    dvol_points = vol_data["result"]["data"]
+                    if dvol_points:
+                        # Last data point: [timestamp, dvol_value]
+                        latest_dvol = dvol_points[-1][1]
+                        # DVOL is expressed as percentage
+                        return float(latest_dvol) / 100.0
+
+            print(f"⚠️  Deribit response doesn't contain expected DVOL data")
+            return None
 
         except Exception as e:
             print(f"⚠️  Failed to fetch Deribit DVOL: {e}")
@@ -130,80 +131,80 @@ class VolatilityRegime:
             return await self.fetch_deribit_dvol(currency)
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Get available instruments to find nearest expiry
-                url = f"{self.deribit_api}/public/get_instruments"
-                params = {
-                    "currency": currency,
-                    "kind": "option",
-                    "expired": "false",
-                }
-                response = await client.get(url, params=params, timeout=10.0)
-                response.raise_for_status()
-                data = response.json()
-
-                instruments = data.get("result", [])
-                if not instruments:
-                    print(f"⚠️  No Deribit options found for {currency}")
-                    return None
-
-                # Find nearest expiry call options close to ATM
-                now_ms = int(datetime.now().timestamp() * 1000)
-                best_instrument = None
-                best_distance = float("inf")
-
-                for inst in instruments:
-                    if inst.get("option_type") != "call":
-                        continue
-                    strike = inst.get("strike")
-                    expiry = inst.get("expiration_timestamp", 0)
-                    if not strike or expiry <= now_ms:
-                        continue
-
-                    # Prefer nearest expiry that's at least 1 day out
-                    time_to_expiry_ms = expiry - now_ms
-                    if time_to_expiry_ms < 86400000:  # Skip < 1 day
-                        continue
-
-                    # Find closest to ATM
-                    strike_distance = abs(strike - current_price) / current_price
-                    # Weight: prefer close-to-ATM and near-term
-                    distance = strike_distance + (time_to_expiry_ms / 1e12)
-
-                    if distance < best_distance:
-                        best_distance = distance
-                        best_instrument = inst
-
-                if not best_instrument:
-                    print(f"⚠️  No suitable ATM option found for {currency}")
-                    return None
-
-                instrument_name = best_instrument["instrument_name"]
-
-                # Fetch the order book / ticker to get mark IV
-                ticker_url = f"{self.deribit_api}/public/ticker"
-                ticker_params = {"instrument_name": instrument_name}
-                ticker_response = await client.get(
-                    ticker_url, params=ticker_params, timeout=10.0
-                )
-                ticker_response.raise_for_status()
-                ticker_data = ticker_response.json()
-
-                result = ticker_data.get("result", {})
-                mark_iv = result.get("mark_iv")
-
-                if mark_iv is not None:
-                    # mark_iv is in percentage (e.g., 68.5 = 68.5%)
-                    iv = float(mark_iv) / 100.0
-                    print(
-                        f"✓ Deribit {currency} ATM IV: {iv:.1%} "
-                        f"(from {instrument_name})"
-                    )
-                    return iv
-
-                print(f"⚠️  No mark IV in Deribit ticker for {instrument_name}")
+            client = await get_http_client()
+            # Get available instruments to find nearest expiry
+            url = f"{self.deribit_api}/public/get_instruments"
+            params = {
+                "currency": currency,
+                "kind": "option",
+                "expired": "false",
+            }
+            response = await client.get(url, params=params, timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
+
+            instruments = data.get("result", [])
+            if not instruments:
+                print(f"⚠️  No Deribit options found for {currency}")
+                return None
+
+            # Find nearest expiry call options close to ATM
+            now_ms = int(datetime.now().timestamp() * 1000)
+            best_instrument = None
+            best_distance = float("inf")
+
+            for inst in instruments:
+                if inst.get("option_type") != "call":
+                    continue
+                strike = inst.get("strike")
+                expiry = inst.get("expiration_timestamp", 0)
+                if not strike or expiry <= now_ms:
+                    continue
+
+                # Prefer nearest expiry that's at least 1 day out
+                time_to_expiry_ms = expiry - now_ms
+                if time_to_expiry_ms < 86400000:  # Skip < 1 day
+                    continue
+
+                # Find closest to ATM
+                strike_distance = abs(strike - current_price) / current_price
+                # Weight: prefer close-to-ATM and near-term
+                distance = strike_distance + (time_to_expiry_ms / 1e12)
+
+                if distance < best_distance:
+                    best_distance = distance
+                    best_instrument = inst
+
+            if not best_instrument:
+                print(f"⚠️  No suitable ATM option found for {currency}")
                 return None
 
+            instrument_name = best_instrument["instrument_name"]
+
+            # Fetch the order book / ticker to get mark IV
+            ticker_url = f"{self.deribit_api}/public/ticker"
+            ticker_params = {"instrument_name": instrument_name}
+            ticker_response = await client.get(
+                ticker_url, params=ticker_params, timeout=10.0
+            )
+            ticker_response.raise_for_status()
+            ticker_data = ticker_response.json()
+
+            result = ticker_data.get("result", {})
+            mark_iv = result.get("mark_iv")
+
+            if mark_iv is not None:
+                # mark_iv is in percentage (e.g., 68.5 = 68.5%)
+                iv = float(mark_iv) / 100.0
+                print(
+                    f"✓ Deribit {currency} ATM IV: {iv:.1%} "
+                    f"(from {instrument_name})"
+                )
+                return iv
+
+            print(f"⚠️  No mark IV in Deribit ticker for {instrument_name}")
+            return None
+
         except Exception as e:
             print(f"⚠️  Failed to fetch Deribit options IV for {currency}: {e}")
             return None
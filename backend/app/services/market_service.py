@@ -1,5 +1,6 @@
 """Service for fetching and processing market data."""
 
+import logging
 from datetime import UTC, datetime
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -10,20 +11,22 @@ from app.data.bitcoin_client import BitcoinPriceClient
 from app.data.dflow_client import DFlowClient, get_dflow_client
 from app.data.ethereum_client import EthereumPriceClient
 from app.data.generic_price_client import GenericPriceClient
-from app.data.kalshi_client import KalshiClient
+from app.data.kalshi_client import get_kalshi_client
 from app.data.ripple_client import RipplePriceClient
 from app.data.solana_client import SolanaPriceClient
 from app.models.order_flow import OrderFlowAnalyzer
 from app.models.predictor import ProbabilityPredictor
 from app.models.volatility import VolatilityRegime
 
+logger = logging.getLogger(__name__)
+
 
 class MarketService:
     """Service for fetching and processing market data."""
 
     def __init__(self) -> None:
         """Initialize market service."""
-        self.kalshi_client = KalshiClient()
+        self.kalshi_client = get_kalshi_client()
         self.btc_client = BitcoinPriceClient()
         self.eth_client = EthereumPriceClient()
         self.xrp_client = RipplePriceClient()
@@ -58,28 +61,28 @@ class MarketService:
         self._mint_cache: dict[str, dict[str, str]] = {}
 
     @cached(ttl=120, key_prefix="contracts:btc")
-    async def get_bitcoin_hourly_contracts(self) -> list[dict[str, Any]]:
+    async def get_bitcoin_hourly_contracts(self) -> dict[str, Any]:
         """
         Fetch Bitcoin hourly contracts from Kalshi and process them.
 
         Returns:
-            List of processed contract data with signals
+            Dict with "contracts" (processed contract data with signals) and "volatility"
         """
         # Get current BTC price
         try:
             current_btc_price = await self.btc_client.get_spot_price()
-            print(f"✓ Successfully fetched BTC price: ${current_btc_price:,.2f}")
+            logger.debug("Successfully fetched BTC price: $%.2f", current_btc_price)
         except Exception as e:
-            print(f"✗ Failed to fetch BTC price: {e}")
+            logger.warning("Failed to fetch BTC price: %s", e)
             current_btc_price = 95000.0  # Fallback price
 
         # Fetch historical candles for volatility analysis
         try:
-            print("Fetching historical BTC candles for volatility analysis...")
+            logger.debug("Fetching historical BTC candles for volatility analysis...")
             candles = await self.btc_client.get_historical_candles(hours=168)  # 1 week
-            print(f"✓ Fetched {len(candles)} hourly candles")
+            logger.debug("Fetched %d hourly candles", len(candles))
         except Exception as e:
-            print(f"✗ Failed to fetch historical candles: {e}")
+            logger.warning("Failed to fetch historical candles: %s", e)
             candles = []
 
         now_utc = datetime.now(UTC)
@@ -88,7 +91,7 @@ class MarketService:
 
         # Fetch KXBTCD markets from Kalshi (timed contracts)
         try:
-            print("Fetching KXBTCD Bitcoin markets from Kalshi...")
+            logger.debug("Fetching KXBTCD Bitcoin markets from Kalshi...")
             markets: list[dict[str, Any]] = []
             cursor: str | None = None
             max_pages = 10  # Increased to ensure we get all contracts
@@ -109,8 +112,9 @@ class MarketService:
                     if cursor and len(cursor) > 6
                     else (cursor or "<none>")
                 )
-                print(
-                    f"  Page {page}: {len(page_markets)} markets (next cursor: {page_label})"
+                logger.debug(
+                    "Page %s: %d markets (next cursor: %s)",
+                    page, len(page_markets), page_label,
                 )
 
                 # Track if we found today's contracts, but don't break early
@@ -123,13 +127,14 @@ class MarketService:
                 if not cursor:
                     break
 
-            print(
-                f"✓ Received {len(markets)} KXBTCD markets from Kalshi across {page} page(s)"
+            logger.debug(
+                "Received %d KXBTCD markets from Kalshi across %s page(s)",
+                len(markets), page,
             )
 
             if not found_today:
-                print(
-                    "  ⚠️  Still no active same-day contracts after pagination; will fall back to earliest future expiry."
+                logger.warning(
+                    "Still no active same-day contracts after pagination; will fall back to earliest future expiry."
                 )
 
             # Debug: Check market statuses
@@ -137,18 +142,18 @@ class MarketService:
             for m in markets[:20]:
                 status = m.get("status", "unknown")
                 status_counts[status] = status_counts.get(status, 0) + 1
-            print(f"  Market statuses in first 20: {status_counts}")
+            logger.debug("Market statuses in first 20: %s", status_counts)
         except Exception as e:
-            print(f"✗ Failed to fetch Kalshi markets: {e}")
-            print("  Tip: Set up Kalshi API credentials (see KALSHI_SETUP.md)")
-            print("  Returning mock data for now...")
+            logger.warning("Failed to fetch Kalshi markets: %s", e)
+            logger.debug("Tip: Set up Kalshi API credentials (see KALSHI_SETUP.md)")
+            logger.debug("Returning mock data for now...")
             return self._get_mock_contracts(current_btc_price)
 
         # Analyze all contracts - no filters yet
 
-        print(f"\n🔍 Current time (UTC): {now_utc.strftime('%Y-%m-%d %H:%M:%S %Z')}")
-        print(f"🔍 Current time (EST): {now_est.strftime('%Y-%m-%d %I:%M %p %Z')}")
-        print(f"🔍 Current BTC price: ${current_btc_price:,.2f}")
+        logger.debug("Current time (UTC): %s", now_utc.strftime("%Y-%m-%d %H:%M:%S %Z"))
+        logger.debug("Current time (EST): %s", now_est.strftime("%Y-%m-%d %I:%M %p %Z"))
+        logger.debug("Current BTC price: $%.2f", current_btc_price)
 
         # Group contracts by expiry time
         from collections import defaultdict
@@ -159,8 +164,9 @@ class MarketService:
 
         # Debug: Look for today's contracts (including closed ones)
         today_label = now_est.strftime("%b %d")
-        print(
-            f"\n🔍 Searching for today's contracts ({today_label}) in all {len(markets)} KXBTCD markets..."
+        logger.debug(
+            "Searching for today's contracts (%s) in all %d KXBTCD markets...",
+            today_label, len(markets),
         )
         today_est = now_est.date()
         today_contracts = []
@@ -181,16 +187,15 @@ class MarketService:
         # Show today's contracts
         if today_contracts:
             today_contracts.sort(key=lambda x: x[0])
-            print(
-                f"\n📅 Found {len(today_contracts)} contracts for TODAY ({today_label}):"
-            )
+            logger.debug("Found %d contracts for TODAY (%s):", len(today_contracts), today_label)
             for expiry_est, ticker, status, is_future in today_contracts[:15]:
                 future_mark = "✓" if is_future else "✗ PAST"
-                print(
-                    f"  {future_mark} {expiry_est.strftime('%I%p %Z')} - {ticker} [{status}]"
+                logger.debug(
+                    "%s %s - %s [%s]",
+                    future_mark, expiry_est.strftime("%I%p %Z"), ticker, status,
                 )
         else:
-            print(f"  ⚠️  No contracts found for today ({today_label})!")
+            logger.warning("No contracts found for today (%s)!", today_label)
 
         for market in markets:
             expiry_time_str = market.get("close_time") or market.get("expiration_time")
@@ -214,32 +219,39 @@ class MarketService:
             # Group by exact expiry time
             contracts_by_expiry[expiry_utc].append(market)
 
-        print(f"\n📊 Contracts: {expired_count} expired, {active_count} active")
+        logger.debug("Contracts: %s expired, %s active", expired_count, active_count)
 
         # Show upcoming expiry times
-        print("\n📅 Upcoming expiry times (next 10):")
+        logger.debug("Upcoming expiry times (next 10):")
         sorted_expiries = sorted(contracts_by_expiry.items(), key=lambda x: x[0])
 
         # Debug: Check for 11AM contracts specifically
         current_hour_est = now_est.hour
         next_hour_est = (current_hour_est + 1) % 24
-        print(f"  🔍 Current hour (EST): {current_hour_est} (looking for {next_hour_est}:00 contracts)")
+        logger.debug(
+            "Current hour (EST): %s (looking for %s:00 contracts)",
+            current_hour_est, next_hour_est,
+        )
 
         eleven_am_contracts = [
             (exp, markets) for exp, markets in sorted_expiries
             if exp.astimezone(est).hour == 11 and exp.astimezone(est).date() == today_est
         ]
         if eleven_am_contracts:
-            print(f"  ✓ Found {len(eleven_am_contracts)} groups of 11AM EST contracts")
+            logger.debug("Found %d groups of 11AM EST contracts", len(eleven_am_contracts))
         else:
-            print(f"  ⚠️  No 11AM EST contracts found in data")
+            logger.warning("No 11AM EST contracts found in data")
 
         for expiry_utc, contract_list in sorted_expiries[:10]:
             expiry_est = expiry_utc.astimezone(est)
             hours_away = (expiry_utc - now_utc).total_seconds() / 3600
 
-            print(
-                f"  {expiry_est.strftime('%I%p %Z')} ({expiry_utc.strftime('%H:%M UTC')}) - {hours_away:.1f}h away - {len(contract_list)} contracts"
+            logger.debug(
+                "%s (%s) - %.1fh away - %d contracts",
+                expiry_est.strftime("%I%p %Z"),
+                expiry_utc.strftime("%H:%M UTC"),
+                hours_away,
+                len(contract_list),
             )
 
         # Get contracts for the next available expiry
@@ -255,13 +267,14 @@ class MarketService:
                 expiry_est = selected_expiry.astimezone(est)
                 expiry_label = expiry_est.strftime('%b %d %I%p %Z')
                 expiry_utc_label = selected_expiry.strftime('%H:%M UTC')
-                print(
-                    f"\n✓ Using {len(btc_contracts)} contracts expiring {expiry_label} ({expiry_utc_label})"
+                logger.debug(
+                    "Using %d contracts expiring %s (%s)",
+                    len(btc_contracts), expiry_label, expiry_utc_label,
                 )
 
         # Show strikes for next expiry
         if btc_contracts:
-            print("\n💰 Strikes available:")
+            logger.debug("Strikes available:")
             for i, market in enumerate(btc_contracts[:20]):
                 ticker = market.get("ticker")
                 strike = self._extract_strike_price(ticker, market.get("title", ""))
@@ -273,27 +286,31 @@ class MarketService:
                 if expiry_str and i < 3:  # Only show first 3
                     expiry_dt = datetime.fromisoformat(expiry_str.replace("Z", "+00:00"))
                     expiry_est = expiry_dt.astimezone(est)
-                    print(
-                        f"  {i+1}. {ticker} | ${strike:,.0f} ({symbol} ${abs(distance):,.0f})"
+                    logger.debug(
+                        "%s. %s | $%.0f (%s $%.0f)",
+                        i + 1, ticker, strike, symbol, abs(distance),
+                    )
+                    logger.debug(
+                        "API expiry: %s (UTC: %s)",
+                        expiry_est.strftime("%b %d %I%p %Z"), expiry_dt.strftime("%H:%M"),
                     )
-                    print(f"      API expiry: {expiry_est.strftime('%b %d %I%p %Z')} (UTC: {expiry_dt.strftime('%H:%M')})")
                 else:
-                    print(
-                        f"  {i+1}. {ticker} | ${strike:,.0f} ({symbol} ${abs(distance):,.0f})"
+                    logger.debug(
+                        "%s. %s | $%.0f (%s $%.0f)",
+                        i + 1, ticker, strike, symbol, abs(distance),
                     )
-            print()
 
         if not btc_contracts:
-            print("  ⚠️  No active Bitcoin contracts found")
-            return []
+            logger.warning("No active Bitcoin contracts found")
+            return {"contracts": [], "volatility": self._get_default_volatility()}
 
         # Fetch DVOL FIRST (before processing contracts) to use for probability calculations
-        print("\n📊 Fetching Deribit DVOL for accurate probability calculations...")
+        logger.debug("Fetching Deribit DVOL for accurate probability calculations...")
         dvol = await self.vol_regime.fetch_deribit_dvol("BTC")
         if dvol is not None:
-            print(f"✓ Deribit DVOL: {dvol:.1%} (using for Black-Scholes)")
+            logger.debug("Deribit DVOL: %.1f%% (using for Black-Scholes)", dvol * 100)
         else:
-            print("⚠️  Deribit DVOL unavailable, falling back to heuristic model")
+            logger.warning("Deribit DVOL unavailable, falling back to heuristic model")
 
         # Process each contract WITH DVOL (skip order book initially for speed)
         processed_contracts = []
@@ -305,38 +322,38 @@ class MarketService:
                 if contract_data:
                     processed_contracts.append(contract_data)
             except Exception as e:
-                print(f"✗ Error processing contract {market.get('ticker')}: {e}")
+                logger.warning("Error processing contract %s: %s", market.get("ticker"), e)
                 continue
 
         # Run full volatility analysis after contracts processed
         volatility_data = {}
         if candles and processed_contracts:
             try:
-                print("\n📊 Running volatility analysis...")
+                logger.debug("Running volatility analysis...")
                 volatility_data = await self.vol_regime.analyze_volatility(
                     candles, processed_contracts, current_btc_price, currency="BTC"
                 )
-                print(f"✓ Volatility Regime: {volatility_data.get('regime', 'UNKNOWN')}")
+                logger.debug("Volatility Regime: %s", volatility_data.get("regime", "UNKNOWN"))
 
                 # Display dual IV sources
                 deribit_iv = volatility_data.get('deribit_iv')
                 kalshi_iv = volatility_data.get('kalshi_iv')
                 mispricing = volatility_data.get('mispricing_signal', 'UNKNOWN')
 
-                print(
-                    f"  RV: {volatility_data.get('realized_vol', 0):.1%} | "
-                    f"IV (Primary): {volatility_data.get('implied_vol', 0):.1%} | "
-                    f"Premium: {volatility_data.get('vol_premium_pct', 0):.1%}"
+                logger.debug(
+                    "RV: %.1f%% | IV (Primary): %.1f%% | Premium: %.1f%%",
+                    volatility_data.get("realized_vol", 0) * 100,
+                    volatility_data.get("implied_vol", 0) * 100,
+                    volatility_data.get("vol_premium_pct", 0) * 100,
                 )
 
                 if deribit_iv is not None and kalshi_iv is not None:
-                    print(
-                        f"  Deribit DVOL: {deribit_iv:.1%} | "
-                        f"Kalshi IV: {kalshi_iv:.1%} | "
-                        f"Mispricing: {mispricing}"
+                    logger.debug(
+                        "Deribit DVOL: %.1f%% | Kalshi IV: %.1f%% | Mispricing: %s",
+                        deribit_iv * 100, kalshi_iv * 100, mispricing,
                     )
             except Exception as e:
-                print(f"✗ Failed to calculate volatility: {e}")
+                logger.warning("Failed to calculate volatility: %s", e)
                 # Provide default values if analysis fails
                 volatility_data = {
                     "realized_vol": 0.50,
@@ -351,8 +368,9 @@ class MarketService:
         processed_contracts.sort(key=lambda x: x["expected_value"], reverse=True)
         top_contracts = processed_contracts[:10]
 
-        print(
-            f"\n✓ Processed {len(processed_contracts)} contracts, returning top {len(top_contracts)} by EV"
+        logger.debug(
+            "Processed %d contracts, returning top %d by EV",
+            len(processed_contracts), len(top_contracts),
         )
 
         # Return both contracts and volatility data
@@ -707,18 +725,18 @@ class MarketService:
         # Get current ETH price
         try:
             current_eth_price = await self.eth_client.get_spot_price()
-            print(f"✓ Successfully fetched ETH price: ${current_eth_price:,.2f}")
+            logger.debug("Successfully fetched ETH price: $%.2f", current_eth_price)
         except Exception as e:
-            print(f"✗ Failed to fetch ETH price: {e}")
+            logger.warning("Failed to fetch ETH price: %s", e)
             current_eth_price = 3500.0  # Fallback price
 
         # Fetch historical candles for volatility analysis
         try:
-            print("Fetching historical ETH candles for volatility analysis...")
+            logger.debug("Fetching historical ETH candles for volatility analysis...")
             candles = await self.eth_client.get_historical_candles(hours=168)  # 1 week
-            print(f"✓ Fetched {len(candles)} hourly candles")
+            logger.debug("Fetched %d hourly candles", len(candles))
         except Exception as e:
-            print(f"✗ Failed to fetch historical candles: {e}")
+            logger.warning("Failed to fetch historical candles: %s", e)
             candles = []
 
         now_utc = datetime.now(UTC)
@@ -726,7 +744,7 @@ class MarketService:
 
         # Fetch KXETHD markets from Kalshi (Ethereum hourly contracts)
         try:
-            print("Fetching KXETHD Ethereum markets from Kalshi...")
+            logger.debug("Fetching KXETHD Ethereum markets from Kalshi...")
             markets: list[dict[str, Any]] = []
             cursor: str | None = None
             max_pages = 10
@@ -741,15 +759,15 @@ class MarketService:
                 markets.extend(page_markets)
                 cursor = markets_response.get("cursor")
 
-                print(f"  Page {page}: {len(page_markets)} markets")
+                logger.debug("Page %s: %d markets", page, len(page_markets))
 
                 if not cursor:
                     break
 
-            print(f"✓ Received {len(markets)} KXETHD markets from Kalshi")
+            logger.debug("Received %d KXETHD markets from Kalshi", len(markets))
 
         except Exception as e:
-            print(f"✗ Failed to fetch Ethereum markets: {e}")
+            logger.warning("Failed to fetch Ethereum markets: %s", e)
             return {
                 "contracts": [],
                 "volatility": self._get_default_volatility()
@@ -783,7 +801,7 @@ class MarketService:
             active_count += 1
             contracts_by_expiry[expiry_utc].append(market)
 
-        print(f"📊 Contracts: {expired_count} expired, {active_count} active")
+        logger.debug("Contracts: %s expired, %s active", expired_count, active_count)
 
         # Get contracts for the next available expiry
         asset_contracts = []
@@ -793,7 +811,10 @@ class MarketService:
             asset_contracts = selected_markets
 
             expiry_est = selected_expiry.astimezone(est)
-            print(f"✓ Using {len(asset_contracts)} contracts expiring {expiry_est.strftime('%b %d %I%p %Z')}")
+            logger.debug(
+                "Using %d contracts expiring %s",
+                len(asset_contracts), expiry_est.strftime("%b %d %I%p %Z"),
+            )
 
         # Calculate volatility from historical candles
         volatility_data = self._get_default_volatility()
@@ -804,18 +825,18 @@ class MarketService:
                 volatility_data["realized_vol_close"] = realized_vol
                 volatility_data["realized_vol_parkinson"] = realized_vol
             except Exception as e:
-                print(f"✗ Failed to calculate volatility: {e}")
+                logger.warning("Failed to calculate volatility: %s", e)
 
         # Fetch Deribit DVOL for ETH
-        print("\n📊 Fetching Deribit DVOL for ETH...")
+        logger.debug("Fetching Deribit DVOL for ETH...")
         eth_dvol = await self.vol_regime.fetch_deribit_dvol("ETH")
         if eth_dvol is not None:
-            print(f"✓ Deribit ETH DVOL: {eth_dvol:.1%} (using for Black-Scholes)")
+            logger.debug("Deribit ETH DVOL: %.1f%% (using for Black-Scholes)", eth_dvol * 100)
             volatility_data["deribit_iv"] = eth_dvol
             volatility_data["deribit_iv_source"] = "dvol"
             volatility_data["implied_vol"] = eth_dvol
         else:
-            print("⚠️  Deribit ETH DVOL unavailable, using realized vol only")
+            logger.warning("Deribit ETH DVOL unavailable, using realized vol only")
             volatility_data["deribit_iv_source"] = "none"
 
         # Process contracts with DVOL
@@ -826,13 +847,16 @@ class MarketService:
                 if contract_data:
                     processed_contracts.append(contract_data)
             except Exception as e:
-                print(f"✗ Error processing contract: {e}")
+                logger.warning("Error processing contract: %s", e)
 
         # Sort by expected value and take top 10
         processed_contracts.sort(key=lambda x: x["expected_value"], reverse=True)
         top_contracts = processed_contracts[:10]
 
-        print(f"✓ Processed {len(processed_contracts)} contracts, returning top {len(top_contracts)} by EV")
+        logger.debug(
+            "Processed %d contracts, returning top %d by EV",
+            len(processed_contracts), len(top_contracts),
+        )
 
         return {
             "contracts": top_contracts,
@@ -850,18 +874,18 @@ class MarketService:
         # Get current XRP price
         try:
             current_xrp_price = await self.xrp_client.get_spot_price()
-            print(f"✓ Successfully fetched XRP price: ${current_xrp_price:,.4f}")
+            logger.debug("Successfully fetched XRP price: $%.4f", current_xrp_price)
         except Exception as e:
-            print(f"✗ Failed to fetch XRP price: {e}")
+            logger.warning("Failed to fetch XRP price: %s", e)
             current_xrp_price = 0.62  # Fallback price
 
         # Fetch historical candles for volatility analysis
         try:
-            print("Fetching historical XRP candles for volatility analysis...")
+            logger.debug("Fetching historical XRP candles for volatility analysis...")
             candles = await self.xrp_client.get_historical_candles(hours=168)  # 1 week
-            print(f"✓ Fetched {len(candles)} hourly candles")
+            logger.debug("Fetched %d hourly candles", len(candles))
         except Exception as e:
-            print(f"✗ Failed to fetch historical candles: {e}")
+            logger.warning("Failed to fetch historical candles: %s", e)
             candles = []
 
         now_utc = datetime.now(UTC)
@@ -869,7 +893,7 @@ class MarketService:
 
         # Fetch KXXRPD markets from Kalshi (XRP hourly contracts)
         try:
-            print("Fetching KXXRPD Ripple markets from Kalshi...")
+            logger.debug("Fetching KXXRPD Ripple markets from Kalshi...")
             markets: list[dict[str, Any]] = []
             cursor: str | None = None
             max_pages = 10
@@ -884,15 +908,15 @@ class MarketService:
                 markets.extend(page_markets)
                 cursor = markets_response.get("cursor")
 
-                print(f"  Page {page}: {len(page_markets)} markets")
+                logger.debug("Page %s: %d markets", page, len(page_markets))
 
                 if not cursor:
                     break
 
-            print(f"✓ Received {len(markets)} KXXRPD markets from Kalshi")
+            logger.debug("Received %d KXXRPD markets from Kalshi", len(markets))
 
         except Exception as e:
-            print(f"✗ Failed to fetch Ripple markets: {e}")
+            logger.warning("Failed to fetch Ripple markets: %s", e)
             return {
                 "contracts": [],
                 "volatility": self._get_default_volatility()
@@ -926,7 +950,7 @@ class MarketService:
             active_count += 1
             contracts_by_expiry[expiry_utc].append(market)
 
-        print(f"📊 Contracts: {expired_count} expired, {active_count} active")
+        logger.debug("Contracts: %s expired, %s active", expired_count, active_count)
 
         # Get contracts for the next available expiry
         asset_contracts = []
@@ -936,7 +960,10 @@ class MarketService:
             asset_contracts = selected_markets
 
             expiry_est = selected_expiry.astimezone(est)
-            print(f"✓ Using {len(asset_contracts)} contracts expiring {expiry_est.strftime('%b %d %I%p %Z')}")
+            logger.debug(
+                "Using %d contracts expiring %s",
+                len(asset_contracts), expiry_est.strftime("%b %d %I%p %Z"),
+            )
 
         # Calculate volatility from historical candles
         volatility_data = self._get_default_volatility()
@@ -947,18 +974,18 @@ class MarketService:
                 volatility_data["realized_vol_close"] = realized_vol
                 volatility_data["realized_vol_parkinson"] = realized_vol
             except Exception as e:
-                print(f"✗ Failed to calculate volatility: {e}")
+                logger.warning("Failed to calculate volatility: %s", e)
 
         # Fetch Deribit IV for XRP (options chain — no DVOL index)
-        print("\n📊 Fetching Deribit options IV for XRP...")
+        logger.debug("Fetching Deribit options IV for XRP...")
         xrp_iv, xrp_iv_source = await self.vol_regime.fetch_iv_for_asset("XRP", current_xrp_price)
         if xrp_iv is not None:
-            print(f"✓ Deribit XRP IV: {xrp_iv:.1%} (source: {xrp_iv_source})")
+            logger.debug("Deribit XRP IV: %.1f%% (source: %s)", xrp_iv * 100, xrp_iv_source)
             volatility_data["deribit_iv"] = xrp_iv
             volatility_data["deribit_iv_source"] = xrp_iv_source
             volatility_data["implied_vol"] = xrp_iv
         else:
-            print("⚠️  Deribit XRP IV unavailable — no options market reference")
+            logger.warning("Deribit XRP IV unavailable — no options market reference")
             volatility_data["deribit_iv_source"] = "none"
 
         # Process contracts with IV
@@ -969,13 +996,16 @@ class MarketService:
                 if contract_data:
                     processed_contracts.append(contract_data)
             except Exception as e:
-                print(f"✗ Error processing contract: {e}")
+                logger.warning("Error processing contract: %s", e)
 
         # Sort by expected value and take top 10
         processed_contracts.sort(key=lambda x: x["expected_value"], reverse=True)
         top_contracts = processed_contracts[:10]
 
-        print(f"✓ Processed {len(processed_contracts)} contracts, returning top {len(top_contracts)} by EV")
+        logger.debug(
+            "Processed %d contracts, returning top %d by EV",
+            len(processed_contracts), len(top_contracts),
+        )
 
         return {
             "contracts": top_contracts,
@@ -993,18 +1023,18 @@ class MarketService:
         # Get current SOL price
         try:
             current_sol_price = await self.sol_client.get_spot_price()
-            print(f"✓ Successfully fetched SOL price: ${current_sol_price:,.2f}")
+            logger.debug("Successfully fetched SOL price: $%.2f", current_sol_price)
         except Exception as e:
-            print(f"✗ Failed to fetch SOL price: {e}")
+            logger.warning("Failed to fetch SOL price: %s", e)
             current_sol_price = 200.0  # Fallback price
 
         # Fetch historical candles for volatility analysis
         try:
-            print("Fetching historical SOL candles for volatility analysis...")
+            logger.debug("Fetching historical SOL candles for volatility analysis...")
             candles = await self.sol_client.get_historical_candles(hours=168)  # 1 week
-            print(f"✓ Fetched {len(candles)} hourly candles")
+            logger.debug("Fetched %d hourly candles", len(candles))
         except Exception as e:
-            print(f"✗ Failed to fetch historical candles: {e}")
+            logger.warning("Failed to fetch historical candles: %s", e)
             candles = []
 
         now_utc = datetime.now(UTC)
@@ -1012,7 +1042,7 @@ class MarketService:
 
         # Fetch KXSOLD markets from Kalshi (Solana hourly contracts)
         try:
-            print("Fetching KXSOLD Solana markets from Kalshi...")
+            logger.debug("Fetching KXSOLD Solana markets from Kalshi...")
             markets: list[dict[str, Any]] = []
             cursor: str | None = None
             max_pages = 10
@@ -1027,15 +1057,15 @@ class MarketService:
                 markets.extend(page_markets)
                 cursor = markets_response.get("cursor")
 
-                print(f"  Page {page}: {len(page_markets)} markets")
+                logger.debug("Page %s: %d markets", page, len(page_markets))
 
                 if not cursor:
                     break
 
-            print(f"✓ Received {len(markets)} KXSOLD markets from Kalshi")
+            logger.debug("Received %d KXSOLD markets from Kalshi", len(markets))
 
         except Exception as e:
-            print(f"✗ Failed to fetch Solana markets: {e}")
+            logger.warning("Failed to fetch Solana markets: %s", e)
             return {
                 "contracts": [],
                 "volatility": self._get_default_volatility()
@@ -1069,7 +1099,7 @@ class MarketService:
             active_count += 1
             contracts_by_expiry[expiry_utc].append(market)
 
-        print(f"📊 Contracts: {expired_count} expired, {active_count} active")
+        logger.debug("Contracts: %s expired, %s active", expired_count, active_count)
 
         # Get contracts for the next available expiry
         asset_contracts = []
@@ -1079,7 +1109,10 @@ class MarketService:
             asset_contracts = selected_markets
 
             expiry_est = selected_expiry.astimezone(est)
-            print(f"✓ Using {len(asset_contracts)} contracts expiring {expiry_est.strftime('%b %d %I%p %Z')}")
+            logger.debug(
+                "Using %d contracts expiring %s",
+                len(asset_contracts), expiry_est.strftime("%b %d %I%p %Z"),
+            )
 
         # Calculate volatility from historical candles
         volatility_data = self._get_default_volatility()
@@ -1090,18 +1123,18 @@ class MarketService:
                 volatility_data["realized_vol_close"] = realized_vol
                 volatility_data["realized_vol_parkinson"] = realized_vol
             except Exception as e:
-                print(f"✗ Failed to calculate volatility: {e}")
+                logger.warning("Failed to calculate volatility: %s", e)
 
         # Fetch Deribit IV for SOL (options chain — no DVOL index)
-        print("\n📊 Fetching Deribit options IV for SOL...")
+        logger.debug("Fetching Deribit options IV for SOL...")
         sol_iv, sol_iv_source = await self.vol_regime.fetch_iv_for_asset("SOL", current_sol_price)
         if sol_iv is not None:
-            print(f"✓ Deribit SOL IV: {sol_iv:.1%} (source: {sol_iv_source})")
+            logger.debug("Deribit SOL IV: %.1f%% (source: %s)", sol_iv * 100, sol_iv_source)
             volatility_data["deribit_iv"] = sol_iv
             volatility_data["deribit_iv_source"] = sol_iv_source
             volatility_data["implied_vol"] = sol_iv
         else:
-            print("⚠️  Deribit SOL IV unavailable — no options market reference")
+            logger.warning("Deribit SOL IV unavailable — no options market reference")
             volatility_data["deribit_iv_source"] = "none"
 
         # Process contracts with IV
@@ -1112,19 +1145,24 @@ class MarketService:
                 if contract_data:
                     processed_contracts.append(contract_data)
             except Exception as e:
-                print(f"✗ Error processing contract: {e}")
+                logger.warning("Error processing contract: %s", e)
 
         # Sort by expected value and take top 10
         processed_contracts.sort(key=lambda x: x["expected_value"], reverse=True)
         top_contracts = processed_contracts[:10]
 
-        print(f"✓ Processed {len(processed_contracts)} contracts, returning top {len(top_contracts)} by EV")
+        logger.debug(
+            "Processed %d contracts, returning top %d by EV",
+            len(processed_contracts), len(top_contracts),
+        )
 
         return {
             "contracts": top_contracts,
             "volatility": volatility_data
         }
 
+    # Shorter than the hourly methods' 120s: 15-minute series roll over too often
+    @cached(ttl=30, key_prefix="contracts:generic")
     async def get_generic_hourly_contracts(self, asset: str, timeframe: str = "hourly") -> dict[str, Any]:
         """
         Fetch contracts for any supported asset and timeframe.
@@ -1139,7 +1177,7 @@ class MarketService:
         asset_upper = asset.upper()
         series_config = self.SERIES_TICKERS.get(asset_upper)
         if not series_config:
-            print(f"✗ Unsupported asset: {asset}")
+            logger.warning("Unsupported asset: %s", asset)
             return {"contracts": [], "volatility": self._get_default_volatility()}
 
         series_ticker = series_config.get(timeframe, series_config["hourly"])
@@ -1152,23 +1190,23 @@ class MarketService:
         }
         price_client = client_map.get(asset_upper)
         if not price_client:
-            print(f"✗ No price client for {asset_upper}")
+            logger.warning("No price client for %s", asset_upper)
             return {"contracts": [], "volatility": self._get_default_volatility()}
 
         # Get current price
         try:
             current_price = await price_client.get_spot_price()
-            print(f"✓ {asset_upper} price: ${current_price:,.4f}")
+            logger.debug("%s price: $%.4f", asset_upper, current_price)
         except Exception as e:
-            print(f"✗ Failed to fetch {asset_upper} price: {e}")
+            logger.warning("Failed to fetch %s price: %s", asset_upper, e)
             return {"contracts": [], "volatility": self._get_default_volatility()}
 
         # Fetch historical candles
         try:
             candles = await price_client.get_historical_candles(hours=168)
-            print(f"✓ Fetched {len(candles)} hourly candles for {asset_upper}")
+            logger.debug("Fetched %d hourly candles for %s", len(candles), asset_upper)
         except Exception as e:
-            print(f"✗ Failed to fetch candles: {e}")
+            logger.warning("Failed to fetch %s candles: %s", asset_upper, e)
             candles = []
 
         now_utc = datetime.now(UTC)
@@ -1176,7 +1214,7 @@ class MarketService:
 
         # Fetch markets from Kalshi
         try:
-            print(f"Fetching {series_ticker} markets from Kalshi...")
+            logger.debug("Fetching %s markets from Kalshi", series_ticker)
             markets: list[dict[str, Any]] = []
             cursor: str | None = None
             max_pages = 10
@@ -1193,9 +1231,9 @@ class MarketService:
                 if not cursor or len(batch) < 1000:
                     break
 
-            print(f"✓ Received {len(markets)} {series_ticker} markets from Kalshi")
+            logger.debug("Received %d %s markets from Kalshi", len(markets), series_ticker)
         except Exception as e:
-            print(f"✗ Failed to fetch {series_ticker} markets: {e}")
+            logger.warning("Failed to fetch %s markets: %s", series_ticker, e)
             return {"contracts": [], "volatility": self._get_default_volatility()}
 
         if not markets:
@@ -1233,7 +1271,7 @@ class MarketService:
             selected_expiry, selected_markets = sorted_expiries[0]
             asset_contracts = selected_markets
             expiry_est = selected_expiry.astimezone(est)
-            print(f"✓ Using {len(asset_contracts)} contracts expiring {expiry_est.strftime('%b %d %I%p %Z')}")
+            logger.debug("Using %d contracts expiring %s", len(asset_contracts), expiry_est)
 
         # Calculate volatility
         volatility_data = self._get_default_volatility()
@@ -1244,17 +1282,17 @@ class MarketService:
                 volatility_data["realized_vol_close"] = realized_vol
                 volatility_data["realized_vol_parkinson"] = realized_vol
             except Exception as e:
-                print(f"✗ Failed to calculate volatility: {e}")
+                logger.warning("Failed to calculate %s volatility: %s", asset_upper, e)
 
         # Fetch Deribit IV if available
         iv, iv_source = await self.vol_regime.fetch_iv_for_asset(asset_upper, current_price)
         if iv is not None:
-            print(f"✓ Deribit {asset_upper} IV: {iv:.1%} (source: {iv_source})")
+            logger.debug("Deribit %s IV: %.1f%% (source: %s)", asset_upper, iv * 100, iv_source)
             volatility_data["deribit_iv"] = iv
             volatility_data["deribit_iv_source"] = iv_source
             volatility_data["implied_vol"] = iv
         else:
-            print(f"⚠️  No Deribit IV available for {asset_upper}")
+            logger.debug("No Deribit IV available for %s", asset_upper)
             volatility_data["deribit_iv_source"] = "none"
 
         # Process contracts
@@ -1267,11 +1305,11 @@ class MarketService:
                 if contract_data:
                     processed_contracts.append(contract_data)
             except Exception as e:
-                print(f"✗ Error processing contract: {e}")
+                logger.warning("Error processing %s contract: %s", asset_upper, e)
 
         processed_contracts.sort(key=lambda x: x["expected_value"], reverse=True)
         top_contracts = processed_contracts[:10]
-        print(f"✓ Processed {len(processed_contracts)} contracts, returning top {len(top_contracts)} by EV")
+        logger.debug("Processed %d %s contracts, returning top %d by EV", len(processed_contracts), asset_upper, len(top_contracts))
 
         return {
             "contracts": top_contracts,
@@ -1322,3 +1360,15 @@ class MarketService:
             pass
 
         return None
+
+
+# Singleton instance (keeps clients, predictor state and the mint cache warm)
+_market_service: MarketService | None = None
+
+
+def get_market_service() -> MarketService:
+    """Get or create MarketService singleton."""
+    global _market_service
+    if _market_service is None:
+        _market_service = MarketService()
+    return _market_service
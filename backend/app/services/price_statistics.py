@@ -1,11 +1,53 @@
 """Service for calculating hourly price movement statistics."""
 
+import math
 from datetime import datetime
 from typing import Any
 
 import numpy as np
 import pandas as pd
-from scipy.stats import norm
+
+_SQRT2 = math.sqrt(2.0)
+
+# Extreme-move thresholds, 2% through 8%; built once and read-only
+_EXTREME_THRESHOLDS = np.array([0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08], dtype=np.float64)
+_EXTREME_THRESHOLDS.flags.writeable = False
+
+
+def _norm_cdf(z: float) -> float:
+    """Standard normal CDF; same values as scipy's norm.cdf without its per-call overhead."""
+    return 0.5 * math.erfc(-z / _SQRT2)
+
+
+def _epoch_seconds(timestamp: Any) -> float:
+    """Candle timestamps are (naive, local) datetimes or epoch milliseconds."""
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return timestamp / 1000
+
+
+def candle_arrays(candles: list[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Split candles into epoch-second timestamps and an (n, 4) open/high/low/close array.
+
+    Callers using the compute pool build these first, so only two compact
+    arrays are pickled to the worker instead of every candle dict.
+    """
+    if not candles:
+        return np.empty(0, dtype=np.float64), np.empty((0, 4), dtype=np.float64)
+    if isinstance(candles[0], dict):
+        # Dictionary format from the price clients
+        timestamps = [c["timestamp"] for c in candles]
+        ohlc = np.array(
+            [(c["open"], c["high"], c["low"], c["close"]) for c in candles],
+            dtype=np.float64,
+        )
+    else:
+        # List format [[timestamp, open, high, low, close, volume], ...]
+        timestamps = [c[0] for c in candles]
+        ohlc = np.array([c[1:5] for c in candles], dtype=np.float64)
+    times = np.fromiter(map(_epoch_seconds, timestamps), dtype=np.float64, count=len(timestamps))
+    return times, ohlc
 
 
 class HourlyPriceStatistics:
@@ -28,115 +70,87 @@ class HourlyPriceStatistics:
         Returns:
             Dictionary containing statistical analysis of hourly price movements
         """
-        if not candles or len(candles) < 2:
-            return self._get_default_stats()
+        return self.hourly_stats_from_arrays(*candle_arrays(candles[:lookback_hours]))
+
+    def hourly_stats_from_arrays(self, times: np.ndarray, ohlc: np.ndarray) -> dict[str, Any]:
+        """
+        calculate_hourly_stats over candle_arrays() output.
 
-        hourly_returns = []
-
-        # Calculate hourly returns
-        for i in range(1, min(len(candles), lookback_hours)):
-            prev_candle = candles[i - 1]
-            curr_candle = candles[i]
-
-            # Handle both dict and list formats
-            if isinstance(curr_candle, dict):
-                # Dictionary format from BitcoinPriceClient
-                timestamp = curr_candle["timestamp"]
-                prev_close = float(prev_candle["close"])
-                curr_close = float(curr_candle["close"])
-                curr_high = float(curr_candle["high"])
-                curr_low = float(curr_candle["low"])
-                curr_open = float(curr_candle["open"])
-            else:
-                # List format [[timestamp, open, high, low, close, volume], ...]
-                timestamp = datetime.fromtimestamp(curr_candle[0] / 1000)  # Convert ms to datetime
-                prev_close = float(prev_candle[4])
-                curr_close = float(curr_candle[4])
-                curr_high = float(curr_candle[2])
-                curr_low = float(curr_candle[3])
-                curr_open = float(curr_candle[1])
-
-            if prev_close == 0 or curr_open == 0:
-                continue
-
-            return_pct = (curr_close / prev_close) - 1
-            return_abs = curr_close - prev_close
-            range_pct = (curr_high - curr_low) / curr_open if curr_open > 0 else 0
-
-            hourly_returns.append(
-                {
-                    "timestamp": timestamp,
-                    "return_pct": return_pct,
-                    "return_abs": return_abs,
-                    "hour_of_day": timestamp.hour,
-                    "day_of_week": timestamp.weekday(),
-                    "high": curr_high,
-                    "low": curr_low,
-                    "range_pct": range_pct,
-                }
-            )
-
-        if not hourly_returns:
+        Entry point for the compute pool: the arrays pickle far smaller than
+        the candle dicts they come from.
+        """
+        if len(ohlc) < 2:
             return self._get_default_stats()
 
-        df = pd.DataFrame(hourly_returns)
+        opens, highs, lows, closes = ohlc.T
+
+        # Return from each candle's previous close; skip zero closes/opens
+        prev_close = closes[:-1]
+        curr_open = opens[1:]
+        valid = (prev_close != 0) & (curr_open != 0)
+        if not valid.any():
+            return self._get_default_stats()
 
-        # Calculate percentiles
+        returns = closes[1:][valid] / prev_close[valid] - 1
+        kept_open = curr_open[valid]
+        range_pct = np.where(
+            kept_open > 0, (highs[1:][valid] - lows[1:][valid]) / kept_open, 0.0
+        )
+
+        # Local wall-clock time, as the clients build their candle datetimes
+        kept_times = [datetime.fromtimestamp(t) for t in times[1:][valid].tolist()]
+        hour_of_day = np.fromiter((t.hour for t in kept_times), dtype=np.intp, count=len(kept_times))
+        day_of_week = np.fromiter((t.weekday() for t in kept_times), dtype=np.intp, count=len(kept_times))
+
+        # Calculate percentiles (linear interpolation, same as pandas quantile).
+        # np.percentile selects all levels with one np.partition call; the
+        # median is the 50th percentile, so it reuses that selection.
+        levels = (1, 5, 10, 25, 50, 75, 90, 95, 99)
         percentiles = {
-            "percentile_1": float(df["return_pct"].quantile(0.01)),
-            "percentile_5": float(df["return_pct"].quantile(0.05)),
-            "percentile_10": float(df["return_pct"].quantile(0.10)),
-            "percentile_25": float(df["return_pct"].quantile(0.25)),
-            "percentile_50": float(df["return_pct"].quantile(0.50)),
-            "percentile_75": float(df["return_pct"].quantile(0.75)),
-            "percentile_90": float(df["return_pct"].quantile(0.90)),
-            "percentile_95": float(df["return_pct"].quantile(0.95)),
-            "percentile_99": float(df["return_pct"].quantile(0.99)),
+            f"percentile_{level}": float(value)
+            for level, value in zip(levels, np.percentile(returns, levels), strict=False)
         }
 
-        # By-hour aggregation
-        by_hour = {}
-        for hour in range(24):
-            hour_data = df[df["hour_of_day"] == hour]["return_pct"]
-            if len(hour_data) > 0:
-                by_hour[hour] = {
-                    "mean": float(hour_data.mean()),
-                    "std": float(hour_data.std()),
-                    "count": int(len(hour_data)),
-                }
-
-        # By-day aggregation
-        by_day = {}
-        for day in range(7):
-            day_data = df[df["day_of_week"] == day]["return_pct"]
-            if len(day_data) > 0:
-                by_day[day] = {
-                    "mean": float(day_data.mean()),
-                    "std": float(day_data.std()),
-                    "count": int(len(day_data)),
-                }
+        series = pd.Series(returns)
 
         return {
             # Overall statistics
-            "mean_return": float(df["return_pct"].mean()),
-            "std_return": float(df["return_pct"].std()),
-            "median_return": float(df["return_pct"].median()),
-            "skewness": float(df["return_pct"].skew()),
-            "kurtosis": float(df["return_pct"].kurt()),
+            "mean_return": float(returns.mean()),
+            "std_return": float(series.std()),
+            "median_return": percentiles["percentile_50"],
+            "skewness": float(series.skew()),
+            "kurtosis": float(series.kurt()),
             # Percentiles (CRITICAL for strike selection)
             **percentiles,
             # Range statistics
-            "avg_hourly_range": float(df["range_pct"].mean()),
-            "max_hourly_move": float(df["return_pct"].abs().max()),
-            "max_positive_move": float(df["return_pct"].max()),
-            "max_negative_move": float(df["return_pct"].min()),
+            "avg_hourly_range": float(range_pct.mean()),
+            "max_hourly_move": float(np.abs(returns).max()),
+            "max_positive_move": float(returns.max()),
+            "max_negative_move": float(returns.min()),
             # Time-of-day patterns
-            "by_hour": by_hour,
-            "by_day": by_day,
+            "by_hour": self._group_stats(returns, hour_of_day, 24),
+            "by_day": self._group_stats(returns, day_of_week, 7),
             # Distribution for visualization
-            "return_distribution": df["return_pct"].tolist(),
+            "return_distribution": returns.tolist(),
             # Sample size
-            "total_samples": len(hourly_returns),
+            "total_samples": int(returns.size),
+        }
+
+    @staticmethod
+    def _group_stats(returns: np.ndarray, groups: np.ndarray, size: int) -> dict[int, dict[str, Any]]:
+        """Mean, sample std and count of returns per group (hour or weekday)."""
+        counts = np.bincount(groups, minlength=size)
+        means = np.bincount(groups, weights=returns, minlength=size) / np.maximum(counts, 1)
+        sq_dev = np.bincount(groups, weights=(returns - means[groups]) ** 2, minlength=size)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stds = np.sqrt(sq_dev / (counts - 1))  # NaN for single samples, like pandas
+        return {
+            int(group): {
+                "mean": float(means[group]),
+                "std": float(stds[group]),
+                "count": int(counts[group]),
+            }
+            for group in np.flatnonzero(counts)
         }
 
     def get_probability_of_move(
@@ -179,12 +193,13 @@ class HourlyPriceStatistics:
         z_score = (required_move_pct - mean) / std
 
         # Probability of exceeding required move
+        cdf = _norm_cdf(z_score)
         if required_move_pct > 0:
             # Probability of closing ABOVE target (need upward move)
-            prob = 1 - norm.cdf(z_score)
+            prob = 1 - cdf
         else:
             # Probability of closing BELOW target (need downward move)
-            prob = norm.cdf(z_score)
+            prob = cdf
 
         # Classify likelihood based on Z-score
         abs_z = abs(z_score)
@@ -202,7 +217,7 @@ class HourlyPriceStatistics:
             likelihood = "very rare"
 
         # Find which percentile this move represents
-        percentile_rank = norm.cdf(z_score) * 100
+        percentile_rank = cdf * 100
 
         return {
             "strike": target_price,
@@ -234,42 +249,33 @@ class HourlyPriceStatistics:
         Returns:
             Dictionary with extreme move probabilities and frequencies
         """
-        if not candles or len(candles) < 2:
-            return self._get_default_extreme_stats()
-
-        hourly_returns = []
+        _, ohlc = candle_arrays(candles[:lookback_hours])
+        return self.extreme_move_probabilities_from_closes(ohlc[:, 3])
 
-        # Calculate absolute hourly returns
-        for i in range(1, min(len(candles), lookback_hours)):
-            prev_candle = candles[i - 1]
-            curr_candle = candles[i]
-
-            # Handle both dict and list formats
-            if isinstance(curr_candle, dict):
-                prev_close = float(prev_candle["close"])
-                curr_close = float(curr_candle["close"])
-            else:
-                prev_close = float(prev_candle[4])
-                curr_close = float(curr_candle[4])
-
-            if prev_close == 0:
-                continue
+    def extreme_move_probabilities_from_closes(self, closes: np.ndarray) -> dict[str, Any]:
+        """calculate_extreme_move_probabilities over an array of closes (compute pool entry point)."""
+        if len(closes) < 2:
+            return self._get_default_extreme_stats()
 
-            return_pct = abs((curr_close / prev_close) - 1)  # Absolute value
-            hourly_returns.append(return_pct)
+        # Absolute hourly returns, skipping zero previous closes
+        prev_close = closes[:-1]
+        valid = prev_close != 0
+        hourly_returns = np.abs(closes[1:][valid] / prev_close[valid] - 1)
 
-        if not hourly_returns:
+        if not hourly_returns.size:
             return self._get_default_extreme_stats()
 
-        total_hours = len(hourly_returns)
+        total_hours = int(hourly_returns.size)
 
-        # Count extreme moves at different thresholds
-        thresholds = [0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08]  # 2% through 8%
+        # Count extreme moves at all thresholds with one sort and a binary search
+        # per threshold, instead of a pass (or boolean temporary) per threshold
+        counts = total_hours - np.searchsorted(
+            np.sort(hourly_returns), _EXTREME_THRESHOLDS, side="right"
+        )
         extreme_probs = {}
 
-        for threshold in thresholds:
-            count = sum(1 for ret in hourly_returns if ret > threshold)
-            probability = count / total_hours if total_hours > 0 else 0
+        for threshold, count in zip(_EXTREME_THRESHOLDS.tolist(), counts.tolist(), strict=False):
+            probability = count / total_hours
 
             # Expected frequency over different timeframes
             per_100_hours = probability * 100
@@ -121,14 +121,11 @@ class AlertPusher:
             logger.info(f"Signal EV {signal.ev:.1%} below threshold {prefs.min_ev_threshold:.1%}")
             return results
 
-        # Check asset filter
-        try:
-            allowed_assets = json.loads(prefs.alert_assets)
-            if signal.asset not in allowed_assets:
-                logger.info(f"Signal asset {signal.asset} not in allowed list")
-                return results
-        except (json.JSONDecodeError, TypeError):
-            pass
+        # Check asset filter (malformed settings allow every asset)
+        allowed_assets = prefs.alert_assets_list
+        if allowed_assets is not None and signal.asset not in allowed_assets:
+            logger.info(f"Signal asset {signal.asset} not in allowed list")
+            return results
 
         # Send Telegram notification
         if prefs.telegram_chat_id and self.telegram:
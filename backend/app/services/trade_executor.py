@@ -1,17 +1,27 @@
 """Trade execution service with Kalshi Builder Code integration."""
 
+import asyncio
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy import select
+from sqlalchemy import and_, case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached, cached_batch, invalidate_cache
 from app.core.config import settings
-from app.data.kalshi_client import KalshiClient, OrderAction, OrderResult, OrderSide, OrderType
+from app.data.kalshi_client import OrderAction, OrderResult, OrderSide, OrderType, get_kalshi_client
 from app.db.models import Trade, TradeSignal
 
+# Dashboards poll P&L; closed trades only change through close_position,
+# which invalidates the cached summaries
+PNL_CACHE_TTL = 30  # seconds
+
+# Position pricing polls (list and per-trade) share a ticker's orderbook briefly
+ORDERBOOK_CACHE_TTL = 2  # seconds
+
 
 @dataclass
 class TradeRequest:
@@ -65,7 +75,7 @@ class TradeExecutor:
     def __init__(self, db: AsyncSession) -> None:
         """Initialize trade executor."""
         self.db = db
-        self.kalshi = KalshiClient()
+        self.kalshi = get_kalshi_client()
         self.builder_code = settings.kalshi_builder_code
 
     async def execute_trade(self, request: TradeRequest) -> TradeResponse:
@@ -99,7 +109,9 @@ class TradeExecutor:
             builder_code_used=self.builder_code if self.builder_code else None,
         )
         self.db.add(trade)
-        await self.db.flush()  # Get the trade ID
+        # Commit the PENDING record (assigns the ID) so the connection and
+        # SQLite write lock aren't held while the order is in flight
+        await self.db.commit()
 
         # Place order on Kalshi
         result = await self.kalshi.place_order(
@@ -236,6 +248,8 @@ class TradeExecutor:
                 error=f"Trade is not open (status: {trade.status})",
             )
 
+        await self._release_connection()
+
         # Place sell order
         side = OrderSide.YES if trade.direction == "YES" else OrderSide.NO
         client_order_id = f"basilisk_close_{uuid.uuid4().hex[:12]}"
@@ -268,6 +282,7 @@ class TradeExecutor:
                 trade.pnl = gross_pnl
 
             await self.db.commit()
+            await invalidate_cache("pnl:*")
 
             return TradeResponse(
                 success=True,
@@ -295,15 +310,89 @@ class TradeExecutor:
             select(Trade).where(Trade.status == "OPEN")
         )
         trades = result.scalars().all()
+        await self._release_connection()
 
-        positions = []
-        for trade in trades:
-            # Fetch current market price for this ticker
-            current_price = None
-            unrealized_pnl = None
+        # One orderbook lookup per distinct ticker: a single MGET for the cached
+        # ones, the misses fetched together
+        tickers = list(dict.fromkeys(trade.ticker for trade in trades))
+        orderbooks = dict(zip(tickers, await self._fetch_orderbooks(tickers), strict=False))
+        return [self._position_from_orderbook(trade, orderbooks[trade.ticker]) for trade in trades]
+
+    async def get_position(self, trade_id: int) -> PositionSummary | None:
+        """
+        Get a single position, with live data if it is still open.
 
+        Args:
+            trade_id: ID of the Trade
+
+        Returns:
+            PositionSummary, or None if the trade does not exist
+        """
+        trade = await self.db.get(Trade, trade_id)
+        if trade is None:
+            return None
+
+        if trade.status == "OPEN":
+            await self._release_connection()
+            return await self._live_position(trade)
+
+        # Not open: no live price to fetch
+        return PositionSummary(
+            trade_id=trade.id,
+            ticker=trade.ticker,
+            asset=trade.asset,
+            direction=trade.direction,
+            strike=trade.strike,
+            contracts=trade.contracts,
+            entry_price=trade.entry_price,
+            current_price=None,
+            unrealized_pnl=None,
+            status=trade.status,
+            expiry_at=trade.expiry_at,
+            opened_at=trade.opened_at,
+        )
+
+    async def _release_connection(self) -> None:
+        """
+        End the current read transaction before awaiting Kalshi.
+
+        Returns the pooled connection instead of holding it across network
+        calls; loaded rows stay usable since the session doesn't expire on commit.
+        """
+        await self.db.commit()
+
+    async def _live_position(self, trade: Trade) -> PositionSummary:
+        """Build a PositionSummary for an open trade from its live orderbook."""
+        orderbook = await self._fetch_orderbook(trade.ticker)
+        return self._position_from_orderbook(trade, orderbook)
+
+    async def _get_orderbook(self, ticker: str) -> dict | None:
+        """Fetch a market orderbook from Kalshi, or None if it is unavailable."""
+        try:
+            return await self.kalshi.get_market_orderbook(ticker)
+        except Exception:
+            return None
+
+    # Both share "orderbook:position" keys, so list and per-trade polls hit the same entries
+    @cached(ttl=ORDERBOOK_CACHE_TTL, key_prefix="orderbook:position", adaptive=False)
+    async def _fetch_orderbook(self, ticker: str) -> dict | None:
+        """Orderbook for one ticker, briefly cached."""
+        return await self._get_orderbook(ticker)
+
+    @cached_batch(ttl=ORDERBOOK_CACHE_TTL, key_prefix="orderbook:position", key_fn=str)
+    async def _fetch_orderbooks(self, tickers: list[str]) -> list[dict | None]:
+        """Orderbooks for several tickers, briefly cached; misses are fetched concurrently."""
+        return await asyncio.gather(*(self._get_orderbook(ticker) for ticker in tickers))
+
+    def _position_from_orderbook(
+        self, trade: Trade, orderbook: dict | None
+    ) -> PositionSummary:
+        """Build a PositionSummary with current price and P&L from an orderbook."""
+        current_price = None
+        unrealized_pnl = None
+
+        if orderbook is not None:
             try:
-                orderbook = await self.kalshi.get_market_orderbook(trade.ticker)
                 if trade.direction == "YES":
                     # To sell YES, we look at the bid
                     current_price = orderbook.get("yes", {}).get("bid", 0) / 100.0
@@ -320,51 +409,63 @@ class TradeExecutor:
             except Exception:
                 pass
 
-            positions.append(
-                PositionSummary(
-                    trade_id=trade.id,
-                    ticker=trade.ticker,
-                    asset=trade.asset,
-                    direction=trade.direction,
-                    strike=trade.strike,
-                    contracts=trade.filled_contracts,
-                    entry_price=trade.entry_price,
-                    current_price=current_price,
-                    unrealized_pnl=unrealized_pnl,
-                    status=trade.status,
-                    expiry_at=trade.expiry_at,
-                    opened_at=trade.opened_at,
-                )
-            )
-
-        return positions
+        return PositionSummary(
+            trade_id=trade.id,
+            ticker=trade.ticker,
+            asset=trade.asset,
+            direction=trade.direction,
+            strike=trade.strike,
+            contracts=trade.filled_contracts,
+            entry_price=trade.entry_price,
+            current_price=current_price,
+            unrealized_pnl=unrealized_pnl,
+            status=trade.status,
+            expiry_at=trade.expiry_at,
+            opened_at=trade.opened_at,
+        )
 
     async def get_trade_history(
         self,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[Trade]:
+        before: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> list[Any]:
         """
-        Get trade history.
+        Get trade history, newest first.
 
         Args:
             limit: Number of trades to return
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when ``before`` is given)
+            before: Keyset cursor ``(opened_at, id)`` of the last trade already
+                seen; only older trades are returned, without scanning skipped rows
+            columns: Trade attribute names to load; rows then come back as
+                lightweight column tuples (attribute access still works)
+                instead of full ORM entities
 
         Returns:
-            List of Trade objects
+            List of Trade objects, or rows of the requested columns
         """
-        result = await self.db.execute(
-            select(Trade)
-            .order_by(Trade.opened_at.desc())
-            .limit(limit)
-            .offset(offset)
-        )
-        return list(result.scalars().all())
+        entities = [getattr(Trade, name) for name in columns] if columns else [Trade]
+        query = select(*entities).order_by(Trade.opened_at.desc(), Trade.id.desc()).limit(limit)
+        if before is not None:
+            opened_at, trade_id = before
+            query = query.where(
+                or_(
+                    Trade.opened_at < opened_at,
+                    and_(Trade.opened_at == opened_at, Trade.id < trade_id),
+                )
+            )
+        elif offset:
+            query = query.offset(offset)
 
+        result = await self.db.execute(query)
+        return list(result.all() if columns else result.scalars().all())
+
+    @cached(ttl=PNL_CACHE_TTL, key_prefix="pnl", adaptive=False)
     async def get_pnl_summary(self, period: str = "today") -> dict:
         """
-        Get P&L summary for a period.
+        Get P&L summary for a period (cached; close_position invalidates it).
 
         Args:
             period: "today", "week", or "all"
@@ -374,35 +475,33 @@ class TradeExecutor:
         """
         from datetime import timedelta
 
+        # Aggregate in the database: one row back instead of every closed trade
+        query = select(
+            func.count(),
+            func.coalesce(func.sum(Trade.pnl), 0.0),
+            func.coalesce(func.sum(Trade.fees), 0.0),
+            func.coalesce(func.sum(case((Trade.pnl > 0, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((Trade.pnl < 0, 1), else_=0)), 0),
+        ).where(Trade.status == "CLOSED")
+
         # Build date filter
         now = datetime.utcnow()
         if period == "today":
             start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            query = query.where(Trade.closed_at >= start)
         elif period == "week":
-            start = now - timedelta(days=7)
-        else:
-            start = datetime.min
-
-        result = await self.db.execute(
-            select(Trade).where(
-                Trade.status == "CLOSED",
-                Trade.closed_at >= start,
-            )
-        )
-        trades = result.scalars().all()
+            query = query.where(Trade.closed_at >= now - timedelta(days=7))
 
-        total_pnl = sum(t.pnl or 0 for t in trades)
-        total_fees = sum(t.fees or 0 for t in trades)
-        wins = sum(1 for t in trades if (t.pnl or 0) > 0)
-        losses = sum(1 for t in trades if (t.pnl or 0) < 0)
+        result = await self.db.execute(query)
+        trade_count, total_pnl, total_fees, wins, losses = result.one()
 
         return {
             "period": period,
             "total_pnl": total_pnl,
             "total_fees": total_fees,
             "net_pnl": total_pnl,
-            "trade_count": len(trades),
+            "trade_count": trade_count,
             "wins": wins,
             "losses": losses,
-            "win_rate": wins / len(trades) if trades else 0,
+            "win_rate": wins / trade_count if trade_count else 0,
         }
@@ -7,6 +7,8 @@ def main() -> None:
         host="0.0.0.0",
         port=8000,
         reload=True,
+        loop="uvloop",  # shipped with uvicorn[standard]
+        http="httptools",
     )
 
 
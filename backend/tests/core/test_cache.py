@@ -0,0 +1,227 @@
+"""Tests for the two-tier (memory + Redis) cache decorators."""
+
+import asyncio
+import fnmatch
+from typing import Any
+
+import pytest
+
+from app.core import cache
+
+
+class FakePipeline:
+    """Queues commands and runs them against the FakeRedis on execute()."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self._commands: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args: Any) -> "FakePipeline":
+            self._commands.append((name, args))
+            return self
+        return queue
+
+    async def execute(self) -> list[Any]:
+        commands, self._commands = self._commands, []
+        return [await getattr(self._redis, name)(*args) for name, args in commands]
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for app.core.cache, with call counts."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+        self.published: list[tuple[str, Any]] = []
+        self.calls: dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    async def get(self, key: str) -> bytes | None:
+        self._count("get")
+        return self.store.get(key)
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        self._count("mget")
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, nx: bool = False, ex: int | None = None) -> bool | None:
+        self._count("set")
+        if nx and key in self.store:
+            return None
+        self.store[key] = value if isinstance(value, bytes) else str(value).encode()
+        return True
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> bool:
+        self._count("setex")
+        self.store[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def unlink(self, *keys: str) -> int:
+        return await self.delete(*keys)
+
+    async def publish(self, channel: str, message: Any) -> int:
+        self.published.append((channel, message))
+        return 0
+
+    async def scan_iter(self, match: str = "*", count: int | None = None):
+        for key in fnmatch.filter(list(self.store), match):
+            yield key
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+@pytest.fixture(autouse=True)
+def clean_cache_state():
+    """Each test starts with empty in-process tiers."""
+    for state in (cache._memory_cache, cache._inflight, cache._key_versions, cache._ttl_multipliers):
+        state.clear()
+    yield
+    for state in (cache._memory_cache, cache._inflight, cache._key_versions, cache._ttl_multipliers):
+        state.clear()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedis:
+    fake = FakeRedis()
+
+    async def get_client() -> FakeRedis:
+        return fake
+
+    monkeypatch.setattr(cache, "get_redis_client", get_client)
+    return fake
+
+
+def _counting(key_prefix: str, ttl: int = 60):
+    """A @cached function that records how often it really ran."""
+    calls: list[str] = []
+
+    @cache.cached(ttl=ttl, key_prefix=key_prefix)
+    async def fetch(asset: str) -> dict[str, Any]:
+        calls.append(asset)
+        return {"asset": asset, "value": len(calls)}
+
+    return fetch, calls
+
+
+async def test_memory_hit_skips_redis_and_function(fake_redis):
+    fetch, calls = _counting("price")
+
+    first = await fetch("BTC")
+    gets = fake_redis.calls["get"]
+    second = await fetch("BTC")
+
+    assert first == second == {"asset": "BTC", "value": 1}
+    assert calls == ["BTC"]
+    assert fake_redis.calls["get"] == gets  # served from this worker's memory tier
+
+
+async def test_redis_hit_when_memory_tier_is_cold(fake_redis):
+    fetch, calls = _counting("price")
+    await fetch("BTC")
+
+    # Another worker filled Redis; this one has nothing in memory
+    cache._memory_cache.clear()
+    result = await fetch("BTC")
+
+    assert result == {"asset": "BTC", "value": 1}
+    assert calls == ["BTC"]
+
+
+async def test_arguments_get_separate_keys(fake_redis):
+    fetch, calls = _counting("price")
+
+    assert (await fetch("BTC"))["asset"] == "BTC"
+    assert (await fetch("ETH"))["asset"] == "ETH"
+    assert calls == ["BTC", "ETH"]
+    assert len(fake_redis.store) == 2
+
+
+async def test_concurrent_misses_share_one_fetch(fake_redis):
+    release = asyncio.Event()
+    calls = 0
+
+    @cache.cached(ttl=60, key_prefix="contracts")
+    async def fetch(asset: str) -> list[str]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return [asset]
+
+    waiters = [asyncio.create_task(fetch("BTC")) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [["BTC"]] * 5
+    assert calls == 1
+    assert not cache._inflight
+
+
+async def test_failed_fetch_is_not_cached(fake_redis):
+    attempts = 0
+
+    @cache.cached(ttl=60, key_prefix="price")
+    async def fetch(asset: str) -> float:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("upstream down")
+        return 1.0
+
+    with pytest.raises(RuntimeError):
+        await fetch("BTC")
+    assert await fetch("BTC") == 1.0
+    assert attempts == 2
+
+
+async def test_memory_fallback_without_redis(monkeypatch):
+    async def no_client() -> None:
+        return None
+
+    monkeypatch.setattr(cache, "get_redis_client", no_client)
+    fetch, calls = _counting("price")
+
+    await fetch("BTC")
+    await fetch("BTC")
+
+    assert calls == ["BTC"]
+
+
+async def test_invalidate_cache_evicts_both_tiers(fake_redis):
+    pnl, pnl_calls = _counting("pnl")
+    price, price_calls = _counting("price")
+    await pnl("BTC")
+    await price("BTC")
+    assert len(fake_redis.store) == 2 and len(cache._memory_cache) == 2
+
+    await cache.invalidate_cache("pnl:*")
+
+    assert not any(key.startswith("pnl:") for key in fake_redis.store)
+    assert not any(key.startswith("pnl:") for key in cache._memory_cache)
+    assert (cache.INVALIDATION_CHANNEL, "pnl:*") in fake_redis.published
+    # Other prefixes are untouched, and the next pnl call refetches
+    await price("BTC")
+    await pnl("BTC")
+    assert price_calls == ["BTC"]
+    assert pnl_calls == ["BTC", "BTC"]
+
+
+async def test_cached_batch_fetches_only_misses(fake_redis):
+    requested: list[list[str]] = []
+
+    @cache.cached_batch(ttl=60, key_prefix="orderbook", key_fn=str)
+    async def fetch(tickers: list[str]) -> list[dict[str, str]]:
+        requested.append(list(tickers))
+        return [{"ticker": ticker} for ticker in tickers]
+
+    await fetch(["A", "B"])
+    result = await fetch(["B", "C", "A"])
+
+    assert result == [{"ticker": "B"}, {"ticker": "C"}, {"ticker": "A"}]
+    assert requested == [["A", "B"], ["C"]]
+    assert fake_redis.calls["mget"] == 2
@@ -0,0 +1,301 @@
+"""
+Tests for the vectorized price statistics against the original pandas/scipy code.
+
+The reference functions below are the pre-NumPy implementation (per-candle
+loop into a DataFrame, scipy's norm.cdf), kept verbatim in behaviour so any
+drift in the array version shows up as a mismatch.
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import norm
+
+from app.services import price_statistics
+from app.services.price_statistics import HourlyPriceStatistics, candle_arrays
+
+START = datetime(2026, 3, 2, 0, 0)  # a Monday, local time
+
+
+def _reference_hourly_stats(candles: list[Any], lookback_hours: int = 720) -> dict[str, Any]:
+    """calculate_hourly_stats before vectorization."""
+    if not candles or len(candles) < 2:
+        return HourlyPriceStatistics()._get_default_stats()
+
+    rows = []
+    for i in range(1, min(len(candles), lookback_hours)):
+        prev, curr = candles[i - 1], candles[i]
+        if isinstance(curr, dict):
+            timestamp = curr["timestamp"]
+            prev_close, curr_close = float(prev["close"]), float(curr["close"])
+            high, low, open_ = float(curr["high"]), float(curr["low"]), float(curr["open"])
+        else:
+            timestamp = datetime.fromtimestamp(curr[0] / 1000)
+            prev_close, curr_close = float(prev[4]), float(curr[4])
+            high, low, open_ = float(curr[2]), float(curr[3]), float(curr[1])
+
+        if prev_close == 0 or open_ == 0:
+            continue
+
+        rows.append({
+            "return_pct": curr_close / prev_close - 1,
+            "hour_of_day": timestamp.hour,
+            "day_of_week": timestamp.weekday(),
+            "range_pct": (high - low) / open_ if open_ > 0 else 0,
+        })
+
+    if not rows:
+        return HourlyPriceStatistics()._get_default_stats()
+
+    df = pd.DataFrame(rows)
+    returns = df["return_pct"]
+
+    def grouped(column: str, size: int) -> dict[int, dict[str, Any]]:
+        out = {}
+        for key in range(size):
+            data = returns[df[column] == key]
+            if len(data) > 0:
+                out[key] = {"mean": float(data.mean()), "std": float(data.std()), "count": len(data)}
+        return out
+
+    return {
+        "mean_return": float(returns.mean()),
+        "std_return": float(returns.std()),
+        "median_return": float(returns.median()),
+        "skewness": float(returns.skew()),
+        "kurtosis": float(returns.kurt()),
+        **{
+            f"percentile_{level}": float(returns.quantile(level / 100))
+            for level in (1, 5, 10, 25, 50, 75, 90, 95, 99)
+        },
+        "avg_hourly_range": float(df["range_pct"].mean()),
+        "max_hourly_move": float(returns.abs().max()),
+        "max_positive_move": float(returns.max()),
+        "max_negative_move": float(returns.min()),
+        "by_hour": grouped("hour_of_day", 24),
+        "by_day": grouped("day_of_week", 7),
+        "return_distribution": returns.tolist(),
+        "total_samples": len(rows),
+    }
+
+
+def _reference_extreme_moves(
+    candles: list[Any],
+    lookback_hours: int = 720,
+    thresholds: tuple[float, ...] = (0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08),
+) -> dict[str, Any]:
+    """calculate_extreme_move_probabilities before vectorization."""
+    if not candles or len(candles) < 2:
+        return HourlyPriceStatistics()._get_default_extreme_stats()
+
+    hourly_returns = []
+    for i in range(1, min(len(candles), lookback_hours)):
+        prev, curr = candles[i - 1], candles[i]
+        key = "close" if isinstance(curr, dict) else 4
+        prev_close, curr_close = float(prev[key]), float(curr[key])
+        if prev_close == 0:
+            continue
+        hourly_returns.append(abs(curr_close / prev_close - 1))
+
+    if not hourly_returns:
+        return HourlyPriceStatistics()._get_default_extreme_stats()
+
+    total_hours = len(hourly_returns)
+    extreme_probs = {}
+    for threshold in thresholds:
+        count = sum(1 for ret in hourly_returns if ret > threshold)
+        probability = count / total_hours
+        extreme_probs[f"move_{int(threshold * 100)}pct"] = {
+            "threshold": threshold,
+            "probability": float(probability),
+            "count": count,
+            "per_100_hours": float(probability * 100),
+            "per_week": float(probability * 168),
+            "per_month": float(probability * 720),
+            "odds": f"1 in {int(1/probability) if probability > 0 else 999999}",
+        }
+
+    recent = hourly_returns[-24:] if len(hourly_returns) >= 24 else hourly_returns
+    recent_vol = np.std(recent)
+    historical_vol = np.std(hourly_returns)
+    vol_multiplier = recent_vol / historical_vol if historical_vol > 0 else 1.0
+    return {
+        "extreme_probabilities": extreme_probs,
+        "total_hours_analyzed": total_hours,
+        "recent_volatility": float(recent_vol),
+        "historical_volatility": float(historical_vol),
+        "volatility_multiplier": float(vol_multiplier),
+        "regime": HourlyPriceStatistics()._classify_extreme_regime(vol_multiplier),
+    }
+
+
+def _assert_matches(actual: Any, expected: Any, path: str = "") -> None:
+    """Recursive equality with float tolerance; NaN matches NaN."""
+    if isinstance(expected, dict):
+        assert isinstance(actual, dict), path
+        assert actual.keys() == expected.keys(), path
+        for key in expected:
+            _assert_matches(actual[key], expected[key], f"{path}.{key}")
+    elif isinstance(expected, list):
+        assert isinstance(actual, list), path
+        assert len(actual) == len(expected), path
+        for i, (a, e) in enumerate(zip(actual, expected, strict=True)):
+            _assert_matches(a, e, f"{path}[{i}]")
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-12, nan_ok=True), path
+    else:
+        assert actual == expected, path
+
+
+def _closes(n: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 60_000 * np.cumprod(1 + rng.normal(0, 0.02, n))
+
+
+def _dict_candles(closes: np.ndarray, opens: np.ndarray | None = None) -> list[dict[str, Any]]:
+    opens = np.r_[closes[0], closes[:-1]] if opens is None else opens
+    return [
+        {
+            "timestamp": START + timedelta(hours=i),
+            "open": float(o),
+            "high": float(max(o, c) * 1.004),
+            "low": float(min(o, c) * 0.996),
+            "close": float(c),
+            "volume": 10.0,
+        }
+        for i, (o, c) in enumerate(zip(opens, closes, strict=True))
+    ]
+
+
+def _list_candles(closes: np.ndarray) -> list[list[Any]]:
+    return [
+        [int((c["timestamp"]).timestamp() * 1000), c["open"], c["high"], c["low"], c["close"], c["volume"]]
+        for c in _dict_candles(closes)
+    ]
+
+
+@pytest.fixture
+def stats() -> HourlyPriceStatistics:
+    return HourlyPriceStatistics()
+
+
+@pytest.mark.parametrize("make_candles", [_dict_candles, _list_candles], ids=["dict", "list"])
+@pytest.mark.parametrize("lookback", [720, 100])
+def test_hourly_stats_match_reference(stats, make_candles, lookback):
+    candles = make_candles(_closes(800))
+
+    _assert_matches(
+        stats.calculate_hourly_stats(candles, lookback_hours=lookback),
+        _reference_hourly_stats(candles, lookback_hours=lookback),
+    )
+
+
+@pytest.mark.parametrize("make_candles", [_dict_candles, _list_candles], ids=["dict", "list"])
+def test_extreme_moves_match_reference(stats, make_candles):
+    candles = make_candles(_closes(800))
+
+    _assert_matches(
+        stats.calculate_extreme_move_probabilities(candles),
+        _reference_extreme_moves(candles),
+    )
+
+
+def test_zero_opens_and_closes_are_skipped(stats):
+    closes = _closes(60)
+    opens = np.r_[closes[0], closes[:-1]]
+    closes[[5, 17]] = 0.0  # breaks the return out of, and into, these candles
+    opens[[30, 31]] = 0.0
+    candles = _dict_candles(closes, opens)
+
+    result = stats.calculate_hourly_stats(candles)
+
+    _assert_matches(result, _reference_hourly_stats(candles))
+    _assert_matches(
+        stats.calculate_extreme_move_probabilities(candles), _reference_extreme_moves(candles)
+    )
+    assert result["total_samples"] == 59 - 2 - 2
+
+
+def test_all_zero_closes_fall_back_to_defaults(stats):
+    candles = _dict_candles(np.zeros(10))
+
+    assert stats.calculate_hourly_stats(candles) == stats._get_default_stats()
+    assert stats.calculate_extreme_move_probabilities(candles) == stats._get_default_extreme_stats()
+
+
+def test_single_sample_groups_have_nan_std(stats):
+    # Five hourly returns: every hour-of-day group holds exactly one sample
+    candles = _dict_candles(_closes(6))
+
+    result = stats.calculate_hourly_stats(candles)
+
+    _assert_matches(result, _reference_hourly_stats(candles))
+    assert len(result["by_hour"]) == 5
+    for group in result["by_hour"].values():
+        assert group["count"] == 1
+        assert math.isnan(group["std"])
+    # ...while the single weekday group has a real sample std
+    assert not math.isnan(result["by_day"][0]["std"])
+
+
+@pytest.mark.parametrize("candles", [[], [{"timestamp": START, "open": 1, "high": 1, "low": 1, "close": 1}]])
+def test_short_input_returns_defaults(stats, candles):
+    assert stats.calculate_hourly_stats(candles) == stats._get_default_stats()
+    assert stats.calculate_extreme_move_probabilities(candles) == stats._get_default_extreme_stats()
+
+
+def test_extreme_move_threshold_is_strict(stats, monkeypatch):
+    # 0.25 and 0.5 are exact in binary, so these returns land exactly on them
+    thresholds = (0.25, 0.5)
+    monkeypatch.setattr(price_statistics, "_EXTREME_THRESHOLDS", np.array(thresholds))
+    closes = np.array([100.0, 125.0, 62.5, 93.75, 100.0, 150.0, 75.0])
+    candles = _dict_candles(closes)
+
+    result = stats.calculate_extreme_move_probabilities(candles)
+
+    _assert_matches(result, _reference_extreme_moves(candles, thresholds=thresholds))
+    # |returns| = .25, .5, .5, 1/15, .5, .5: a return equal to a threshold is not counted
+    assert result["extreme_probabilities"]["move_25pct"]["count"] == 4
+    assert result["extreme_probabilities"]["move_50pct"]["count"] == 0
+
+
+def test_extreme_move_counts_at_real_thresholds(stats):
+    # Returns as close to each threshold as floats allow, from both sides
+    closes = [100.0]
+    for threshold in (0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08):
+        ratio = 1 + threshold
+        for r in (np.nextafter(ratio, 0), ratio, np.nextafter(ratio, 2)):
+            closes.extend([100.0 * r, 100.0])
+    candles = _list_candles(np.array(closes))
+
+    _assert_matches(
+        stats.calculate_extreme_move_probabilities(candles), _reference_extreme_moves(candles)
+    )
+
+
+def test_candle_arrays_formats_agree():
+    closes = _closes(30)
+
+    dict_times, dict_ohlc = candle_arrays(_dict_candles(closes))
+    list_times, list_ohlc = candle_arrays(_list_candles(closes))
+
+    np.testing.assert_array_equal(dict_ohlc, list_ohlc)
+    np.testing.assert_allclose(dict_times, list_times)
+    assert dict_ohlc.shape == (30, 4)
+
+
+@pytest.mark.parametrize("target", [58_000.0, 60_000.0, 60_500.0, 66_000.0])
+def test_probability_of_move_matches_scipy(stats, target):
+    hourly = stats.calculate_hourly_stats(_dict_candles(_closes(300)))
+    z = (target / 60_000.0 - 1 - hourly["mean_return"]) / hourly["std_return"]
+
+    result = stats.get_probability_of_move(60_000.0, target, hourly)
+
+    expected = 1 - norm.cdf(z) if target > 60_000.0 else norm.cdf(z)
+    assert result["probability"] == pytest.approx(expected, rel=1e-12, abs=1e-15)
+    assert result["percentile_rank"] == pytest.approx(norm.cdf(z) * 100, rel=1e-12)
+    assert result["z_score"] == pytest.approx(z)